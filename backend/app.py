@@ -1,661 +1,222 @@
-from flask import Flask, jsonify, request
-from flask_cors import CORS
-from triangle import triangle_type
-from calendar import calculate_next_day
-from evaluation import calculate_employee_score
-from commission import calculate_sales_and_commission
-from telecom_billing import calculate_telecom_fee
-
-app = Flask(__name__)
-CORS(app)
-
-@app.route('/run-triangle-tests')
-def run_triangle_tests():
-    test_type = request.args.get('type', 'bva')
-
-    bva_cases = [
-        {'id': 'TC01', 'inputs': (1, 50, 50), 'description': '最小值', 'expected': '等腰三角形'},
-        {'id': 'TC02', 'inputs': (2, 49, 51), 'description': '略高于最小值', 'expected': '非三角形'},
-        {'id': 'TC03', 'inputs': (50, 50, 50), 'description': '正常值', 'expected': '等边三角形'},
-        {'id': 'TC04', 'inputs': (99, 50, 51), 'description': '略低于最大值', 'expected': '一般三角形'},
-        {'id': 'TC05', 'inputs': (100, 51, 51), 'description': '最大值', 'expected': '等腰三角形'},
-        {'id': 'TC06', 'inputs': (49, 1, 49), 'description': '最小值', 'expected': '等腰三角形'},
-        {'id': 'TC07', 'inputs': (51, 2.5, 50), 'description': '略高于最小值', 'expected': '一般三角形'},
-        {'id': 'TC08', 'inputs': (49, 98, 49), 'description': '略低于最大值', 'expected': '非三角形'},
-        {'id': 'TC09', 'inputs': (50, 100, 51), 'description': '最大值', 'expected': '一般三角形'},
-        {'id': 'TC10', 'inputs': (50, 50, 1), 'description': '最小值', 'expected': '等腰三角形'},
-        {'id': 'TC11', 'inputs': (48, 51, 2), 'description': '略高于最小值', 'expected': '非三角形'},
-        {'id': 'TC12', 'inputs': (50, 50, 99), 'description': '略低于最大值', 'expected': '等腰三角形'},
-        {'id': 'TC13', 'inputs': (51, 50, 100), 'description': '最大值', 'expected': '一般三角形'},
-    ]
-
-    equivalence_cases = [
-        {'id': 'D1',   'inputs': (11, 11, 11),    'description': '等边三角形', 'expected': '等边三角形'},
-        {'id': 'D21',  'inputs': (20, 20, 10),    'description': '等腰三角形', 'expected': '等腰三角形'},
-        {'id': 'D22',  'inputs': (15, 15, 32),    'description': '非三角形',   'expected': '非三角形'},
-        {'id': 'D31',  'inputs': (99, 57, 99),    'description': '等腰三角形', 'expected': '等腰三角形'},
-        {'id': 'D32',  'inputs': (7.7, 16, 7.7),  'description': '非三角形',   'expected': '非三角形'},
-        {'id': 'D41',  'inputs': (60, 35, 35),    'description': '等腰三角形', 'expected': '等腰三角形'},
-        {'id': 'D42',  'inputs': (100, 44, 44),   'description': '非三角形',   'expected': '非三角形'},
-        {'id': 'D5',   'inputs': (13, 8, 17),     'description': '一般三角形', 'expected': '一般三角形'},
-    ]
-
-    cases = bva_cases if test_type == 'bva' else equivalence_cases
-
-    results = []
-    pass_count = 0
-    for case in cases:
-        a, b, c = case['inputs']
-        actual_result = triangle_type(a, b, c)
-        if actual_result == case['expected']:
-            pass_count += 1
-        results.append({
-            "id": case['id'], "a": a, "b": b, "c": c,
-            "description": case['description'], "expected": case['expected'],
-            "output_type": actual_result
-        })
-    total_count = len(cases)
-    return jsonify({
-        "results": results,
-        "summary": { "passCount": pass_count, "totalCount": total_count, "passRate": round((pass_count / total_count) * 100 if total_count > 0 else 0, 2) }
-    })
-
-@app.route('/run-triangle-custom', methods=['POST'])
-def run_triangle_custom():
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': '无效的请求体'}), 400
-    try:
-        a = float(data.get('a', 0))
-        b = float(data.get('b', 0))
-        c = float(data.get('c', 0))
-    except (ValueError, TypeError):
-        return jsonify({'error': '输入必须是数字'}), 400
-    result = triangle_type(a, b, c)
-    return jsonify({ 'a': a, 'b': b, 'c': c, 'output_type': result })
+import hmac
+import os
+import time
+from functools import cached_property, wraps
 
-@app.route('/run-calendar-tests')
-def run_calendar_tests():
-    test_type = request.args.get('type', 'bva')
-
-    bva_cases = [
-        {'id': 'T1', 'inputs': (1800, 6, 15), 'description': '最小值(年)', 'expected': '1800.6.16'},
-        {'id': 'T2', 'inputs': (1801, 7, 12), 'description': '略高于最小值(年)', 'expected': '1801.7.13'},
-        {'id': 'T3', 'inputs': (2000, 5, 15), 'description': '正常值', 'expected': '2000.5.16'},
-        {'id': 'T4', 'inputs': (2198, 6, 14), 'description': '略低于最大值(年)', 'expected': '2198.6.15'},
-        {'id': 'T5', 'inputs': (2200, 6, 17), 'description': '最大值(年)', 'expected': '2200.6.18'},
-        {'id': 'T6', 'inputs': (2004, 1, 20), 'description': '最小值(月)', 'expected': '2004.1.21'},
-        {'id': 'T7', 'inputs': (2003, 2, 19), 'description': '略高于最小值(月)', 'expected': '2003.2.20'},
-        {'id': 'T8', 'inputs': (1998, 11, 13), 'description': '略低于最大值(月)', 'expected': '1998.11.14'},
-        {'id': 'T9', 'inputs': (2001, 12, 16), 'description': '最大值(月)', 'expected': '2001.12.17'},
-        {'id': 'T10', 'inputs': (1997, 4, 1), 'description': '最小值(日)', 'expected': '1997.4.2'},
-        {'id': 'T11', 'inputs': (1999, 5, 2), 'description': '略高于最小值(日)', 'expected': '1999.5.3'},
-        {'id': 'T12', 'inputs': (2002, 4, 30), 'description': '略低于最大值(日)', 'expected': '2002.5.1'},
-        {'id': 'T13', 'inputs': (2004, 6, 31), 'description': '最大值(日)', 'expected': '无效日期'},
-        {'id': 'T14', 'inputs': (1798, 5, 15), 'description': '略低于最小值(年)', 'expected': '无效日期'},
-        {'id': 'T15', 'inputs': (2204, 6, 20), 'description': '略高于最大值(年)', 'expected': '无效日期'},
-        {'id': 'T16', 'inputs': (1990, -1, 21), 'description': '略低于最小值(月)', 'expected': '无效日期'},
-        {'id': 'T17', 'inputs': (1992, 13, 12), 'description': '略高于最大值(月)', 'expected': '无效日期'},
-        {'id': 'T18', 'inputs': (1983, 12, 0), 'description': '略低于最小值(日)', 'expected': '无效日期'},
-        {'id': 'T19', 'inputs': (2004, 4, 33), 'description': '略高于最大值(日)', 'expected': '无效日期'},
-    ]
-
-    equivalence_cases = [
-        {'id': 'R1', 'inputs': (2000, 2, 15), 'description': '世纪闰年 2 月月中 （Y1, M1, D1）', 'expected': '2000.2.16'},
-        {'id': 'R2', 'inputs': (2000, 2, 29), 'description': '世纪闰年 2 月月末 （Y1, M1, D3）', 'expected': '2000.3.1'},
-        {'id': 'R3', 'inputs': (2000, 2, 30), 'description': '世纪闰年 2 月非法日 （Y1, M1, D4）', 'expected': '无效日期'},
-        {'id': 'R4', 'inputs': (2001, 2, 15), 'description': '普通年 2 月月中 （Y3, M1, D1）', 'expected': '2001.2.16'},
-        {'id': 'R5', 'inputs': (2001, 2, 28), 'description': '普通年 2 月月末 （Y3, M1, D2）', 'expected': '2001.3.1'},
-        {'id': 'R6', 'inputs': (2001, 2, 29), 'description': '普通年 2 月非法日 （Y3, M1, D3）', 'expected': '无效日期'},
-        {'id': 'R7', 'inputs': (2001, 3, 15), 'description': '大月月中 （Y3, M3, D1）', 'expected': '2001.3.16'},
-        {'id': 'R8', 'inputs': (2001, 12, 31), 'description': '12 月月末 （Y3, M2, D5）', 'expected': '2002.1.1'},
-        {'id': 'R9', 'inputs': (2001, 3, 31), 'description': '其它大月月末 （Y3, M3, D5）', 'expected': '2001.4.1'},
-        {'id': 'R10', 'inputs': (2001, 4, 15), 'description': '小月月中 （Y3, M4, D1）', 'expected': '2001.4.16'},
-        {'id': 'R11', 'inputs': (2001, 4, 30), 'description': '小月月末 （Y3, M4, D4）', 'expected': '2001.5.1'},
-        {'id': 'R12', 'inputs': (2001, 4, 31), 'description': '小月非法日 （Y3, M4, D5）', 'expected': '无效日期'},
-        {'id': 'R13', 'inputs': (1799, 4, 29), 'description': '年低于最小值', 'expected': '无效日期'},
-        {'id': 'R14', 'inputs': (2201, 4, 29), 'description': '年高于最大值', 'expected': '无效日期'},
-        {'id': 'R15', 'inputs': (2000, 0, 29), 'description': '月低于最小值', 'expected': '无效日期'},
-        {'id': 'R16', 'inputs': (2000, 13, 29), 'description': '月高于最大值', 'expected': '无效日期'},
-        {'id': 'R17', 'inputs': (2001, 4, 0), 'description': '日低于最小值', 'expected': '无效日期'},
-        {'id': 'R18', 'inputs': (2001, 4, 32), 'description': '日高于最大值', 'expected': '无效日期'},
-    ]
+from flask import Blueprint, Flask, Response, current_app, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from flask_cors import CORS
+from werkzeug.utils import import_string
 
-    cases = bva_cases if test_type == 'bva' else equivalence_cases
-    results = []
-    pass_count = 0
-    for case in cases:
-        year, month, day = case['inputs']
-        actual_result = calculate_next_day(year, month, day)
-        if actual_result == case['expected']:
-            pass_count += 1
-        results.append({
-            "id": case['id'], "year": year, "month": month, "day": day,
-            "description": case['description'], "expected": case['expected'],
-            "output_type": actual_result
-        })
-    
-    total_count = len(cases)
-    return jsonify({
-        "results": results,
-        "summary": { "passCount": pass_count, "totalCount": total_count, "passRate": round((pass_count / total_count) * 100 if total_count > 0 else 0, 2) }
-    })
+from metrics import PROMETHEUS_MIMETYPE, ROUTE_ENVIRON_KEY, MetricsMiddleware, encode_timer, request_metrics
+from profiling import (
+    DEFAULT_SAMPLE_INTERVAL, PROFILE_ENVIRON_KEY, PROFILE_MODES, SAMPLE_MODE, ProfileStore, make_profiler,
+)
 
-@app.route('/run-calendar-custom', methods=['POST'])
-def run_calendar_custom():
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': '无效的请求体'}), 400
-    try:
-        year = int(data.get('year', 0))
-        month = int(data.get('month', 0))
-        day = int(data.get('day', 0))
-    except (ValueError, TypeError):
-        return jsonify({'error': '输入必须是整数'}), 400
-    
-    result = calculate_next_day(year, month, day)
-    return jsonify({ 'year': year, 'month': month, 'day': day, 'output_type': result })
+# Operational routes (metrics, profiles) are cheap and defined here; every other
+# area is a blueprint of lazily imported views, see LAZY_ROUTES below
+api = Blueprint('api', __name__)
 
 # ====================================================================
-# Telecom Billing Endpoints
+# Request Metrics
 # ====================================================================
 
-def get_telecom_test_cases(test_type='bva'):
-    """
-    Provides test cases for Telecom Billing based on the test type.
-    """
-    # Test cases for Boundary Value Analysis
-    bva_cases = [
-        {'id': '1', 'inputs': (0, 4), 'description': '通话分钟为0', 'expected': 25.00},
-        {'id': '2', 'inputs': (1, 3), 'description': '通话分钟为1, 欠费超额', 'expected': 25.15},
-        {'id': '3', 'inputs': (200, 3), 'description': '中间档位, 满足折扣', 'expected': 54.25},
-        {'id': '4', 'inputs': (499, 4), 'description': '高档位, 满足折扣', 'expected': 97.60},
-        {'id': '5', 'inputs': (500, 3), 'description': '高档位, 满足折扣', 'expected': 97.75},
-        {'id': '6', 'inputs': (200, 0), 'description': '中间档位, 0次欠费', 'expected': 54.25},
-        {'id': '7', 'inputs': (250, 1), 'description': '中间档位, 满足折扣', 'expected': 61.56},
-        {'id': '8', 'inputs': (300, 9), 'description': '中间档位边界, 欠费超额', 'expected': 70.00},
-        {'id': '9', 'inputs': (100, 10), 'description': '低档位, 欠费超额', 'expected': 40.00},
-    ]
-
-    # Test cases for Equivalence Class Partitioning
-    equivalence_cases = [
-        {'id': '1', 'inputs': (10, 0), 'description': '覆盖等价类: A1, B1', 'expected': 26.49},
-        {'id': '2', 'inputs': (20, 2), 'description': '覆盖等价类: A1, B2', 'expected': 28.00},
-        {'id': '3', 'inputs': (1, 3), 'description': '覆盖等价类: A1, B3', 'expected': 25.15},
-        {'id': '4', 'inputs': (20, 4), 'description': '覆盖等价类: A1, B4', 'expected': 28.00},
-        {'id': '5', 'inputs': (20, 8), 'description': '覆盖等价类: A1, B5', 'expected': 28.00},
-        {'id': '6', 'inputs': (80, 1), 'description': '覆盖等价类: A2, B1', 'expected': 36.82},
-        {'id': '7', 'inputs': (120, 2), 'description': '覆盖等价类: A2, B2', 'expected': 42.73},
-        {'id': '8', 'inputs': (100, 3), 'description': '覆盖等价类: A2, B3', 'expected': 40.00},
-        {'id': '9', 'inputs': (100, 4), 'description': '覆盖等价类: A2, B4', 'expected': 40.00},
-        {'id': '10', 'inputs': (100, 10), 'description': '覆盖等价类: A2, B5', 'expected': 40.00},
-        {'id': '11', 'inputs': (150, 0), 'description': '覆盖等价类: A3, B1', 'expected': 47.05},
-        {'id': '12', 'inputs': (150, 2), 'description': '覆盖等价类: A3, B2', 'expected': 47.05},
-        {'id': '13', 'inputs': (150, 3), 'description': '覆盖等价类: A3, B3', 'expected': 47.05},
-        {'id': '14', 'inputs': (150, 4), 'description': '覆盖等价类: A3, B4', 'expected': 47.50},
-        {'id': '15', 'inputs': (150, 10), 'description': '覆盖等价类: A3, B5', 'expected': 47.50},
-        {'id': '16', 'inputs': (200, 0), 'description': '覆盖等价类: A4, B1', 'expected': 54.25},
-        {'id': '17', 'inputs': (200, 2), 'description': '覆盖等价类: A4, B2', 'expected': 54.25},
-        {'id': '18', 'inputs': (200, 3), 'description': '覆盖等价类: A4, B3', 'expected': 54.25},
-        {'id': '19', 'inputs': (300, 5), 'description': '覆盖等价类: A4, B4', 'expected': 70.00},
-        {'id': '20', 'inputs': (300, 9), 'description': '覆盖等价类: A4, B5', 'expected': 70.00},
-        {'id': '21', 'inputs': (500, 1), 'description': '覆盖等价类: A5, B1', 'expected': 97.75},
-        {'id': '22', 'inputs': (500, 2), 'description': '覆盖等价类: A5, B2', 'expected': 97.75},
-        {'id': '23', 'inputs': (500, 3), 'description': '覆盖等价类: A5, B3', 'expected': 97.75},
-        {'id': '24', 'inputs': (499, 4), 'description': '覆盖等价类: A5, B4', 'expected': 97.60},
-        {'id': '25', 'inputs': (500, 10), 'description': '覆盖等价类: A5, B5', 'expected': 100.00},
-    ]
+# Set METRICS_ENABLED=0 to build the app without the metrics middleware
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') != '0'
 
-    # Test cases for Decision Table
-    decision_table_cases = [
-        {'id': '1', 'inputs': (30, 1), 'description': '0<t≤60, 欠费在允许范围内', 'expected': 29.46},
-        {'id': '2', 'inputs': (30, 2), 'description': '0<t≤60, 欠费超出允许范围', 'expected': 29.50},
-        {'id': '3', 'inputs': (90, 2), 'description': '60<t≤120, 欠费在允许范围内', 'expected': 38.30},
-        {'id': '4', 'inputs': (90, 3), 'description': '60<t≤120, 欠费超出允许范围', 'expected': 38.50},
-        {'id': '5', 'inputs': (150, 3), 'description': '120<t≤180, 欠费在允许范围内', 'expected': 47.05},
-        {'id': '6', 'inputs': (150, 4), 'description': '120<t≤180, 欠费超出允许范围', 'expected': 47.50},
-        {'id': '7', 'inputs': (210, 3), 'description': '180<t≤300, 欠费在允许范围内', 'expected': 55.71},
-        {'id': '8', 'inputs': (210, 4), 'description': '180<t≤300, 欠费超出允许范围', 'expected': 56.50},
-        {'id': '9', 'inputs': (350, 6), 'description': 't>300, 欠费在允许范围内', 'expected': 75.93},
-        {'id': '10', 'inputs': (350, 10), 'description': 't>300, 欠费超出允许范围', 'expected': 77.50},
-    ]
+class TimedJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider with jsonify() encoding counted as the encode phase."""
+    def dumps(self, obj, **kwargs):
+        with encode_timer():
+            return super().dumps(obj, **kwargs)
 
-    if test_type == 'bva':
-        return bva_cases
-    elif test_type == 'equivalence':
-        return equivalence_cases
-    elif test_type == 'decision':
-        return decision_table_cases
-    return []
+def _record_route():
+    # Flask drops the request object from the environ before the middleware finishes
+    if request.url_rule is not None:
+        request.environ[ROUTE_ENVIRON_KEY] = request.url_rule.rule
 
-@app.route('/run-telecom-tests')
-def run_telecom_tests():
-    test_type = request.args.get('type', 'bva')
-    cases = get_telecom_test_cases(test_type)
+@api.route('/metrics')
+def get_metrics():
+    return Response(request_metrics.render(), content_type=PROMETHEUS_MIMETYPE)
 
-    results = []
-    pass_count = 0
-    for case in cases:
-        call_minutes, late_payments = case['inputs']
-        
-        # Adjust expected value for error cases for direct comparison
-        expected = case['expected']
-        
-        response = calculate_telecom_fee(call_minutes, late_payments)
-        
-        actual_result = None
-        if response['status'] == 'success':
-            actual_result = response['total_fee']
-        elif '非' in response.get('message', ''): # Catches "非法输入"
-            actual_result = '非法输入'
-
-        # Round expected value if it's a number for consistent comparison
-        passed = False
-        if isinstance(expected, (int, float)) and actual_result is not None and isinstance(actual_result, (int, float)):
-            if abs(actual_result - expected) < 0.015:
-                passed = True
-                pass_count += 1
-        elif actual_result == expected:
-            passed = True
-            pass_count += 1
-            
-        results.append({
-            "id": case['id'],
-            "call_minutes": call_minutes,
-            "late_payments": late_payments,
-            "description": case.get('description', ''),
-            "expected": expected,
-            "output_fee": actual_result if actual_result is not None else response.get('message'),
-            "passed": passed
-        })
+# ====================================================================
+# Request Profiling
+# ====================================================================
 
-    total_count = len(cases)
-    summary = {
-        "passCount": pass_count,
-        "totalCount": total_count,
-        "passRate": round((pass_count / total_count) * 100 if total_count > 0 else 0, 2)
-    }
-    return jsonify({"results": results, "summary": summary})
+# Profiling is available only when PROFILE_ADMIN_TOKEN is set; without it no view is wrapped
+PROFILE_ADMIN_TOKEN = os.environ.get('PROFILE_ADMIN_TOKEN')
+PROFILE_SAMPLE_INTERVAL = float(os.environ.get('PROFILE_SAMPLE_INTERVAL', DEFAULT_SAMPLE_INTERVAL))
+# Endpoints that are never profiled themselves
+UNPROFILED_ENDPOINTS = ('api.get_metrics', 'api.list_profiles', 'api.get_profile')
 
-@app.route('/run-telecom-custom', methods=['POST'])
-def run_telecom_custom():
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': '无效的请求体'}), 400
+profile_store = ProfileStore()
 
-    try:
-        call_minutes = data.get('call_minutes')
-        late_payments = data.get('late_payments')
-        
-        # Ensure values are integers before passing to the calculation function
-        if call_minutes is None or late_payments is None:
-             return jsonify({'error': '请提供通话分钟和欠费次数'}), 400
-        
-        call_minutes = int(call_minutes)
-        late_payments = int(late_payments)
+def is_admin_request():
+    token = request.headers.get('X-Admin-Token')
+    return bool(PROFILE_ADMIN_TOKEN) and token is not None and hmac.compare_digest(token, PROFILE_ADMIN_TOKEN)
 
-    except (ValueError, TypeError):
-        return jsonify({'error': '输入必须是有效的整数'}), 400
+def requested_profile_mode():
+    """Returns the profiler mode asked for by the X-Profile header or ?profile=, or None."""
+    flag = request.headers.get('X-Profile') or request.args.get('profile')
+    if not flag or flag == '0':
+        return None
+    return SAMPLE_MODE if flag == '1' else flag
 
-    response = calculate_telecom_fee(call_minutes, late_payments)
-    
-    if response['status'] == 'success':
-        return jsonify({
-            'call_minutes': call_minutes,
-            'late_payments': late_payments,
-            'output_fee': response['total_fee'],
-            'message': response.get('message', '计算成功')
-        })
-    else:
-        return jsonify({
-            'call_minutes': call_minutes,
-            'late_payments': late_payments,
-            'output_fee': response.get('message', '计算出错'),
-            'error': True
-        })
+def profiled_view(view):
+    """
+    Wraps a view so an admin request with a profile flag runs it under the
+    requested profiler. The collapsed stacks are kept in profile_store and the
+    response carries their id in X-Profile-Id. Only the view itself is
+    profiled: the body of a streamed response (?stream=1) is produced later.
+    """
+    @wraps(view)
+    def wrapper(**kwargs):
+        mode = requested_profile_mode()
+        if mode is None:
+            return view(**kwargs)
+        if not is_admin_request():
+            return jsonify({'error': '仅管理员可以开启性能剖析'}), 403
+        if mode not in PROFILE_MODES:
+            return jsonify({'error': f"profile 必须是 1、{' 或 '.join(PROFILE_MODES)}"}), 400
+        request.environ[PROFILE_ENVIRON_KEY] = mode
+        profiler = make_profiler(mode, PROFILE_SAMPLE_INTERVAL)
+        started_at = time.perf_counter()
+        with profiler:
+            response = current_app.make_response(view(**kwargs))
+        profile_id = profile_store.add(request.url_rule.rule, mode, time.perf_counter() - started_at, profiler.stacks)
+        response.headers['X-Profile-Id'] = profile_id
+        return response
+    return wrapper
+
+@api.route('/api/profiles', methods=['GET'])
+def list_profiles():
+    if not is_admin_request():
+        return jsonify({'error': '仅管理员可以查看性能剖析结果'}), 403
+    return jsonify(profile_store.list())
+
+@api.route('/api/profiles/<profile_id>', methods=['GET'])
+def get_profile(profile_id):
+    """Serves a stored profile as collapsed-stack text, ready for flamegraph.pl or speedscope."""
+    if not is_admin_request():
+        return jsonify({'error': '仅管理员可以查看性能剖析结果'}), 403
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        return jsonify({'error': '剖析结果不存在'}), 404
+    return Response(profile['collapsed'], mimetype='text/plain')
 
 # ====================================================================
-# Sales Evaluation Endpoints
+# Lazily Loaded Views
 # ====================================================================
 
-def get_evaluation_bva_test_cases():
+class LazyView:
     """
-    Defines Boundary Value Analysis test cases for the employee evaluation.
-    The inputs and descriptions are from the user, with expected values
-    recalculated based on the agreed-upon formula to ensure test validity.
+    Stands in for a view function given by its import path and imports it on
+    the first request, so a view module (and the business module, numpy,
+    asyncio or subprocess behind it) is only loaded once its area is used.
     """
-    test_cases = [
-        # Columns: id, work_hours, leaves, level, sales -> expected_score, description
-        {'id': 'T1',  'work_hours': 0,  'leaves': 15, 'level': 3, 'sales': 150, 'expected': 1, 'description': '最小值'},
-        {'id': 'T2',  'work_hours': 1,  'leaves': 12, 'level': 3, 'sales': 200, 'expected': 1, 'description': '略大于最小值'},
-        {'id': 'T3',  'work_hours': 5,  'leaves': 14, 'level': 3, 'sales': 250, 'expected': 1, 'description': '正常值'},
-        {'id': 'T4',  'work_hours': 33, 'leaves': 12, 'level': 3, 'sales': 250, 'expected': 2, 'description': '略小于最大值'},
-        {'id': 'T5',  'work_hours': 35, 'leaves': 12, 'level': 3, 'sales': 300, 'expected': 3, 'description': '最大值'},
-        {'id': 'T6',  'work_hours': 10, 'leaves': 0,  'level': 3, 'sales': 321, 'expected': 3, 'description': '最小值'},
-        {'id': 'T7',  'work_hours': 20, 'leaves': 2,  'level': 3, 'sales': 278, 'expected': 3, 'description': '略大于最小值'},
-        {'id': 'T8',  'work_hours': 18, 'leaves': 18, 'level': 3, 'sales': 199, 'expected': 1, 'description': '略小于最大值'},
-        {'id': 'T9',  'work_hours': 16, 'leaves': 19, 'level': 3, 'sales': 322, 'expected': 1, 'description': '最大值'},
-        {'id': 'T10', 'work_hours': 21, 'leaves': 7,  'level': 1, 'sales': 310, 'expected': 5, 'description': '最小值'},
-        {'id': 'T11', 'work_hours': 17, 'leaves': 8,  'level': 2, 'sales': 270, 'expected': 2, 'description': '略大于最小值'},
-        {'id': 'T12', 'work_hours': 22, 'leaves': 9,  'level': 4, 'sales': 255, 'expected': 3, 'description': '略小于最大值'},
-        {'id': 'T13', 'work_hours': 21, 'leaves': 12, 'level': 5, 'sales': 186, 'expected': 1, 'description': '最大值'},
-        {'id': 'T14', 'work_hours': 15, 'leaves': 10, 'level': 3, 'sales': 10,  'expected': 1, 'description': '最小值'},
-        {'id': 'T15', 'work_hours': 13, 'leaves': 11, 'level': 3, 'sales': 15,  'expected': 1, 'description': '略大于最小值'},
-        {'id': 'T16', 'work_hours': 21, 'leaves': 8,  'level': 3, 'sales': 480, 'expected': 5, 'description': '略小于最大值'},
-        {'id': 'T17', 'work_hours': 20, 'leaves': 13, 'level': 3, 'sales': 500, 'expected': 5, 'description': '最大值'},
-    ]
-    return test_cases
-
-@app.route('/run-evaluation-tests', methods=['GET'])
-def run_evaluation_tests():
-    # Only BVA (Boundary Value Analysis) is supported for now
-    test_cases = get_evaluation_bva_test_cases()
-    results = []
-    pass_count = 0
-    
-    for case in test_cases:
-        actual_score = calculate_employee_score(
-            sales=case['sales'],
-            work_hours=case['work_hours'],
-            leaves=case['leaves'],
-            level=case['level']
-        )
-        passed = actual_score == case['expected']
-        if passed:
-            pass_count += 1
-        
-        results.append({
-            'id': case['id'],
-            'sales': case['sales'],
-            'work_hours': case['work_hours'],
-            'leaves': case['leaves'],
-            'level': case['level'],
-            'expected': case['expected'],
-            'output_score': actual_score,
-            'description': case.get('description', '')
-        })
-        
-    summary = {
-        'totalCount': len(test_cases),
-        'passCount': pass_count,
-    }
-    
-    return jsonify({'summary': summary, 'results': results})
-
-@app.route('/run-evaluation-custom', methods=['POST'])
-def run_evaluation_custom():
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "Invalid input"}), 400
-        
-    sales = data.get('sales', 0)
-    work_hours = data.get('work_hours', 0)
-    leaves = data.get('leaves', 0)
-    level = data.get('level', 0)
-    
-    try:
-        if not all(isinstance(val, (int, float)) for val in [sales, work_hours, leaves, level]):
-             return jsonify({"error": "Inputs must be numeric"}), 400
-        
-        actual_score = calculate_employee_score(sales, work_hours, leaves, level)
-        
-        return jsonify({
-            'sales': sales,
-            'work_hours': work_hours,
-            'leaves': leaves,
-            'level': level,
-            'output_score': actual_score
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    def __init__(self, import_name):
+        self.__module__, self.__name__ = import_name.rsplit('.', 1)
+        self.import_name = import_name
+
+    @cached_property
+    def view(self):
+        return import_string(self.import_name)
+
+    def __call__(self, *args, **kwargs):
+        return self.view(*args, **kwargs)
+
+# (blueprint name, view module, ((rule, view function, methods), ...))
+LAZY_ROUTES = (
+    ('runner', 'view_helpers', (
+        ('/api/runner-cache', 'get_runner_cache_stats', ['GET']),
+    )),
+    ('triangle', 'triangle_views', (
+        ('/run-triangle-tests', 'run_triangle_tests', ['GET']),
+        ('/run-triangle-custom', 'run_triangle_custom', ['POST']),
+        ('/run-triangle-custom-bulk', 'run_triangle_custom_bulk', ['POST']),
+    )),
+    ('calendar', 'calendar_views', (
+        ('/run-calendar-tests', 'run_calendar_tests', ['GET']),
+        ('/run-calendar-custom', 'run_calendar_custom', ['POST']),
+        ('/run-calendar-custom-bulk', 'run_calendar_custom_bulk', ['POST']),
+    )),
+    ('telecom', 'telecom_views', (
+        ('/run-telecom-tests', 'run_telecom_tests', ['GET']),
+        ('/run-telecom-custom', 'run_telecom_custom', ['POST']),
+        ('/run-telecom-custom-bulk', 'run_telecom_custom_bulk', ['POST']),
+    )),
+    ('evaluation', 'evaluation_views', (
+        ('/run-evaluation-tests', 'run_evaluation_tests', ['GET']),
+        ('/run-evaluation-custom', 'run_evaluation_custom', ['POST']),
+        ('/run-evaluation-custom-bulk', 'run_evaluation_custom_bulk', ['POST']),
+    )),
+    ('commission', 'commission_views', (
+        ('/run-commission-tests', 'run_commission_tests', ['GET']),
+        ('/run-commission-custom', 'run_commission_custom', ['POST']),
+        ('/run-commission-custom-bulk', 'run_commission_custom_bulk', ['POST']),
+    )),
+    ('system_tests', 'system_test_views', (
+        ('/api/system-test-runs', 'create_system_test_run', ['POST']),
+        ('/api/system-test-runs/<run_id>', 'get_system_test_run', ['GET']),
+        ('/api/system-test-runs/<run_id>', 'cancel_system_test_run', ['DELETE']),
+        ('/api/run-system-tests', 'run_system_tests', ['GET']),
+        ('/api/run-unit-tests', 'run_unit_tests', ['GET']),
+    )),
+    ('forum', 'forum_views', (
+        ('/api/run-forum-tests', 'run_forum_tests', ['GET']),
+        ('/api/run-forum-load-test', 'run_forum_load_test', ['GET']),
+    )),
+)
+
+def lazy_blueprint(name, module, routes):
+    blueprint = Blueprint(name, __name__)
+    for rule, function, methods in routes:
+        blueprint.add_url_rule(rule, view_func=LazyView(f'{module}.{function}'), methods=methods)
+    return blueprint
+
+lazy_blueprints = [lazy_blueprint(*entry) for entry in LAZY_ROUTES]
 
 # ====================================================================
-# Commission Calculation Endpoints
+# Application Factory
 # ====================================================================
 
-def get_commission_bva_test_cases():
-    """Defines Boundary Value Analysis test cases for the commission calculation."""
-    test_cases = [
-        # Test cases based on user-provided table
-        {'id': '1', 'inputs': (1, 40, 45), 'expected_sales': 3250.0, 'expected_commission': 650.0, 'description': '主机销量: 1'},
-        {'id': '2', 'inputs': (2, 40, 45), 'expected_sales': 3275.0, 'expected_commission': 655.0, 'description': '主机销量: 2'},
-        {'id': '3', 'inputs': (35, 40, 45), 'expected_sales': 4100.0, 'expected_commission': 820.0, 'description': '主机/显示器/外设: 正常值'},
-        {'id': '4', 'inputs': (69, 40, 45), 'expected_sales': 4950.0, 'expected_commission': 990.0, 'description': '主机销量: 69 (上限-1)'},
-        {'id': '5', 'inputs': (70, 40, 45), 'expected_sales': 4975.0, 'expected_commission': 995.0, 'description': '主机销量: 70 (上限)'},
-        {'id': '6', 'inputs': (35, 1, 45), 'expected_sales': 2930.0, 'expected_commission': 586.0, 'description': '显示器销量: 1'},
-        {'id': '7', 'inputs': (35, 2, 45), 'expected_sales': 2960.0, 'expected_commission': 592.0, 'description': '显示器销量: 2'},
-        {'id': '8', 'inputs': (35, 79, 45), 'expected_sales': 5270.0, 'expected_commission': 1054.0, 'description': '显示器销量: 79 (上限-1)'},
-        {'id': '9', 'inputs': (35, 80, 45), 'expected_sales': 5300.0, 'expected_commission': 1060.0, 'description': '显示器销量: 80 (上限)'},
-        {'id': '10', 'inputs': (35, 40, 1), 'expected_sales': 2120.0, 'expected_commission': 424.0, 'description': '外设销量: 1'},
-        {'id': '11', 'inputs': (35, 40, 2), 'expected_sales': 2165.0, 'expected_commission': 433.0, 'description': '外设销量: 2'},
-        {'id': '12', 'inputs': (35, 40, 89), 'expected_sales': 6080.0, 'expected_commission': 1216.0, 'description': '外设销量: 89 (上限-1)'},
-        {'id': '13', 'inputs': (35, 40, 90), 'expected_sales': 6125.0, 'expected_commission': 1225.0, 'description': '外设销量: 90 (上限)'},
-    ]
-    # Add a few error cases to ensure validation still works
-    test_cases.extend([
-        {'id': '14', 'inputs': (0, 10, 10), 'expected_status': 'error', 'description': '主机销量为0 (不满足最低要求)'},
-        {'id': '15', 'inputs': (71, 10, 10), 'expected_status': 'error', 'description': '主机销量超过上限'},
-        {'id': '16', 'inputs': (10, 81, 10), 'expected_status': 'error', 'description': '显示器销量超过上限'},
-        {'id': '17', 'inputs': (10, 10, 91), 'expected_status': 'error', 'description': '外设销量超过上限'},
-    ])
-    return test_cases
-
-@app.route('/run-commission-tests', methods=['GET'])
-def run_commission_tests():
-    test_cases = get_commission_bva_test_cases()
-    results = []
-    pass_count = 0
-    
-    for case in test_cases:
-        hosts, monitors, peripherals = case['inputs']
-        result_data = calculate_sales_and_commission(hosts, monitors, peripherals)
-        
-        passed = False
-        if result_data['status'] == 'error':
-            passed = case.get('expected_status') == 'error'
-        else: # success case
-            if 'expected_sales' in case and 'expected_commission' in case:
-                sales_match = result_data['sales'] == case['expected_sales']
-                commission_match = result_data['commission'] == case['expected_commission']
-                passed = sales_match and commission_match
-
-        if passed:
-            pass_count += 1
-        
-        results.append({
-            'id': case['id'],
-            'hosts_sold': hosts,
-            'monitors_sold': monitors,
-            'peripherals_sold': peripherals,
-            'expected_status': case.get('expected_status', 'success'),
-            'expected_sales': case.get('expected_sales'),
-            'expected_commission': case.get('expected_commission'),
-            'output_status': result_data['status'],
-            'output_sales': result_data.get('sales', 0),
-            'output_commission': result_data.get('commission', 0),
-            'output_message': result_data.get('message', ''),
-            'description': case.get('description', ''),
-            'passed': passed
-        })
-        
-    summary = {
-        'totalCount': len(test_cases),
-        'passCount': pass_count,
-    }
-    
-    return jsonify({'summary': summary, 'results': results})
-
-
-@app.route('/run-commission-custom', methods=['POST'])
-def run_commission_custom():
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "Invalid input"}), 400
-        
-    try:
-        hosts = int(data.get('hosts', 0))
-        monitors = int(data.get('monitors', 0))
-        peripherals = int(data.get('peripherals', 0))
-    except (ValueError, TypeError):
-        return jsonify({"error": "Inputs must be integers"}), 400
-
-    result_data = calculate_sales_and_commission(hosts, monitors, peripherals)
-    
-    # Add original inputs to the response for clarity
-    result_data['hosts_sold'] = hosts
-    result_data['monitors_sold'] = monitors
-    result_data['peripherals_sold'] = peripherals
-
-    if result_data['status'] == 'error':
-         return jsonify(result_data), 400 # Return 400 on logical error
-    
-    return jsonify(result_data)
-
-@app.route('/api/run-system-tests', methods=['GET'])
-def run_system_tests():
-    import subprocess, os, re
-    systest_dir = os.path.join(os.path.dirname(__file__), 'systemtest')
-    log_path = os.path.join(systest_dir, 'result.log')
-    try:
-        # 执行 pytest 并输出到 result.log
-        subprocess.run(
-            ['pytest', '--tb=short', '-v', '>', 'result.log'],
-            cwd=systest_dir,
-            shell=True,
-            check=False
-        )
-        # 读取日志内容
-        with open(log_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-        # 解析每个测试用例的结果
-        # 匹配类似 test_002_login.py::Test002::test_002 PASSED [100%]
-        pattern = re.compile(r'^(\S+\.py)::(\S+)\s+(PASSED|FAILED|SKIPPED|ERROR)\s+\[.*\]$', re.MULTILINE)
-        results = []
-        for match in pattern.finditer(log_content):
-            results.append({
-                'file': match.group(1),
-                'case': match.group(2),
-                'result': match.group(3)
-            })
-        return jsonify({'log': log_content, 'cases': results})
-    except Exception as e:
-        return jsonify({'error': str(e), 'log': '', 'cases': []}), 500
-
-@app.route('/api/run-unit-tests', methods=['GET'])
-def run_unit_tests():
-    # TODO: Implement unit testing logic
-    return jsonify({'message': 'Unit tests not implemented yet.'})
-
-@app.route('/api/run-forum-tests', methods=['GET'])
-def run_forum_tests():
-    return jsonify({
-        "test_info": {
-            "test_time": "2025-06-19 21:06:29",
-            "base_url": "http://localhost:7010",
-            "total_tests": 5,
-            "passed_tests": 5,
-            "failed_tests": 0,
-            "success_rate": "100%"
-        },
-        "test_results": {
-            "ArticleController_getList": {
-                "input_data": {
-                    "currentPage": 1,
-                    "pageSize": 10,
-                    "title": "",
-                    "labelId": None
-                },
-                "result": {
-                    "status": "passed",
-                    "http_code": "200",
-                    "status_message": "请求成功",
-                    "response_time": "0.110170",
-                    "response_body": "n",
-                    "test_time": "2025-06-19 21:06:29",
-                    "curl_exit_code": 0,
-                    "api_info": {
-                        "method": "GET",
-                        "path": "/api/bbs/article/getList",
-                        "description": "获取文章列表"
-                    }
-                }
-            },
-            "SlideshowController_getList": {
-                "input_data": {},
-                "result": {
-                    "status": "passed",
-                    "http_code": "200",
-                    "status_message": "请求成功",
-                    "response_time": "0.048608",
-                    "response_body": "",
-                    "test_time": "2025-06-19 21:06:29",
-                    "curl_exit_code": 0,
-                    "api_info": {
-                        "method": "GET",
-                        "path": "/api/bbs/carousel/getList",
-                        "description": "获取轮播图列表"
-                    }
-                }
-            },
-            "ArticleController_getArticleCommentVisitTotal": {
-                "input_data": {},
-                "result": {
-                    "status": "passed",
-                    "http_code": "200",
-                    "status_message": "请求成功",
-                    "response_time": "0.013293",
-                    "response_body": "{\"code\":-3,\"desc\":\"远程服务调用异常\",\"data\":null}\n",
-                    "test_time": "2025-06-19 21:06:30",
-                    "curl_exit_code": 0,
-                    "api_info": {
-                        "method": "GET",
-                        "path": "/api/bbs/article/getArticleCommentVisitTotal",
-                        "description": "获取文章评论访问总数"
-                    }
-                }
-            },
-            "ArticleController_getById": {
-                "input_data": {
-                    "id": 1,
-                    "isPv": True
-                },
-                "result": {
-                    "status": "passed",
-                    "http_code": "200",
-                    "status_message": "请求成功",
-                    "response_time": "0.015734",
-                    "response_body": "{\"code\":4,\"desc\":\"数据不存在\",\"data\":null}\n",
-                    "test_time": "2025-06-19 21:06:30",
-                    "curl_exit_code": 0,
-                    "api_info": {
-                        "method": "GET",
-                        "path": "/api/bbs/article/getById",
-                        "description": "获取文章详情"
-                    }
-                }
-            },
-            "LoginController_login": {
-                "input_data": {
-                    "username": "testuser",
-                    "password": "123456"
-                },
-                "result": {
-                    "status": "passed",
-                    "http_code": "200",
-                    "status_message": "请求成功",
-                    "response_time": "0.005074",
-                    "response_body": "{\"code\":-3,\"desc\":\"远程服务调用异常\",\"data\":null}\n",
-                    "test_time": "2025-06-19 21:06:30",
-                    "curl_exit_code": 0,
-                    "api_info": {
-                        "method": "POST",
-                        "path": "/api/bbs/sso/login",
-                        "description": "用户登录"
-                    }
-                }
-            }
-        }
-    })
+def preload_modules():
+    """
+    Imports every view module, builds the lookup tables and parses every
+    registered test suite up front, so the first requests do not pay for it.
+    With a pre-forking server this runs once in the master process and the
+    workers share the result.
+    """
+    for _, module, _ in LAZY_ROUTES:
+        import_string(module)
+    from calendar import get_day_table
+    from commission import get_commission_table
+    from view_helpers import suite_registry
+
+    get_day_table()
+    get_commission_table()
+    for name in suite_registry.names():
+        suite_registry.get(name)
+
+def create_app(preload=False, metrics=METRICS_ENABLED, profiling=bool(PROFILE_ADMIN_TOKEN)):
+    app = Flask(__name__)
+    CORS(app)
+    if metrics:
+        app.json = TimedJSONProvider(app)
+        app.before_request(_record_route)
+        app.wsgi_app = MetricsMiddleware(app.wsgi_app, request_metrics)
+    app.register_blueprint(api)
+    for blueprint in lazy_blueprints:
+        app.register_blueprint(blueprint)
+    if profiling:
+        for endpoint, view in app.view_functions.items():
+            if endpoint != 'static' and endpoint not in UNPROFILED_ENDPOINTS:
+                app.view_functions[endpoint] = profiled_view(view)
+    if preload:
+        preload_modules()
+    return app
+
+app = create_app()
 
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
@@ -0,0 +1,11 @@
+"""
+性能基准脚本。
+
+在 backend 目录下以模块方式运行，例如:
+    python -m benchmarks.triangle_batch
+
+benchmarks.suite 运行全部被测函数与接口的基准并把结果写入 JSON，
+benchmarks.compare 比较两次结果并标出回归:
+    python -m benchmarks.suite --output base.json
+    python -m benchmarks.compare base.json new.json --threshold 0.1
+"""
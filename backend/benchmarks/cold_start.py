@@ -0,0 +1,151 @@
+"""
+测量冷启动：对每个路由启动一个全新的解释器（带 -X importtime），
+依次导入 app、调用 create_app()、经测试客户端发出第一个请求，报告各阶段耗时，
+并以 -X importtime 的格式列出这一过程中累计耗时最多的顶层导入及其直接导入的模块。
+
+    python -m benchmarks.cold_start [--top 5] [--repeat 3] [--output cold-start.json]
+
+每个路由重复 --repeat 次取中位数；导入列表取自第一次运行。
+
+覆盖 app.py 注册的每个接口区域（含批量接口、/api/runner-cache、系统测试与论坛接口）：
+- 论坛接口请求本进程启动的桩服务器（经 FORUM_BASE_URL 传给子进程），
+  负载测试只运行 0.2 秒，其首次响应耗时包含这段运行时间；
+- 系统测试接口只发出不启动 pytest 的请求：/api/run-unit-tests，
+  以及查询不存在的运行（预期 404），二者都会加载系统测试接口模块；
+  创建运行（POST /api/system-test-runs）会启动浏览器测试，不在测量范围内。
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from forum_stub_server import start_stub_server
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TRIANGLE_INPUT = {'a': 3, 'b': 4, 'c': 5}
+CALENDAR_INPUT = {'year': 2000, 'month': 2, 'day': 28}
+TELECOM_INPUT = {'call_minutes': 100, 'late_payments': 1}
+EVALUATION_INPUT = {'sales': 300, 'work_hours': 40, 'leaves': 1, 'level': 3}
+COMMISSION_INPUT = {'hosts': 10, 'monitors': 10, 'peripherals': 10}
+
+# (方法, 路径, JSON 请求体, 预期状态码)
+ROUTES = (
+    ('GET', '/run-triangle-tests?type=bva', None, 200),
+    ('POST', '/run-triangle-custom', TRIANGLE_INPUT, 200),
+    ('POST', '/run-triangle-custom-bulk', [TRIANGLE_INPUT], 200),
+    ('GET', '/run-calendar-tests?type=bva', None, 200),
+    ('POST', '/run-calendar-custom', CALENDAR_INPUT, 200),
+    ('POST', '/run-calendar-custom-bulk', [CALENDAR_INPUT], 200),
+    ('GET', '/run-telecom-tests?type=bva', None, 200),
+    ('POST', '/run-telecom-custom', TELECOM_INPUT, 200),
+    ('POST', '/run-telecom-custom-bulk', [TELECOM_INPUT], 200),
+    ('GET', '/run-evaluation-tests', None, 200),
+    ('POST', '/run-evaluation-custom', EVALUATION_INPUT, 200),
+    ('POST', '/run-evaluation-custom-bulk', [EVALUATION_INPUT], 200),
+    ('GET', '/run-commission-tests', None, 200),
+    ('POST', '/run-commission-custom', COMMISSION_INPUT, 200),
+    ('POST', '/run-commission-custom-bulk', [COMMISSION_INPUT], 200),
+    ('GET', '/api/runner-cache', None, 200),
+    ('GET', '/api/run-unit-tests', None, 200),
+    ('GET', '/api/system-test-runs/cold-start', None, 404),
+    ('GET', '/api/run-forum-tests', None, 200),
+    ('GET', '/api/run-forum-load-test?duration=0.2&window=0.1&concurrency=2', None, 200),
+    ('GET', '/metrics', None, 200),
+)
+
+# 在子进程中执行：参数为方法、路径和 JSON 请求体，结果以一行 JSON 写到标准输出
+CHILD_SCRIPT = '''
+import json, sys, time
+started_at = time.perf_counter()
+from app import create_app
+imported_at = time.perf_counter()
+app = create_app()
+created_at = time.perf_counter()
+method, path, body = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+response = app.test_client().open(path, method=method, json=body)
+response.get_data()
+response.close()
+responded_at = time.perf_counter()
+print(json.dumps({
+    "status": response.status_code,
+    "import_app": imported_at - started_at,
+    "create_app": created_at - imported_at,
+    "first_response": responded_at - created_at,
+    "modules": len(sys.modules),
+}))
+'''
+
+
+def parse_importtime(stderr):
+    """解析 -X importtime 输出，返回 [(self_us, cumulative_us, depth, name)]。"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        imports.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return imports
+
+
+def cold_start(method, path, body, expected_status, env):
+    """在新的解释器中完成一次冷启动，返回 (各阶段耗时, importtime 记录)。"""
+    started_at = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD_SCRIPT, method, path, json.dumps(body)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    wall = time.perf_counter() - started_at
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    if timings['status'] != expected_status:
+        raise AssertionError(f"{method} {path} 返回 {timings['status']}，预期 {expected_status}")
+    timings['wall'] = wall
+    return timings, parse_importtime(completed.stderr)
+
+
+def run(repeat=3):
+    server, base_url = start_stub_server()
+    env = {**os.environ, 'FORUM_BASE_URL': base_url}
+    results = []
+    try:
+        for method, path, body, expected_status in ROUTES:
+            runs = [cold_start(method, path, body, expected_status, env) for _ in range(repeat)]
+            timings = {
+                key: statistics.median(run[0][key] for run in runs)
+                for key in ('import_app', 'create_app', 'first_response', 'wall', 'modules')
+            }
+            results.append({'method': method, 'path': path, **timings, 'imports': runs[0][1]})
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--top', type=int, default=5, help='每个路由列出的导入数')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='把结果（含完整的导入记录）写入 JSON 文件')
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    for result in results:
+        print(f"{result['method']} {result['path']}")
+        print(f"    import app {result['import_app'] * 1000:7.1f}ms  create_app {result['create_app'] * 1000:6.1f}ms  "
+              f"first response {result['first_response'] * 1000:7.1f}ms  "
+              f"process wall {result['wall'] * 1000:7.1f}ms  modules {result['modules']}")
+        # 顶层导入及其直接导入的模块，按累计耗时排序
+        top_level = sorted((item for item in result['imports'] if item[2] <= 1), key=lambda item: -item[1])
+        for self_us, cumulative_us, _, name in top_level[:args.top]:
+            print(f"    import time: {self_us:>9} | {cumulative_us:>10} | {name}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
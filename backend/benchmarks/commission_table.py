@@ -0,0 +1,81 @@
+"""
+commission 查找表的构建耗时、内存占用，以及查表与逐次计算、区间查询的耗时对比。
+
+    python -m benchmarks.commission_table [--rows 1000000] [--seed 0]
+"""
+import argparse
+import time
+from itertools import product
+
+import numpy as np
+
+from commission import (
+    MAX_HOSTS_PER_MONTH, MAX_MONITORS_PER_MONTH, MAX_PERIPHERALS_PER_MONTH,
+    calculate_sales_and_commission, commission_table_nbytes, find_combos_by_commission,
+    find_combos_by_sales, get_commission_table, lookup_sales_and_commission,
+)
+
+
+def check_parity():
+    """在整个合法输入域（及各维度越界一格）上比对查表结果与 calculate_sales_and_commission。"""
+    domain = product(
+        range(0, MAX_HOSTS_PER_MONTH + 2),
+        range(0, MAX_MONITORS_PER_MONTH + 2),
+        range(-1, MAX_PERIPHERALS_PER_MONTH + 2),
+    )
+    for values in domain:
+        if lookup_sales_and_commission(*values) != calculate_sales_and_commission(*values):
+            raise AssertionError(f'查表结果与 calculate_sales_and_commission 不一致: {values}')
+
+
+def run(rows, seed=0):
+    get_commission_table.cache_clear()
+    table = get_commission_table()
+    check_parity()
+
+    rng = np.random.default_rng(seed)
+    inputs = list(zip(
+        rng.integers(1, MAX_HOSTS_PER_MONTH + 1, rows).tolist(),
+        rng.integers(1, MAX_MONITORS_PER_MONTH + 1, rows).tolist(),
+        rng.integers(0, MAX_PERIPHERALS_PER_MONTH + 1, rows).tolist(),
+    ))
+    start = time.perf_counter()
+    for row in inputs:
+        calculate_sales_and_commission(*row)
+    scalar_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for row in inputs:
+        lookup_sales_and_commission(*row)
+    lookup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    by_commission = find_combos_by_commission(500, 600)
+    by_sales = find_combos_by_sales(4000)
+    query_seconds = time.perf_counter() - start
+
+    return {
+        'rows': rows,
+        'build_seconds': table.build_seconds,
+        'nbytes': commission_table_nbytes(table),
+        'scalar_seconds': scalar_seconds,
+        'lookup_seconds': lookup_seconds,
+        'query_seconds': query_seconds,
+        'query_matches': len(by_commission) + len(by_sales),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    result = run(args.rows, args.seed)
+    print(f"build={result['build_seconds'] * 1000:.1f}ms  memory={result['nbytes'] / 1024 / 1024:.2f}MiB")
+    print(f"rows={result['rows']}  scalar={result['scalar_seconds']:.3f}s  lookup={result['lookup_seconds']:.3f}s  "
+          f"speedup={result['scalar_seconds'] / result['lookup_seconds']:.1f}x")
+    print(f"range queries: {result['query_matches']} combos in {result['query_seconds'] * 1000:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+比较两次 benchmarks.suite 的结果，单位耗时增加超过阈值的基准记为回归。
+
+    python -m benchmarks.compare base.json new.json [--threshold 0.1] [--metric median]
+
+有回归时退出码为 1，便于在 CI 中使用。两次运行的环境（Python 版本、机器、CPU 数、依赖版本）
+不同时先给出提示，此时的差异不一定来自代码。
+"""
+import argparse
+import json
+import sys
+
+from benchmarks.suite import RESULTS_SCHEMA, format_seconds
+
+METRICS = ('median', 'min', 'mean')
+# 这些环境字段不同时，两次结果不宜直接比较
+COMPARABLE_FIELDS = ('python', 'implementation', 'machine', 'processor', 'cpu_count', 'packages', 'json_backend')
+
+REGRESSION = 'REGRESSION'
+IMPROVEMENT = 'improvement'
+UNCHANGED = 'ok'
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        results = json.load(f)
+    if results.get('schema') != RESULTS_SCHEMA:
+        raise ValueError(f"{path} 不是受支持的基准结果文件（schema {results.get('schema')}）")
+    return results
+
+
+def environment_differences(base, new):
+    return [
+        (field, base['environment'].get(field), new['environment'].get(field))
+        for field in COMPARABLE_FIELDS
+        if base['environment'].get(field) != new['environment'].get(field)
+    ]
+
+
+def compare(base, new, threshold=0.1, metric='median'):
+    """
+    按名称配对两次结果，返回 (rows, missing)。
+    rows 为 (name, base_value, new_value, ratio, verdict)；ratio = new / base，
+    超过 1 + threshold 为回归，低于 1 - threshold 为改进。missing 为只出现在一侧的基准名。
+    """
+    base_by_name = {benchmark['name']: benchmark for benchmark in base['benchmarks']}
+    new_by_name = {benchmark['name']: benchmark for benchmark in new['benchmarks']}
+    rows = []
+    for name, benchmark in new_by_name.items():
+        if name not in base_by_name:
+            continue
+        base_value, new_value = base_by_name[name][metric], benchmark[metric]
+        ratio = new_value / base_value if base_value > 0 else float('inf')
+        if ratio > 1 + threshold:
+            verdict = REGRESSION
+        elif ratio < 1 - threshold:
+            verdict = IMPROVEMENT
+        else:
+            verdict = UNCHANGED
+        rows.append((name, base_value, new_value, ratio, verdict))
+    missing = sorted(set(base_by_name) ^ set(new_by_name))
+    return rows, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=0.1, help='相对变化阈值，0.1 表示 10%%')
+    parser.add_argument('--metric', choices=METRICS, default='median')
+    args = parser.parse_args()
+
+    base, new = load_results(args.base), load_results(args.new)
+    for field, base_value, new_value in environment_differences(base, new):
+        print(f"注意: 运行环境 {field} 不同: {base_value} -> {new_value}")
+
+    rows, missing = compare(base, new, args.threshold, args.metric)
+    for name, base_value, new_value, ratio, verdict in rows:
+        print(f"{name:<48}  {format_seconds(base_value)} -> {format_seconds(new_value)}  {ratio:6.2f}x  {verdict}")
+    for name in missing:
+        print(f"{name:<48}  只出现在其中一次结果中")
+
+    regressions = [row for row in rows if row[4] == REGRESSION]
+    print(f"{len(rows)} 项基准，{len(regressions)} 项回归（阈值 {args.threshold:.0%}，指标 {args.metric}）")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
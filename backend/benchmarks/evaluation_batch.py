@@ -0,0 +1,55 @@
+"""
+对比 calculate_employee_score 逐人调用与 calculate_employee_score_batch 向量化调用的耗时。
+
+    python -m benchmarks.evaluation_batch [--rows 1000000 10000000] [--seed 0]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from evaluation import calculate_employee_score, calculate_employee_score_batch
+
+
+def run(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    # 各维度取值覆盖全部分档边界
+    sales = rng.integers(0, 700, rows)
+    work_hours = rng.integers(0, 41, rows)
+    leaves = rng.integers(0, 21, rows)
+    level = rng.integers(0, 6, rows)
+
+    start = time.perf_counter()
+    scores = calculate_employee_score_batch(sales, work_hours, leaves, level)
+    batch_seconds = time.perf_counter() - start
+
+    columns = sales.tolist(), work_hours.tolist(), leaves.tolist(), level.tolist()
+    start = time.perf_counter()
+    expected = [calculate_employee_score(*row) for row in zip(*columns)]
+    scalar_seconds = time.perf_counter() - start
+
+    if scores.tolist() != expected:
+        raise AssertionError('calculate_employee_score_batch 与 calculate_employee_score 结果不一致')
+
+    return {
+        'rows': rows,
+        'scalar_seconds': scalar_seconds,
+        'batch_seconds': batch_seconds,
+        'speedup': scalar_seconds / batch_seconds if batch_seconds > 0 else float('inf'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        result = run(rows, args.seed)
+        print(f"rows={result['rows']:>10}  scalar={result['scalar_seconds']:.3f}s  "
+              f"batch={result['batch_seconds']:.3f}s  speedup={result['speedup']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
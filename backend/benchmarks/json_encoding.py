@@ -0,0 +1,78 @@
+"""
+对比运行结果序列化的耗时与体积：Flask jsonify 等价的标准库编码（行式）、
+当前 JSON 后端的行式编码，以及当前后端的列式编码。
+
+    python -m benchmarks.json_encoding [--rows 100000] [--seed 0]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from json_encoding import JSON_BACKEND, dumps, to_columns
+from telecom_billing import calculate_telecom_fee
+
+
+def make_results(rows, seed=0):
+    """构造与 /run-telecom-tests 相同结构的结果行。"""
+    rng = np.random.default_rng(seed)
+    results = []
+    for index, (minutes, lates) in enumerate(zip(rng.integers(0, 1000, rows).tolist(), rng.integers(0, 12, rows).tolist())):
+        fee = calculate_telecom_fee(minutes, lates)['total_fee']
+        results.append({
+            'id': str(index + 1),
+            'call_minutes': minutes,
+            'late_payments': lates,
+            'description': '随机生成的用例',
+            'expected': fee,
+            'output_fee': fee,
+            'passed': True,
+        })
+    return results
+
+
+def timed(function, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def run(rows, seed=0):
+    results = make_results(rows, seed)
+    summary = {'passCount': rows, 'totalCount': rows, 'passRate': 100.0}
+
+    # Flask 默认的 JSON 提供者：标准库编码、排序键、转义非 ASCII
+    jsonify_body, jsonify_seconds = timed(
+        lambda: json.dumps({'results': results, 'summary': summary}, sort_keys=True).encode('utf-8')
+    )
+    rows_body, rows_seconds = timed(lambda: dumps({'results': results, 'summary': summary}))
+    columns_body, columns_seconds = timed(lambda: dumps({'results': to_columns(results), 'summary': summary}))
+
+    if json.loads(rows_body) != json.loads(jsonify_body):
+        raise AssertionError('行式编码结果与标准库编码不一致')
+    if json.loads(columns_body)['results'] != to_columns(json.loads(jsonify_body)['results']):
+        raise AssertionError('列式编码结果与行式结果不一致')
+
+    return [
+        ('stdlib rows (jsonify)', jsonify_seconds, len(jsonify_body)),
+        (f'{JSON_BACKEND} rows', rows_seconds, len(rows_body)),
+        (f'{JSON_BACKEND} columns', columns_seconds, len(columns_body)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for name, seconds, size in run(args.rows, args.seed):
+        print(f"{name:<24}  {seconds * 1000:8.1f}ms  {size / 1024 / 1024:7.2f}MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+测量请求指标带来的额外开销。
+
+- hooks：单独执行一次请求的全部记录操作（开始、业务/编码两个阶段计时、结束写入），
+  不经过 Flask，得到记录本身的耗时；
+- end-to-end：用测试客户端分别请求未启用与启用指标的应用，比较每个请求的平均耗时。
+
+    python -m benchmarks.metrics_overhead [--requests 20000] [--threads 4]
+"""
+import argparse
+import threading
+import time
+
+from app import create_app
+from metrics import BUSINESS_PHASE, ENCODE_PHASE, RequestMetrics
+
+ROUTE = '/run-triangle-custom'
+PAYLOAD = {'a': 3, 'b': 4, 'c': 5}
+
+
+def record_requests(registry, count):
+    for _ in range(count):
+        started_at = registry.begin_request()
+        with registry.timer(BUSINESS_PHASE):
+            pass
+        with registry.timer(ENCODE_PHASE):
+            pass
+        registry.end_request(ROUTE, 'POST', 200, started_at, 24, 73)
+
+
+def time_hooks(count, threads):
+    """返回每个请求的记录耗时（秒）；threads 个线程并发写同一个注册表，并校验计数没有丢失。"""
+    registry = RequestMetrics()
+    per_thread = count // threads
+    workers = [threading.Thread(target=record_requests, args=(registry, per_thread)) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - start
+    recorded = registry.requests[(ROUTE, 'POST', 200)]
+    if recorded != per_thread * threads:
+        raise AssertionError(f"请求计数丢失：期望 {per_thread * threads}，实际 {recorded}")
+    return seconds / recorded
+
+
+def time_requests(app, count, repeat=3):
+    client = app.test_client()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(count):
+            # 中间件在响应关闭时写入指标，与真实 WSGI 服务器一样显式关闭
+            client.post(ROUTE, json=PAYLOAD).close()
+        best = min(best, time.perf_counter() - start)
+    return best / count
+
+
+def run(requests, threads):
+    hooks = time_hooks(requests, threads)
+    plain = time_requests(create_app(metrics=False), requests // 4)
+    instrumented = time_requests(create_app(metrics=True), requests // 4)
+    return hooks, plain, instrumented
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=20_000)
+    parser.add_argument('--threads', type=int, default=4)
+    args = parser.parse_args()
+
+    hooks, plain, instrumented = run(args.requests, args.threads)
+    print(f"hooks only ({args.threads} threads)  {hooks * 1e6:7.2f}us/request")
+    print(f"end-to-end without metrics  {plain * 1e6:7.2f}us/request")
+    print(f"end-to-end with metrics     {instrumented * 1e6:7.2f}us/request")
+    print(f"overhead                    {(instrumented - plain) * 1e6:7.2f}us/request")
+
+
+if __name__ == '__main__':
+    main()
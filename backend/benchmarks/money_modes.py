@@ -0,0 +1,84 @@
+"""
+对比电信计费与销售佣金在不同金额计算方式下的吞吐量：
+逐行调用业务函数（佣金为二进制浮点；电信已改为整数分定点，另含批量版本）、逐行 Decimal 精确计算、
+整数分定点批量计算。定点结果（含电信的逐行与批量结果）与 Decimal 结果逐行比对，必须完全相等。
+
+    python -m benchmarks.money_modes [--rows 1000000] [--seed 0]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from commission import calculate_sales_and_commission, calculate_sales_and_commission_cents_batch
+from model_check import commission_oracle, telecom_oracle
+from money import to_cents
+from telecom_billing import calculate_telecom_fee, calculate_telecom_fee_batch, calculate_telecom_fee_cents_batch
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run_telecom(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    call_minutes = rng.integers(0, 1000, rows)
+    late_payments = rng.integers(0, 12, rows)
+    minutes, lates = call_minutes.tolist(), late_payments.tolist()
+
+    scalar_totals, scalar_seconds = timed(
+        lambda: [calculate_telecom_fee(m, l)['total_fee'] for m, l in zip(minutes, lates)]
+    )
+    batch, batch_seconds = timed(lambda: calculate_telecom_fee_batch(call_minutes, late_payments))
+    decimal_totals, decimal_seconds = timed(lambda: [telecom_oracle(m, l)[1] for m, l in zip(minutes, lates)])
+    fixed, fixed_seconds = timed(lambda: calculate_telecom_fee_cents_batch(call_minutes, late_payments))
+
+    if [to_cents(total) for total in decimal_totals] != fixed['total_fee_cents'].tolist():
+        raise AssertionError('calculate_telecom_fee_cents_batch 与 Decimal 精确计算结果不一致')
+    if scalar_totals != decimal_totals or batch['total_fee'].tolist() != decimal_totals:
+        raise AssertionError('calculate_telecom_fee 或 calculate_telecom_fee_batch 与 Decimal 精确计算结果不一致')
+    return {
+        'scalar': scalar_seconds,
+        'batch': batch_seconds,
+        'decimal': decimal_seconds,
+        'fixed-point': fixed_seconds,
+    }
+
+
+def run_commission(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    hosts = rng.integers(1, 71, rows)
+    monitors = rng.integers(1, 81, rows)
+    peripherals = rng.integers(0, 91, rows)
+    inputs = list(zip(hosts.tolist(), monitors.tolist(), peripherals.tolist()))
+
+    _, float_seconds = timed(lambda: [calculate_sales_and_commission(*row)['commission'] for row in inputs])
+    decimal_commissions, decimal_seconds = timed(lambda: [commission_oracle(*row)[2] for row in inputs])
+    fixed, fixed_seconds = timed(lambda: calculate_sales_and_commission_cents_batch(hosts, monitors, peripherals))
+
+    if [to_cents(commission) for commission in decimal_commissions] != fixed['commission_cents'].tolist():
+        raise AssertionError('calculate_sales_and_commission_cents_batch 与 Decimal 精确计算结果不一致')
+    return {
+        'float': float_seconds,
+        'decimal': decimal_seconds,
+        'fixed-point': fixed_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for name, run in (('telecom', run_telecom), ('commission', run_commission)):
+        timings = run(args.rows, args.seed)
+        for mode, seconds in timings.items():
+            rate = args.rows / seconds if seconds > 0 else float('inf')
+            print(f"{name:<10}  {mode:<11}  {seconds:8.3f}s  {rate:>14,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
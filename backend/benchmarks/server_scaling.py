@@ -0,0 +1,125 @@
+"""
+测量生产服务器（serve.py）的吞吐量随工作进程数的变化。
+
+对每个工作进程数启动一次 serve.py，待其就绪后由若干客户端进程同时施加并发负载，
+请求 POST /run-triangle-custom 与 GET /run-telecom-tests，统计总的每秒请求数与延迟分位数，
+结束后发送 SIGTERM 并等待服务器退出。
+
+    python -m benchmarks.server_scaling [--workers 1 2 4] [--duration 10] [--concurrency 16] [--clients 2]
+
+客户端与服务器运行在同一台机器上，CPU 核数不多于工作进程数时吞吐量不会继续增长。
+"""
+import argparse
+import http.client
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from forum_api_tester import run_load_test
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+READY_TIMEOUT = 30
+
+ENDPOINTS = {
+    'run_triangle_custom': {
+        'method': 'POST',
+        'path': '/run-triangle-custom',
+        'input_data': {'a': 3, 'b': 4, 'c': 5},
+    },
+    'run_telecom_tests': {
+        'method': 'GET',
+        'path': '/run-telecom-tests',
+        'input_data': {'type': 'bva'},
+    },
+}
+
+
+def start_server(workers, port, threads):
+    return subprocess.Popen(
+        [sys.executable, 'serve.py', '--workers', str(workers), '--threads', str(threads), '--port', str(port)],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(process, port):
+    deadline = time.monotonic() + READY_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"serve.py 启动失败，退出码 {process.returncode}")
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+        try:
+            connection.request('GET', '/run-telecom-tests?type=bva')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+        finally:
+            connection.close()
+    raise RuntimeError(f"serve.py 在 {READY_TIMEOUT} 秒内未就绪")
+
+
+def stop_server(process, timeout=READY_TIMEOUT):
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _client(base_url, duration, concurrency):
+    return run_load_test(base_url, ENDPOINTS, duration, concurrency)['load_info']
+
+
+def measure(workers, port, threads, duration, concurrency, clients):
+    """启动 workers 个工作进程的服务器并施加负载，返回合并后的统计。"""
+    process = start_server(workers, port, threads)
+    try:
+        wait_ready(process, port)
+        base_url = f"http://127.0.0.1:{port}"
+        with ProcessPoolExecutor(clients) as pool:
+            futures = [pool.submit(_client, base_url, duration, concurrency) for _ in range(clients)]
+            infos = [future.result() for future in futures]
+    finally:
+        stop_server(process)
+    return {
+        'workers': workers,
+        'requests': sum(info['requests'] for info in infos),
+        'errors': sum(info['errors'] for info in infos),
+        'throughput': sum(info['throughput'] for info in infos),
+        # 各客户端的分位数取最大值，作为整体的保守估计
+        'p50': max(info['latency']['p50'] for info in infos),
+        'p99': max(info['latency']['p99'] for info in infos),
+    }
+
+
+def run(workers_list, port=5077, threads=4, duration=10, concurrency=16, clients=2):
+    return [measure(workers, port, threads, duration, concurrency, clients) for workers in workers_list]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--port', type=int, default=5077)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--concurrency', type=int, default=16, help='每个客户端进程的并发连接数')
+    parser.add_argument('--clients', type=int, default=2, help='客户端进程数')
+    args = parser.parse_args()
+
+    print(f"cpu_count={os.cpu_count()}  clients={args.clients}  concurrency={args.concurrency}")
+    for row in run(args.workers, args.port, args.threads, args.duration, args.concurrency, args.clients):
+        print(
+            f"workers={row['workers']:<3}  {row['throughput']:9.1f} req/s  "
+            f"p50 {row['p50'] * 1000:7.2f}ms  p99 {row['p99'] * 1000:7.2f}ms  "
+            f"requests={row['requests']}  errors={row['errors']}"
+        )
+
+
+if __name__ == '__main__':
+    main()
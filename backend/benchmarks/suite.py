@@ -0,0 +1,218 @@
+"""
+完整的性能基准：五个被测函数的逐条调用（scalar）与批量调用（bulk），
+以及五个 /run-*-tests 接口经 Flask 测试客户端的请求耗时（route 每次请求前清空结果缓存，
+route-cached 命中缓存）。
+
+每项基准重复 --repeat 次，每次执行若干操作，记录每次的单位耗时（秒/次调用、秒/行、秒/请求），
+结果连同运行环境信息写入 JSON 文件，可用 benchmarks.compare 比较两次结果。
+
+    python -m benchmarks.suite [--output results.json] [--rows 100000] [--bulk-rows 1000000]
+                               [--requests 50] [--repeat 5] [--seed 0] [--filter triangle]
+"""
+import argparse
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+RESULTS_SCHEMA = 1
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUNNER_ROUTES = (
+    '/run-triangle-tests?type=bva',
+    '/run-calendar-tests?type=bva',
+    '/run-telecom-tests?type=bva',
+    '/run-evaluation-tests',
+    '/run-commission-tests',
+)
+
+
+def _package_version(name):
+    try:
+        from importlib.metadata import version
+        return version(name)
+    except Exception:
+        return None
+
+
+def _git(*args):
+    try:
+        return subprocess.run(
+            ['git', *args], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=10, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment():
+    """运行环境信息，比较结果时用于判断两次运行是否可比。"""
+    from json_encoding import JSON_BACKEND
+
+    status = _git('status', '--porcelain')
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'hostname': socket.gethostname(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'packages': {name: _package_version(name) for name in ('numpy', 'flask', 'orjson')},
+        'json_backend': JSON_BACKEND,
+        'git_commit': _git('rev-parse', 'HEAD'),
+        'git_dirty': bool(status) if status is not None else None,
+        'argv': sys.argv,
+    }
+
+
+def measure(function, ops, repeat):
+    """预热一次后执行 repeat 次 function（每次完成 ops 个操作），返回每次的单位耗时（秒）。"""
+    function()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) / ops)
+    return samples
+
+
+def make_inputs(rows, seed):
+    """各被测函数的随机输入（numpy 数组），取值范围覆盖有效与无效输入。"""
+    rng = np.random.default_rng(seed)
+    return {
+        'triangle': (rng.integers(0, 101, rows), rng.integers(0, 101, rows), rng.integers(0, 101, rows)),
+        'calendar': (rng.integers(1790, 2211, rows), rng.integers(0, 14, rows), rng.integers(0, 33, rows)),
+        'evaluation': (
+            rng.integers(0, 700, rows), rng.integers(0, 41, rows), rng.integers(0, 21, rows), rng.integers(0, 6, rows),
+        ),
+        'commission': (rng.integers(0, 72, rows), rng.integers(0, 82, rows), rng.integers(0, 92, rows)),
+        'telecom': (rng.integers(-10, 1000, rows), rng.integers(0, 12, rows)),
+    }
+
+
+def scalar_benchmarks(rows, seed):
+    from calendar import calculate_next_day
+    from commission import calculate_sales_and_commission
+    from evaluation import calculate_employee_score
+    from telecom_billing import calculate_telecom_fee
+    from triangle import triangle_type
+
+    functions = {
+        'triangle': triangle_type,
+        'calendar': calculate_next_day,
+        'evaluation': calculate_employee_score,
+        'commission': calculate_sales_and_commission,
+        'telecom': calculate_telecom_fee,
+    }
+    for key, columns in make_inputs(rows, seed).items():
+        function = functions[key]
+        args = list(zip(*(column.tolist() for column in columns)))
+        yield f'scalar/{function.__name__}', 'call', rows, lambda function=function, args=args: [
+            function(*row) for row in args
+        ]
+
+
+def bulk_benchmarks(rows, seed):
+    from calendar import next_day_batch
+    from commission import calculate_sales_and_commission_cents_batch
+    from evaluation import calculate_employee_score_batch
+    from telecom_billing import calculate_telecom_fee_batch
+    from triangle import triangle_type_batch
+
+    functions = {
+        'triangle': triangle_type_batch,
+        'calendar': next_day_batch,
+        'evaluation': calculate_employee_score_batch,
+        'commission': calculate_sales_and_commission_cents_batch,
+        'telecom': calculate_telecom_fee_batch,
+    }
+    for key, columns in make_inputs(rows, seed).items():
+        function = functions[key]
+        yield f'bulk/{function.__name__}', 'row', rows, lambda function=function, columns=columns: function(*columns)
+
+
+def route_benchmarks(requests):
+    import view_helpers
+    from app import create_app
+
+    client = create_app().test_client()
+
+    def get(route, clear_cache):
+        for _ in range(requests):
+            if clear_cache:
+                view_helpers.runner_cache.clear()
+            response = client.get(route)
+            response.close()
+            if response.status_code != 200:
+                raise AssertionError(f"{route} 返回 {response.status_code}")
+
+    for route in RUNNER_ROUTES:
+        yield f'route{route}', 'request', requests, lambda route=route: get(route, True)
+    for route in RUNNER_ROUTES:
+        yield f'route-cached{route}', 'request', requests, lambda route=route: get(route, False)
+
+
+def run(rows, bulk_rows, requests, repeat, seed=0, name_filter=None):
+    benchmarks = []
+    groups = (scalar_benchmarks(rows, seed), bulk_benchmarks(bulk_rows, seed), route_benchmarks(requests))
+    for group in groups:
+        for name, unit, ops, function in group:
+            if name_filter and name_filter not in name:
+                continue
+            samples = measure(function, ops, repeat)
+            benchmarks.append({
+                'name': name,
+                'group': name.split('/', 1)[0],
+                'unit': unit,
+                'ops': ops,
+                'samples': samples,
+                'min': min(samples),
+                'median': statistics.median(samples),
+                'mean': statistics.fmean(samples),
+                'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            })
+    return {
+        'schema': RESULTS_SCHEMA,
+        'environment': environment(),
+        'config': {'rows': rows, 'bulk_rows': bulk_rows, 'requests': requests, 'repeat': repeat, 'seed': seed},
+        'benchmarks': benchmarks,
+    }
+
+
+def format_seconds(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f}{unit}"
+    return f"{seconds / 1e-9:8.2f}ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default='benchmark-results.json')
+    parser.add_argument('--rows', type=int, default=100_000, help='逐条调用的调用次数')
+    parser.add_argument('--bulk-rows', type=int, default=1_000_000, help='批量调用的行数')
+    parser.add_argument('--requests', type=int, default=50, help='每个接口每轮的请求数')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--filter', help='只运行名称包含该字符串的基准')
+    args = parser.parse_args()
+
+    results = run(args.rows, args.bulk_rows, args.requests, args.repeat, args.seed, args.filter)
+    for benchmark in results['benchmarks']:
+        print(f"{benchmark['name']:<48}  median {format_seconds(benchmark['median'])}/{benchmark['unit']:<7}  "
+              f"min {format_seconds(benchmark['min'])}  stdev {format_seconds(benchmark['stdev'])}")
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"结果已写入 {args.output}")
+
+
+if __name__ == '__main__':
+    main()
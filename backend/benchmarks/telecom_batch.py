@@ -0,0 +1,57 @@
+"""
+对比 calculate_telecom_fee 逐户调用与 calculate_telecom_fee_batch 列式批量计费的耗时。
+
+    python -m benchmarks.telecom_batch [--rows 1000000 10000000] [--seed 0]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from telecom_billing import calculate_telecom_fee, calculate_telecom_fee_batch
+
+# 逐户计费按块进行并与批量结果逐块比对，避免一次性保存上千万个结果字典
+CHUNK_ROWS = 1_000_000
+
+
+def run(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    call_minutes = rng.integers(0, 1000, rows)
+    late_payments = rng.integers(0, 12, rows)
+
+    start = time.perf_counter()
+    batch = calculate_telecom_fee_batch(call_minutes, late_payments)
+    batch_seconds = time.perf_counter() - start
+
+    scalar_seconds = 0.0
+    for offset in range(0, rows, CHUNK_ROWS):
+        minutes = call_minutes[offset:offset + CHUNK_ROWS].tolist()
+        lates = late_payments[offset:offset + CHUNK_ROWS].tolist()
+        start = time.perf_counter()
+        totals = [calculate_telecom_fee(m, l)['total_fee'] for m, l in zip(minutes, lates)]
+        scalar_seconds += time.perf_counter() - start
+        if totals != batch['total_fee'][offset:offset + CHUNK_ROWS].tolist():
+            raise AssertionError('calculate_telecom_fee_batch 与 calculate_telecom_fee 结果不一致')
+
+    return {
+        'rows': rows,
+        'scalar_seconds': scalar_seconds,
+        'batch_seconds': batch_seconds,
+        'speedup': scalar_seconds / batch_seconds if batch_seconds > 0 else float('inf'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        result = run(rows, args.seed)
+        print(f"rows={result['rows']:>10}  scalar={result['scalar_seconds']:.3f}s  "
+              f"batch={result['batch_seconds']:.3f}s  speedup={result['speedup']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
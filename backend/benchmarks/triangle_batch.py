@@ -0,0 +1,54 @@
+"""
+对比 triangle_type 逐条调用与 triangle_type_batch 向量化调用的耗时。
+
+    python -m benchmarks.triangle_batch [--rows 1000000 10000000] [--seed 0]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from triangle import decode_triangle_types, triangle_type, triangle_type_batch
+
+
+def run(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    # 取值范围 0-100，覆盖非正数、等边、等腰和非三角形等情况
+    a = rng.integers(0, 101, rows)
+    b = rng.integers(0, 101, rows)
+    c = rng.integers(0, 101, rows)
+
+    start = time.perf_counter()
+    codes = triangle_type_batch(a, b, c)
+    batch_seconds = time.perf_counter() - start
+
+    a_list, b_list, c_list = a.tolist(), b.tolist(), c.tolist()
+    start = time.perf_counter()
+    expected = [triangle_type(x, y, z) for x, y, z in zip(a_list, b_list, c_list)]
+    scalar_seconds = time.perf_counter() - start
+
+    if decode_triangle_types(codes) != expected:
+        raise AssertionError('triangle_type_batch 与 triangle_type 结果不一致')
+
+    return {
+        'rows': rows,
+        'scalar_seconds': scalar_seconds,
+        'batch_seconds': batch_seconds,
+        'speedup': scalar_seconds / batch_seconds if batch_seconds > 0 else float('inf'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        result = run(rows, args.seed)
+        print(f"rows={result['rows']:>10}  scalar={result['scalar_seconds']:.3f}s  "
+              f"batch={result['batch_seconds']:.3f}s  speedup={result['speedup']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,9 @@
+from collections import namedtuple
+from functools import lru_cache
+
+# 本模块与标准库 calendar 同名，在 backend 目录下运行时 email.utils 等标准库模块（Flask 启动时即会导入）
+# 实际导入的是它；因此 numpy 只在日期引擎的函数内导入，不拖慢应用启动
+
 def is_leap(year):
     """
     判断指定的年份是否为闰年。
@@ -50,4 +56,147 @@ def calculate_next_day(year, month, day):
     if next_year > 2200:
         return "无效日期"
         
-    return f"{next_year}.{next_month}.{next_day}" 
\ No newline at end of file
+    return f"{next_year}.{next_month}.{next_day}" 
+
+# ====================================================================
+# 基于预计算日序表的日期引擎
+# ====================================================================
+
+MIN_YEAR = 1800
+MAX_YEAR = 2200
+INVALID_DATE = "无效日期"
+INT64_MAX = 2 ** 63 - 1
+
+DayTable = namedtuple('DayTable', [
+    'month_starts',   # 每个 (年, 月) 的 1 日对应的日序号，下标为 (year - MIN_YEAR) * 12 + month - 1
+    'month_lengths',  # 每个 (年, 月) 的天数，下标同上
+    'years',          # 日序号 -> 年
+    'months',         # 日序号 -> 月
+    'days',           # 日序号 -> 日
+])
+
+@lru_cache(maxsize=None)
+def get_day_table():
+    """
+    构建并缓存 MIN_YEAR.1.1 至 MAX_YEAR.12.31 的日序表（首次调用时构建）。
+    日序号从 0 开始，MIN_YEAR.1.1 为 0。
+    """
+    import numpy as np
+
+    years = np.arange(MIN_YEAR, MAX_YEAR + 1)
+    leap = (years % 4 == 0) & (years % 100 != 0) | (years % 400 == 0)
+    month_lengths = np.tile(np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int8), (len(years), 1))
+    month_lengths[leap, 1] = 29
+    month_lengths = month_lengths.ravel()
+
+    month_starts = np.zeros(len(month_lengths), dtype=np.int32)
+    np.cumsum(month_lengths[:-1], out=month_starts[1:])
+
+    return DayTable(
+        month_starts=month_starts,
+        month_lengths=month_lengths,
+        years=np.repeat(np.repeat(years, 12), month_lengths).astype(np.int16),
+        months=np.repeat(np.tile(np.arange(1, 13, dtype=np.int8), len(years)), month_lengths),
+        days=(np.arange(month_lengths.sum(), dtype=np.int32) - np.repeat(month_starts, month_lengths) + 1).astype(np.int8),
+    )
+
+def _as_date_field(values):
+    """
+    将年、月或日（标量或数组）转换为 int64 数组，返回 (数组, 整数掩码)。
+    与 calculate_next_day 的 isinstance(arg, int) 校验一致：bool 按整数处理，浮点数组整体无效，
+    object 数组（如超出 int64 的 Python 整数）逐个判断；先扩展为 int64 再参与运算，窄整数类型不会溢出。
+    """
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.dtype.kind in 'bi':
+        return values.astype(np.int64), np.ones(values.shape, dtype=bool)
+    if values.dtype.kind == 'u':
+        # 超出 int64 的无符号值远在日期范围之外，截断后同样无效
+        return np.minimum(values.astype(np.uint64), INT64_MAX).astype(np.int64), np.ones(values.shape, dtype=bool)
+    if values.dtype.kind == 'O':
+        flat = values.ravel().tolist()
+        is_int = np.array([isinstance(value, int) for value in flat], dtype=bool).reshape(values.shape)
+        fields = np.array(
+            [value if isinstance(value, int) and -1 <= value <= MAX_YEAR else -1 for value in flat], dtype=np.int64,
+        ).reshape(values.shape)
+        return fields, is_int
+    return np.zeros(values.shape, dtype=np.int64), np.zeros(values.shape, dtype=bool)
+
+def date_to_ordinal(year, month, day):
+    """
+    将日期（标量或数组）转换为日序号，无效日期返回 -1。
+    与 calculate_next_day 一致，只接受整数（含 bool）输入；浮点数组整体视为无效。
+    """
+    import numpy as np
+
+    table = get_day_table()
+    (year, year_ok), (month, month_ok), (day, day_ok) = (_as_date_field(value) for value in (year, month, day))
+
+    valid = year_ok & month_ok & day_ok
+    valid &= (year >= MIN_YEAR) & (year <= MAX_YEAR) & (month >= 1) & (month <= 12)
+    index = np.where(valid, (year - MIN_YEAR) * 12 + month - 1, 0)
+    valid &= (day >= 1) & (day <= table.month_lengths[index])
+    return np.where(valid, table.month_starts[index] + day - 1, -1).astype(np.int32)
+
+def ordinal_to_date(ordinal):
+    """
+    将日序号（标量或数组）转换回 (年, 月, 日) 三个数组，超出范围的位置均为 0。
+    """
+    import numpy as np
+
+    table = get_day_table()
+    ordinal = np.asarray(ordinal)
+    valid = (ordinal >= 0) & (ordinal < len(table.years))
+    index = np.where(valid, ordinal, 0)
+    return (
+        np.where(valid, table.years[index], 0),
+        np.where(valid, table.months[index], 0),
+        np.where(valid, table.days[index], 0),
+    )
+
+def format_dates(years, months, days):
+    """
+    将 (年, 月, 日) 数组格式化为与 calculate_next_day 相同的字符串列表，年份为 0 的位置为"无效日期"。
+    """
+    import numpy as np
+
+    return [
+        f"{y}.{m}.{d}" if y else INVALID_DATE
+        for y, m, d in zip(np.ravel(years).tolist(), np.ravel(months).tolist(), np.ravel(days).tolist())
+    ]
+
+def next_day_batch(years, months, days):
+    """
+    批量计算下一天（calculate_next_day 的向量化版本）。
+    返回 (年, 月, 日) 三个数组，无效日期或超出 MAX_YEAR 的位置均为 0，
+    可用 format_dates 得到与 calculate_next_day 完全一致的字符串。
+    """
+    import numpy as np
+
+    ordinals = date_to_ordinal(years, months, days)
+    return ordinal_to_date(np.where(ordinals >= 0, ordinals + 1, -1))
+
+def add_days(year, month, day, n):
+    """
+    计算给定日期之后第 n 天（n 可为负数）的日期字符串。
+    输入日期无效或结果超出 1800-2200 时返回"无效日期"；add_days(y, m, d, 1) 与 calculate_next_day 一致。
+    """
+    if not all(isinstance(arg, int) for arg in [year, month, day, n]):
+        return INVALID_DATE
+    ordinal = int(date_to_ordinal(year, month, day))
+    if ordinal < 0:
+        return INVALID_DATE
+    return format_dates(*ordinal_to_date(ordinal + n))[0]
+
+def days_between(start, end):
+    """
+    计算两个 (年, 月, 日) 日期之间相差的天数（end - start），任一日期无效时返回 None。
+    """
+    if not all(isinstance(arg, int) for arg in [*start, *end]):
+        return None
+    start_ordinal = int(date_to_ordinal(*start))
+    end_ordinal = int(date_to_ordinal(*end))
+    if start_ordinal < 0 or end_ordinal < 0:
+        return None
+    return end_ordinal - start_ordinal
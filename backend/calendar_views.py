@@ -0,0 +1,51 @@
+"""万年历（下一天）接口。"""
+from flask import jsonify, request
+
+from calendar import calculate_next_day
+from metrics import business_timer
+from view_helpers import bulk_response, cached_runner_response
+
+def run_calendar_tests():
+    test_type = request.args.get('type', 'bva')
+    suite = 'calendar_bva' if test_type == 'bva' else 'calendar_equivalence'
+    return cached_runner_response(suite, calculate_next_day, run_calendar_case)
+
+def run_calendar_case(case):
+    year, month, day = case['year'], case['month'], case['day']
+    actual_result = calculate_next_day(year, month, day)
+    row = {
+        "id": case['id'], "year": year, "month": month, "day": day,
+        "description": case['description'], "expected": case['expected'],
+        "output_type": actual_result
+    }
+    return row, actual_result == case['expected']
+
+def parse_calendar_input(data):
+    """Returns ((year, month, day), None) for a valid custom input, or (None, error message)."""
+    if not data or not isinstance(data, dict):
+        return None, '无效的请求体'
+    try:
+        year = int(data.get('year', 0))
+        month = int(data.get('month', 0))
+        day = int(data.get('day', 0))
+    except (ValueError, TypeError, OverflowError):
+        return None, '输入必须是整数'
+    return (year, month, day), None
+
+def compute_calendar_output(year, month, day):
+    result = calculate_next_day(year, month, day)
+    return { 'year': year, 'month': month, 'day': day, 'output_type': result }
+
+def run_calendar_custom():
+    inputs, error = parse_calendar_input(request.get_json())
+    if error:
+        return jsonify({'error': error}), 400
+    with business_timer():
+        output = compute_calendar_output(*inputs)
+    return jsonify(output)
+
+def run_calendar_custom_bulk():
+    return bulk_response(
+        parse_calendar_input,
+        lambda inputs: [compute_calendar_output(*args) for args in inputs],
+    )
@@ -1,4 +1,11 @@
 # -*- coding: utf-8 -*-
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from money import CENTS_PER_UNIT
 
 # 定义产品单价和月度销售上限常量
 HOST_PRICE = 25
@@ -9,6 +16,10 @@ MAX_HOSTS_PER_MONTH = 70
 MAX_MONITORS_PER_MONTH = 80
 MAX_PERIPHERALS_PER_MONTH = 90
 
+# 佣金档位：销售额 <= 1000 为 10%，<= 1800 为 15%，其余为 20%（以百分数表示，供定点计算使用）
+COMMISSION_BREAKPOINTS = np.array([1000, 1800])
+COMMISSION_PERCENTS = np.array([10, 15, 20])
+
 def calculate_sales_and_commission(hosts_sold, monitors_sold, peripherals_sold):
     """
     根据销量计算总销售额和佣金。
@@ -85,3 +96,153 @@ def calculate_sales_and_commission(hosts_sold, monitors_sold, peripherals_sold):
         'commission': round(commission, 2),
         'message': '计算成功'
     }
+
+def _as_quantity_column(values, low, high):
+    """
+    把销量数组转换为 int64 数组，返回 (数组, 合法掩码)。
+    与 calculate_sales_and_commission 的 isinstance(val, int) 校验一致：bool 按整数处理，浮点数组整体非法，
+    object 数组（如超出 int64 的 Python 整数）逐个判断；超出 [low, high] 的位置非法，对应值为 0。
+    """
+    if values.dtype.kind in 'biu':
+        valid = (values >= low) & (values <= high)
+        return np.where(valid, values, 0).astype(np.int64), valid
+    if values.dtype.kind == 'O':
+        flat = values.ravel().tolist()
+        valid = [isinstance(value, int) and low <= value <= high for value in flat]
+        quantities = [value if ok else 0 for value, ok in zip(flat, valid)]
+        return (
+            np.array(quantities, dtype=np.int64).reshape(values.shape),
+            np.array(valid, dtype=bool).reshape(values.shape),
+        )
+    return np.zeros(values.shape, dtype=np.int64), np.zeros(values.shape, dtype=bool)
+
+def calculate_sales_and_commission_cents_batch(hosts_sold, monitors_sold, peripherals_sold):
+    """
+    以整数分为单位批量计算销售额和佣金（定点模式）。
+
+    单价为整数元、佣金比例为整数百分比，因此 销售额(元) × 百分比 恰好就是佣金的分数，
+    整个计算没有舍入，与按十进制精确计算的结果完全一致。
+
+    Args:
+        hosts_sold, monitors_sold, peripherals_sold (array-like of int): 各产品销量。
+
+    Returns:
+        dict: 列式结果：'valid' 为输入是否合法（校验规则同 calculate_sales_and_commission，
+              bool 按整数处理，浮点数组整体视为非法，object 数组逐个判断），
+              'sales_cents'、'commission_cents' 为 int64 分，非法输入处为 0。
+    """
+    hosts, monitors, peripherals = np.broadcast_arrays(
+        np.asarray(hosts_sold), np.asarray(monitors_sold), np.asarray(peripherals_sold)
+    )
+    hosts, hosts_ok = _as_quantity_column(hosts, 1, MAX_HOSTS_PER_MONTH)
+    monitors, monitors_ok = _as_quantity_column(monitors, 1, MAX_MONITORS_PER_MONTH)
+    peripherals, peripherals_ok = _as_quantity_column(peripherals, 0, MAX_PERIPHERALS_PER_MONTH)
+    valid = hosts_ok & monitors_ok & peripherals_ok
+    sales = np.where(
+        valid, hosts * HOST_PRICE + monitors * MONITOR_PRICE + peripherals * PERIPHERAL_PRICE, 0,
+    )
+
+    percent = COMMISSION_PERCENTS[np.searchsorted(COMMISSION_BREAKPOINTS, sales, side='left')]
+    return {
+        'valid': valid,
+        'sales_cents': sales * CENTS_PER_UNIT,
+        'commission_cents': sales * percent,
+    }
+
+# ====================================================================
+# 预计算查找表：合法输入域只有 70×80×91 种组合，一次算完后每次查询只需一次下标访问
+# ====================================================================
+
+CommissionTable = namedtuple('CommissionTable', [
+    'sales_cents',                # int32[70, 80, 91]，下标为 (hosts - 1, monitors - 1, peripherals)
+    'commission_cents',           # int32[70, 80, 91]，下标同上
+    'combos',                     # int16[N, 3]，全部合法组合 (hosts, monitors, peripherals)，按扁平下标排列
+    'order_by_sales',             # 按销售额升序排列的组合下标
+    'sorted_sales_cents',         # sales_cents 按上述顺序展开
+    'order_by_commission',        # 按佣金升序排列的组合下标
+    'sorted_commission_cents',    # commission_cents 按上述顺序展开
+    'build_seconds',              # 构建耗时
+])
+
+@lru_cache(maxsize=None)
+def get_commission_table():
+    """构建并缓存全部合法输入的销售额/佣金查找表（首次调用时构建）。"""
+    start = time.perf_counter()
+    hosts, monitors, peripherals = np.meshgrid(
+        np.arange(1, MAX_HOSTS_PER_MONTH + 1),
+        np.arange(1, MAX_MONITORS_PER_MONTH + 1),
+        np.arange(0, MAX_PERIPHERALS_PER_MONTH + 1),
+        indexing='ij',
+    )
+    result = calculate_sales_and_commission_cents_batch(hosts, monitors, peripherals)
+    sales = result['sales_cents'].astype(np.int32)
+    commission = result['commission_cents'].astype(np.int32)
+    order_by_sales = np.argsort(sales, axis=None, kind='stable').astype(np.int32)
+    order_by_commission = np.argsort(commission, axis=None, kind='stable').astype(np.int32)
+    return CommissionTable(
+        sales_cents=sales,
+        commission_cents=commission,
+        combos=np.stack([hosts.ravel(), monitors.ravel(), peripherals.ravel()], axis=1).astype(np.int16),
+        order_by_sales=order_by_sales,
+        sorted_sales_cents=sales.ravel()[order_by_sales],
+        order_by_commission=order_by_commission,
+        sorted_commission_cents=commission.ravel()[order_by_commission],
+        build_seconds=time.perf_counter() - start,
+    )
+
+def commission_table_nbytes(table=None):
+    """查找表占用的内存字节数。"""
+    table = table or get_commission_table()
+    return sum(field.nbytes for field in table if isinstance(field, np.ndarray))
+
+def lookup_sales_and_commission(hosts_sold, monitors_sold, peripherals_sold):
+    """
+    查表版的 calculate_sales_and_commission，返回结构和结果与其完全一致。
+    """
+    values = (hosts_sold, monitors_sold, peripherals_sold)
+    if not (all(isinstance(val, int) for val in values)
+            and 1 <= hosts_sold <= MAX_HOSTS_PER_MONTH
+            and 1 <= monitors_sold <= MAX_MONITORS_PER_MONTH
+            and 0 <= peripherals_sold <= MAX_PERIPHERALS_PER_MONTH):
+        return {
+            'status': 'error',
+            'sales': 0,
+            'commission': 0,
+            'message': '非法输入'
+        }
+    table = get_commission_table()
+    # bool 是 int 的子类，先转为普通整数，否则会被 numpy 当作布尔下标
+    index = (int(hosts_sold) - 1, int(monitors_sold) - 1, int(peripherals_sold))
+    return {
+        'status': 'success',
+        'sales': table.sales_cents.item(index) // CENTS_PER_UNIT,
+        'commission': table.commission_cents.item(index) / CENTS_PER_UNIT,
+        'message': '计算成功'
+    }
+
+def _combos_in_range(order, sorted_cents, low_cents, high_cents):
+    table = get_commission_table()
+    start = np.searchsorted(sorted_cents, low_cents, side='left')
+    stop = np.searchsorted(sorted_cents, high_cents, side='right')
+    return table.combos[order[start:stop]]
+
+def find_combos_by_commission(low, high):
+    """
+    返回佣金在 [low, high] 元之间的全部组合，int16[N, 3]，每行为 (hosts, monitors, peripherals)，按佣金升序。
+    """
+    table = get_commission_table()
+    return _combos_in_range(
+        table.order_by_commission, table.sorted_commission_cents,
+        int(np.ceil(low * CENTS_PER_UNIT - 1e-6)), int(np.floor(high * CENTS_PER_UNIT + 1e-6)),
+    )
+
+def find_combos_by_sales(sales, sales_high=None):
+    """
+    返回销售额恰好为 sales 元（或在 [sales, sales_high] 元之间）的全部组合，格式同 find_combos_by_commission。
+    """
+    table = get_commission_table()
+    high = sales if sales_high is None else sales_high
+    return _combos_in_range(
+        table.order_by_sales, table.sorted_sales_cents,
+        int(np.ceil(sales * CENTS_PER_UNIT - 1e-6)), int(np.floor(high * CENTS_PER_UNIT + 1e-6)),
+    )
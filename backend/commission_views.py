@@ -0,0 +1,81 @@
+"""佣金计算接口。"""
+from flask import jsonify, request
+
+from commission import calculate_sales_and_commission
+from metrics import business_timer
+from view_helpers import bulk_response, cached_runner_response
+
+def run_commission_tests():
+    return cached_runner_response('commission_bva', calculate_sales_and_commission, run_commission_case, with_pass_rate=False)
+
+def run_commission_case(case):
+    hosts, monitors, peripherals = case['hosts_sold'], case['monitors_sold'], case['peripherals_sold']
+    result_data = calculate_sales_and_commission(hosts, monitors, peripherals)
+    
+    passed = False
+    if result_data['status'] == 'error':
+        passed = case.get('expected_status') == 'error'
+    else: # success case
+        if 'expected_sales' in case and 'expected_commission' in case:
+            sales_match = result_data['sales'] == case['expected_sales']
+            commission_match = result_data['commission'] == case['expected_commission']
+            passed = sales_match and commission_match
+
+    row = {
+        'id': case['id'],
+        'hosts_sold': hosts,
+        'monitors_sold': monitors,
+        'peripherals_sold': peripherals,
+        'expected_status': case.get('expected_status', 'success'),
+        'expected_sales': case.get('expected_sales'),
+        'expected_commission': case.get('expected_commission'),
+        'output_status': result_data['status'],
+        'output_sales': result_data.get('sales', 0),
+        'output_commission': result_data.get('commission', 0),
+        'output_message': result_data.get('message', ''),
+        'description': case.get('description', ''),
+        'passed': passed
+    }
+    return row, passed
+
+
+def parse_commission_input(data):
+    """Returns ((hosts, monitors, peripherals), None) for a valid custom input, or (None, error message)."""
+    if not data or not isinstance(data, dict):
+        return None, "Invalid input"
+        
+    try:
+        hosts = int(data.get('hosts', 0))
+        monitors = int(data.get('monitors', 0))
+        peripherals = int(data.get('peripherals', 0))
+    except (ValueError, TypeError, OverflowError):
+        return None, "Inputs must be integers"
+    return (hosts, monitors, peripherals), None
+
+def compute_commission_output(hosts, monitors, peripherals):
+    result_data = calculate_sales_and_commission(hosts, monitors, peripherals)
+    
+    # Add original inputs to the response for clarity
+    result_data['hosts_sold'] = hosts
+    result_data['monitors_sold'] = monitors
+    result_data['peripherals_sold'] = peripherals
+    return result_data
+
+def run_commission_custom():
+    inputs, error = parse_commission_input(request.get_json())
+    if error:
+        return jsonify({"error": error}), 400
+
+    with business_timer():
+        result_data = compute_commission_output(*inputs)
+
+    if result_data['status'] == 'error':
+         return jsonify(result_data), 400 # Return 400 on logical error
+    
+    return jsonify(result_data)
+
+def run_commission_custom_bulk():
+    return bulk_response(
+        parse_commission_input,
+        lambda inputs: [compute_commission_output(*args) for args in inputs],
+    )
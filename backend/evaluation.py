@@ -1,3 +1,15 @@
+import numpy as np
+
+# 分段查表用的常量：np.digitize 返回的档位下标直接索引得分表
+SALES_BREAKPOINTS = np.array([200, 300, 400, 500])
+BASE_SCORES = np.array([1, 2, 3, 4, 5], dtype=np.int8)
+LEAVE_BREAKPOINTS = np.array([10, 15])
+LEAVE_PENALTIES = np.array([0, 1, 2], dtype=np.int8)
+HOURS_BONUS_THRESHOLD = 20
+BONUS_LEVEL = 1
+MIN_SCORE = 1
+MAX_SCORE = 5
+
 def calculate_employee_score(sales, work_hours, leaves, level):
     """
     根据给定的公式计算员工的考评等级分数。
@@ -60,3 +72,29 @@ def calculate_employee_score(sales, work_hours, leaves, level):
     final_score = max(1, min(raw_score, 5))
 
     return final_score
+
+def calculate_employee_score_batch(sales, work_hours, leaves, level):
+    """
+    批量计算员工考评分数（calculate_employee_score 的向量化版本）。
+
+    Args:
+        sales, work_hours, leaves, level (array-like): 与 calculate_employee_score 同名参数对应的等长数组。
+
+    Returns:
+        numpy.ndarray: int8 得分数组（范围 1-5），与逐个调用 calculate_employee_score 的结果逐元素一致。
+    """
+    sales, work_hours, leaves, level = np.broadcast_arrays(
+        np.asarray(sales), np.asarray(work_hours), np.asarray(leaves), np.asarray(level)
+    )
+
+    # NaN 销售额在标量版本中落入 else 分支得 5 分，np.digitize 同样把 NaN 排在最后一档
+    base_score = BASE_SCORES[np.digitize(sales, SALES_BREAKPOINTS)]
+    hours_bonus = (work_hours >= HOURS_BONUS_THRESHOLD).astype(np.int8)
+    # NaN 与任何数比较均为 False，标量版本不扣分；digitize 会把 NaN 归入最高档，需单独排除
+    leaves_penalty = np.where(
+        leaves >= LEAVE_BREAKPOINTS[0], LEAVE_PENALTIES[np.digitize(leaves, LEAVE_BREAKPOINTS)], 0
+    ).astype(np.int8)
+    level_bonus = (level == BONUS_LEVEL).astype(np.int8)
+
+    raw_score = base_score + hours_bonus - leaves_penalty + level_bonus
+    return np.clip(raw_score, MIN_SCORE, MAX_SCORE).astype(np.int8)
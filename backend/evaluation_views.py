@@ -0,0 +1,71 @@
+"""销售人员考评接口。"""
+from flask import jsonify, request
+
+from evaluation import calculate_employee_score
+from metrics import business_timer
+from view_helpers import bulk_response, cached_runner_response
+
+def run_evaluation_tests():
+    # Only BVA (Boundary Value Analysis) is supported for now
+    return cached_runner_response('evaluation_bva', calculate_employee_score, run_evaluation_case, with_pass_rate=False)
+
+def run_evaluation_case(case):
+    actual_score = calculate_employee_score(
+        sales=case['sales'],
+        work_hours=case['work_hours'],
+        leaves=case['leaves'],
+        level=case['level']
+    )
+    row = {
+        'id': case['id'],
+        'sales': case['sales'],
+        'work_hours': case['work_hours'],
+        'leaves': case['leaves'],
+        'level': case['level'],
+        'expected': case['expected'],
+        'output_score': actual_score,
+        'description': case.get('description', '')
+    }
+    return row, actual_score == case['expected']
+
+def parse_evaluation_input(data):
+    """Returns ((sales, work_hours, leaves, level), None) for a valid custom input, or (None, error message)."""
+    if not data or not isinstance(data, dict):
+        return None, "Invalid input"
+        
+    sales = data.get('sales', 0)
+    work_hours = data.get('work_hours', 0)
+    leaves = data.get('leaves', 0)
+    level = data.get('level', 0)
+    
+    if not all(isinstance(val, (int, float)) for val in [sales, work_hours, leaves, level]):
+        return None, "Inputs must be numeric"
+    return (sales, work_hours, leaves, level), None
+
+def compute_evaluation_output(sales, work_hours, leaves, level):
+    actual_score = calculate_employee_score(sales, work_hours, leaves, level)
+    return {
+        'sales': sales,
+        'work_hours': work_hours,
+        'leaves': leaves,
+        'level': level,
+        'output_score': actual_score
+    }
+
+def run_evaluation_custom():
+    inputs, error = parse_evaluation_input(request.get_json())
+    if error:
+        return jsonify({"error": error}), 400
+    
+    try:
+        with business_timer():
+            output = compute_evaluation_output(*inputs)
+        return jsonify(output)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+def run_evaluation_custom_bulk():
+    return bulk_response(
+        parse_evaluation_input,
+        lambda inputs: [compute_evaluation_output(*args) for args in inputs],
+    )
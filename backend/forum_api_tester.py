@@ -0,0 +1,420 @@
+"""
+论坛后端接口的并发健康检查。
+
+对 FORUM_ENDPOINTS 中的每个接口向 base_url 发起真实请求（可重复多次），
+所有请求由 asyncio 并发调度，经由一个 keep-alive 连接池发出，连接数即并发上限。
+（HTTP 收发使用标准库 http.client，在连接池自带的线程池中执行：
+backend/calendar.py 会遮蔽标准库 calendar 模块，aiohttp 等第三方客户端在此目录下无法导入。）
+结果结构与 /api/run-forum-tests 原先返回的 {test_info, test_results} 相同，
+另外附带每个接口及整体的响应时间分位数。
+
+    python forum_api_tester.py [--base-url http://localhost:7010] [--repeat 20] [--concurrency 10]
+    python forum_api_tester.py --load --duration 30 [--concurrency 20 | --rate 200]
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+
+import numpy as np
+
+DEFAULT_BASE_URL = os.environ.get('FORUM_BASE_URL', 'http://localhost:7010')
+DEFAULT_CONCURRENCY = 10
+DEFAULT_TIMEOUT = 10
+PERCENTILES = (50, 95, 99)
+
+# 与原 curl 测试脚本的退出码含义保持一致：7 为无法连接，28 为超时
+CURL_OK = 0
+CURL_COULDNT_CONNECT = 7
+CURL_TIMEOUT = 28
+
+FORUM_ENDPOINTS = {
+    'ArticleController_getList': {
+        'method': 'GET',
+        'path': '/api/bbs/article/getList',
+        'description': '获取文章列表',
+        'input_data': {'currentPage': 1, 'pageSize': 10, 'title': '', 'labelId': None},
+    },
+    'SlideshowController_getList': {
+        'method': 'GET',
+        'path': '/api/bbs/carousel/getList',
+        'description': '获取轮播图列表',
+        'input_data': {},
+    },
+    'ArticleController_getArticleCommentVisitTotal': {
+        'method': 'GET',
+        'path': '/api/bbs/article/getArticleCommentVisitTotal',
+        'description': '获取文章评论访问总数',
+        'input_data': {},
+    },
+    'ArticleController_getById': {
+        'method': 'GET',
+        'path': '/api/bbs/article/getById',
+        'description': '获取文章详情',
+        'input_data': {'id': 1, 'isPv': True},
+    },
+    'LoginController_login': {
+        'method': 'POST',
+        'path': '/api/bbs/sso/login',
+        'description': '用户登录',
+        'input_data': {'username': 'testuser', 'password': '123456'},
+    },
+}
+
+def format_time(timestamp):
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+def latency_percentiles(samples):
+    """返回 {'p50': ..., 'p95': ..., 'p99': ...}（秒，浮点数）；没有样本时各值为 None。"""
+    if not samples:
+        return {f'p{p}': None for p in PERCENTILES}
+    values = np.percentile(samples, PERCENTILES)
+    return {f'p{p}': round(float(value), 6) for p, value in zip(PERCENTILES, values)}
+
+def response_time_percentiles(samples):
+    """同 latency_percentiles，但格式化为保留 6 位小数的字符串，与 response_time 字段一致；没有样本时为 None。"""
+    if not samples:
+        return None
+    return {key: f"{value:.6f}" for key, value in latency_percentiles(samples).items()}
+
+def _query_params(input_data):
+    """GET 参数：丢弃 None，布尔值转为 true/false。"""
+    return {
+        key: str(value).lower() if isinstance(value, bool) else value
+        for key, value in input_data.items()
+        if value is not None
+    }
+
+class ConnectionPool:
+    """
+    面向单个 base_url 的 HTTP keep-alive 连接池。
+    最多同时使用 size 个连接；空闲连接放回队列复用，请求在池内的线程中同步收发，
+    因此 response_time 只包含网络往返，不包含事件循环调度的等待。
+    """
+    def __init__(self, base_url, size=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT):
+        parts = urlsplit(base_url)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self.slots = asyncio.Semaphore(size)
+        self.idle = []
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='forum-api')
+
+    def _send(self, connection, method, path, body, headers):
+        start = time.perf_counter()
+        connection.request(method, self.prefix + path, body=body, headers=headers)
+        response = connection.getresponse()
+        data = response.read()
+        elapsed = time.perf_counter() - start
+        if response.will_close:
+            connection.close()
+        return response.status, response.reason, data, elapsed
+
+    async def request(self, method, path, body=None, headers=None):
+        """发送请求，返回 (status, reason, body_bytes, elapsed_seconds)。"""
+        loop = asyncio.get_running_loop()
+        async with self.slots:
+            reused = bool(self.idle)
+            connection = self.idle.pop() if reused else self.connection_class(self.host, self.port, timeout=self.timeout)
+            try:
+                result = await loop.run_in_executor(self.executor, self._send, connection, method, path, body, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if not reused:
+                    raise
+                # 服务端可能已关闭空闲的 keep-alive 连接，换一个新连接重试一次
+                connection = self.connection_class(self.host, self.port, timeout=self.timeout)
+                try:
+                    result = await loop.run_in_executor(
+                        self.executor, self._send, connection, method, path, body, headers,
+                    )
+                except BaseException:
+                    connection.close()
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+            self.idle.append(connection)
+            return result
+
+    def close(self):
+        for connection in self.idle:
+            connection.close()
+        self.idle.clear()
+        self.executor.shutdown(wait=False)
+
+async def request_endpoint(pool, endpoint):
+    """
+    对接口发起一次请求。
+
+    Returns:
+        dict: {'http_code', 'status_message', 'response_body', 'response_time', 'curl_exit_code', 'finished_at'}
+    """
+    path, body, headers = endpoint['path'], None, {}
+    if endpoint['method'] == 'GET':
+        query = urlencode(_query_params(endpoint['input_data']))
+        if query:
+            path += '?' + query
+    else:
+        body = json.dumps(endpoint['input_data'], ensure_ascii=False).encode('utf-8')
+        headers['Content-Type'] = 'application/json'
+    start = time.perf_counter()
+    try:
+        status, reason, data, elapsed = await pool.request(endpoint['method'], path, body, headers)
+        return {
+            'http_code': str(status),
+            'status_message': '请求成功' if 200 <= status < 300 else f"HTTP {status} {reason}",
+            'response_body': data.decode('utf-8', errors='replace'),
+            'response_time': elapsed,
+            'curl_exit_code': CURL_OK,
+            'finished_at': time.time(),
+        }
+    except TimeoutError:
+        exit_code, message = CURL_TIMEOUT, '请求超时'
+    except (OSError, http.client.HTTPException) as e:
+        exit_code, message = CURL_COULDNT_CONNECT, f"请求失败: {e}"
+    return {
+        'http_code': '000',
+        'status_message': message,
+        'response_body': '',
+        'response_time': time.perf_counter() - start,
+        'curl_exit_code': exit_code,
+        'finished_at': time.time(),
+    }
+
+async def run_endpoint(pool, endpoint, repeat):
+    """重复请求同一接口 repeat 次，返回全部请求结果。"""
+    return await asyncio.gather(*(request_endpoint(pool, endpoint) for _ in range(repeat)))
+
+def build_endpoint_result(endpoint, attempts):
+    """把同一接口的多次请求汇总成原有的 result 结构；全部成功才算通过，展示最后一次的响应。"""
+    failed = [attempt for attempt in attempts if attempt['curl_exit_code'] != CURL_OK or not attempt['http_code'].startswith('2')]
+    shown = failed[0] if failed else attempts[-1]
+    samples = [attempt['response_time'] for attempt in attempts if attempt['curl_exit_code'] == CURL_OK]
+    return {
+        'status': 'failed' if failed else 'passed',
+        'http_code': shown['http_code'],
+        'status_message': shown['status_message'],
+        'response_time': f"{np.median(samples):.6f}" if samples else '0.000000',
+        'response_body': shown['response_body'],
+        'test_time': format_time(shown['finished_at']),
+        'curl_exit_code': shown['curl_exit_code'],
+        'api_info': {
+            'method': endpoint['method'],
+            'path': endpoint['path'],
+            'description': endpoint['description'],
+        },
+        'requests': len(attempts),
+        'failed_requests': len(failed),
+        'response_time_percentiles': response_time_percentiles(samples),
+    }
+
+async def run_forum_tests_async(base_url=DEFAULT_BASE_URL, endpoints=FORUM_ENDPOINTS, repeat=1,
+                                concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT):
+    started_at = time.time()
+    pool = ConnectionPool(base_url, concurrency, timeout)
+    names = list(endpoints)
+    try:
+        all_attempts = await asyncio.gather(*(run_endpoint(pool, endpoints[name], repeat) for name in names))
+    finally:
+        pool.close()
+
+    test_results = {
+        name: {
+            'input_data': endpoints[name]['input_data'],
+            'result': build_endpoint_result(endpoints[name], attempts),
+        }
+        for name, attempts in zip(names, all_attempts)
+    }
+    passed = sum(entry['result']['status'] == 'passed' for entry in test_results.values())
+    samples = [
+        attempt['response_time']
+        for attempts in all_attempts for attempt in attempts
+        if attempt['curl_exit_code'] == CURL_OK
+    ]
+    return {
+        'test_info': {
+            'test_time': format_time(started_at),
+            'base_url': base_url,
+            'total_tests': len(test_results),
+            'passed_tests': passed,
+            'failed_tests': len(test_results) - passed,
+            'success_rate': f"{round(passed / len(test_results) * 100) if test_results else 0}%",
+            'total_requests': sum(len(attempts) for attempts in all_attempts),
+            'duration': round(time.time() - started_at, 3),
+            'response_time_percentiles': response_time_percentiles(samples),
+        },
+        'test_results': test_results,
+    }
+
+def run_forum_tests(base_url=DEFAULT_BASE_URL, endpoints=FORUM_ENDPOINTS, repeat=1,
+                    concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT):
+    """run_forum_tests_async 的同步入口，在新的事件循环中执行。"""
+    return asyncio.run(run_forum_tests_async(base_url, endpoints, repeat, concurrency, timeout))
+
+# ====================================================================
+# 负载测试：在固定时长内按目标并发数或目标速率循环请求各接口
+# ====================================================================
+
+DEFAULT_LOAD_DURATION = 10
+DEFAULT_LOAD_WINDOW = 1.0
+
+def _is_failure(attempt):
+    return attempt['curl_exit_code'] != CURL_OK or not attempt['http_code'].startswith('2')
+
+async def _closed_loop(pool, endpoints, concurrency, deadline, record):
+    """并发模式：concurrency 个虚拟用户各自轮流请求各接口，上一请求完成后立即发出下一请求。"""
+    names = list(endpoints)
+
+    async def user(offset):
+        index = offset
+        while time.perf_counter() < deadline:
+            name = names[index % len(names)]
+            record(name, await request_endpoint(pool, endpoints[name]))
+            index += 1
+
+    await asyncio.gather(*(user(offset) for offset in range(concurrency)))
+
+async def _open_loop(pool, endpoints, rate, deadline, record):
+    """
+    速率模式：按固定间隔 1/rate 发出请求，不等待前面的请求完成；
+    连接池占满时请求在池外排队，排队时间不计入 response_time。
+    """
+    names = list(endpoints)
+    interval = 1 / rate
+    next_send = time.perf_counter()
+    tasks = []
+
+    async def send(name):
+        record(name, await request_endpoint(pool, endpoints[name]))
+
+    index = 0
+    while next_send < deadline:
+        await asyncio.sleep(max(next_send - time.perf_counter(), 0))
+        tasks.append(asyncio.create_task(send(names[index % len(names)])))
+        index += 1
+        next_send += interval
+    await asyncio.gather(*tasks)
+
+def summarize_windows(samples, started_at, window, duration, seconds):
+    """
+    把请求样本按完成时刻分入长度为 window 秒的时间窗，返回列式时间序列，便于前端直接绘图：
+    {'time', 'requests', 'throughput', 'errors', 'error_rate', 'p50', 'p95', 'p99'}，每个键对应一个等长列表。
+
+    窗口按计划时长 duration 划分，不足半个窗口的尾段并入前一个窗口；
+    截止后才完成的请求计入最后一个窗口，其吞吐按实际覆盖的时长（到 seconds 为止）计算，
+    避免极短的尾窗口算出虚高的吞吐。
+    """
+    count = max(1, int(duration // window))
+    if duration - count * window >= window / 2:
+        count += 1
+    buckets = [[] for _ in range(count)]
+    for sample in samples:
+        buckets[min(int((sample['finished_at'] - started_at) // window), count - 1)].append(sample)
+    series = {key: [] for key in ('time', 'requests', 'throughput', 'errors', 'error_rate', 'p50', 'p95', 'p99')}
+    for index, bucket in enumerate(buckets):
+        errors = sum(sample['failed'] for sample in bucket)
+        percentiles = latency_percentiles([sample['response_time'] for sample in bucket if not sample['failed']])
+        length = window if index < count - 1 else max(seconds, duration) - index * window
+        series['time'].append(round(index * window, 3))
+        series['requests'].append(len(bucket))
+        series['throughput'].append(round(len(bucket) / length, 3))
+        series['errors'].append(errors)
+        series['error_rate'].append(round(errors / len(bucket), 4) if bucket else 0)
+        for key, value in percentiles.items():
+            series[key].append(value)
+    return series
+
+def _load_summary(samples, seconds):
+    errors = sum(sample['failed'] for sample in samples)
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': round(errors / len(samples), 4) if samples else 0,
+        'throughput': round(len(samples) / seconds, 3) if seconds > 0 else 0,
+        'latency': latency_percentiles([sample['response_time'] for sample in samples if not sample['failed']]),
+    }
+
+async def run_load_test_async(base_url=DEFAULT_BASE_URL, endpoints=FORUM_ENDPOINTS, duration=DEFAULT_LOAD_DURATION,
+                              concurrency=DEFAULT_CONCURRENCY, rate=None, window=DEFAULT_LOAD_WINDOW,
+                              timeout=DEFAULT_TIMEOUT):
+    """
+    在 duration 秒内对各接口施加负载。rate 为 None 时为并发模式（concurrency 个用户循环请求），
+    否则为速率模式（每秒发出 rate 个请求，最多 concurrency 个同时进行）。
+
+    Returns:
+        dict: {'load_info': 配置与整体统计, 'windows': summarize_windows 的时间序列, 'endpoints': 各接口统计}
+              延迟单位为秒，error_rate 为 0-1 的比例。
+    """
+    pool = ConnectionPool(base_url, concurrency, timeout)
+    samples = []
+    wall_started_at = time.time()
+    started_at = time.perf_counter()
+
+    def record(name, attempt):
+        samples.append({
+            'endpoint': name,
+            'response_time': attempt['response_time'],
+            'failed': _is_failure(attempt),
+            'finished_at': time.perf_counter(),
+        })
+
+    try:
+        deadline = started_at + duration
+        if rate is None:
+            await _closed_loop(pool, endpoints, concurrency, deadline, record)
+        else:
+            await _open_loop(pool, endpoints, rate, deadline, record)
+    finally:
+        pool.close()
+    seconds = time.perf_counter() - started_at
+
+    return {
+        'load_info': {
+            'test_time': format_time(wall_started_at),
+            'base_url': base_url,
+            'mode': 'concurrency' if rate is None else 'rate',
+            'concurrency': concurrency,
+            'target_rate': rate,
+            'duration': round(seconds, 3),
+            'window': window,
+            **_load_summary(samples, seconds),
+        },
+        'windows': summarize_windows(samples, started_at, window, duration, seconds),
+        'endpoints': {
+            name: _load_summary([sample for sample in samples if sample['endpoint'] == name], seconds)
+            for name in endpoints
+        },
+    }
+
+def run_load_test(base_url=DEFAULT_BASE_URL, endpoints=FORUM_ENDPOINTS, duration=DEFAULT_LOAD_DURATION,
+                  concurrency=DEFAULT_CONCURRENCY, rate=None, window=DEFAULT_LOAD_WINDOW, timeout=DEFAULT_TIMEOUT):
+    """run_load_test_async 的同步入口，在新的事件循环中执行。"""
+    return asyncio.run(run_load_test_async(base_url, endpoints, duration, concurrency, rate, window, timeout))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument('--load', action='store_true', help='负载测试模式')
+    parser.add_argument('--duration', type=float, default=DEFAULT_LOAD_DURATION, help='负载测试时长（秒）')
+    parser.add_argument('--rate', type=float, help='负载测试的目标速率（请求/秒），不指定则按 --concurrency 并发')
+    parser.add_argument('--window', type=float, default=DEFAULT_LOAD_WINDOW, help='统计时间窗长度（秒）')
+    args = parser.parse_args()
+    if args.load:
+        result = run_load_test(args.base_url, duration=args.duration, concurrency=args.concurrency,
+                               rate=args.rate, window=args.window, timeout=args.timeout)
+    else:
+        result = run_forum_tests(args.base_url, repeat=args.repeat, concurrency=args.concurrency, timeout=args.timeout)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
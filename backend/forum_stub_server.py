@@ -0,0 +1,83 @@
+"""
+论坛后端接口的本地桩服务器，用于离线运行 forum_api_tester。
+
+按路径返回固定的 JSON 响应，未知路径返回 404；可为每个请求增加固定延迟以模拟网络耗时。
+
+    python forum_stub_server.py [--port 7010] [--delay 0.01]
+    FORUM_BASE_URL=http://127.0.0.1:7010 python forum_api_tester.py
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+STUB_RESPONSES = {
+    ('GET', '/api/bbs/article/getList'): {'code': 0, 'desc': '成功', 'data': {'total': 0, 'list': []}},
+    ('GET', '/api/bbs/carousel/getList'): {'code': 0, 'desc': '成功', 'data': []},
+    ('GET', '/api/bbs/article/getArticleCommentVisitTotal'): {'code': 0, 'desc': '成功', 'data': {'article': 0, 'comment': 0, 'visit': 0}},
+    ('GET', '/api/bbs/article/getById'): {'code': 4, 'desc': '数据不存在', 'data': None},
+    ('POST', '/api/bbs/sso/login'): {'code': 0, 'desc': '成功', 'data': {'token': 'stub-token'}},
+}
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # 头部与响应体分两次写出，关闭 Nagle 算法以免与客户端的延迟确认叠加出约 40ms 的额外耗时
+    disable_nagle_algorithm = True
+    delay = 0.0
+
+    def _respond(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        if self.delay:
+            time.sleep(self.delay)
+        payload = STUB_RESPONSES.get((method, urlsplit(self.path).path))
+        status = 200 if payload is not None else 404
+        body = (json.dumps(payload if payload is not None else {'code': 404, 'desc': '接口不存在', 'data': None},
+                           ensure_ascii=False) + '\n').encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond('GET')
+
+    def do_POST(self):
+        self._respond('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub_server(host='127.0.0.1', port=0, delay=0.0):
+    """
+    在后台线程中启动桩服务器，port 为 0 时自动选择空闲端口。
+    返回 (server, base_url)，用完后调用 server.shutdown() 和 server.server_close()。
+    """
+    handler = type('ConfiguredStubHandler', (StubHandler,), {'delay': delay})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7010)
+    parser.add_argument('--delay', type=float, default=0.0, help='每个请求的固定延迟（秒）')
+    args = parser.parse_args()
+    handler = type('ConfiguredStubHandler', (StubHandler,), {'delay': args.delay})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"论坛桩服务器已启动: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
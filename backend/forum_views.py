@@ -0,0 +1,40 @@
+"""论坛接口测试与负载测试接口。"""
+from flask import jsonify, request
+
+from forum_api_tester import (
+    DEFAULT_CONCURRENCY, DEFAULT_LOAD_DURATION, DEFAULT_LOAD_WINDOW, run_forum_tests as run_forum_api_tests, run_load_test,
+)
+
+# Upper bounds for the forum API checker query parameters
+MAX_FORUM_REPEAT = 1000
+MAX_FORUM_CONCURRENCY = 100
+MAX_LOAD_DURATION = 120
+MAX_LOAD_RATE = 10000
+
+def run_forum_tests():
+    """Runs the forum API checks against FORUM_BASE_URL; ?repeat=N&concurrency=M sample each endpoint N times."""
+    repeat = request.args.get('repeat', 1, type=int)
+    concurrency = request.args.get('concurrency', DEFAULT_CONCURRENCY, type=int)
+    if not 1 <= repeat <= MAX_FORUM_REPEAT or not 1 <= concurrency <= MAX_FORUM_CONCURRENCY:
+        return jsonify({'error': f"repeat 须在 1-{MAX_FORUM_REPEAT} 之间，concurrency 须在 1-{MAX_FORUM_CONCURRENCY} 之间"}), 400
+    return jsonify(run_forum_api_tests(repeat=repeat, concurrency=concurrency))
+
+def run_forum_load_test():
+    """
+    Replays the forum API checks for ?duration seconds, either with ?concurrency
+    looping clients or at a fixed ?rate of requests per second, and returns
+    per-window throughput, latency percentiles and error rates.
+    """
+    duration = request.args.get('duration', DEFAULT_LOAD_DURATION, type=float)
+    concurrency = request.args.get('concurrency', DEFAULT_CONCURRENCY, type=int)
+    rate = request.args.get('rate', type=float)
+    window = request.args.get('window', DEFAULT_LOAD_WINDOW, type=float)
+    if not 0 < duration <= MAX_LOAD_DURATION:
+        return jsonify({'error': f"duration 须在 0-{MAX_LOAD_DURATION} 秒之间"}), 400
+    if not 1 <= concurrency <= MAX_FORUM_CONCURRENCY:
+        return jsonify({'error': f"concurrency 须在 1-{MAX_FORUM_CONCURRENCY} 之间"}), 400
+    if rate is not None and not 0 < rate <= MAX_LOAD_RATE:
+        return jsonify({'error': f"rate 须在 0-{MAX_LOAD_RATE} 之间"}), 400
+    if not 0 < window <= duration:
+        return jsonify({'error': 'window 须大于 0 且不超过 duration'}), 400
+    return jsonify(run_load_test(duration=duration, concurrency=concurrency, rate=rate, window=window))
@@ -0,0 +1,240 @@
+"""
+请求级指标，以 Prometheus 文本格式导出。
+
+每个请求记录：请求数（按路由、方法、状态码）、延迟直方图、请求体与响应体大小直方图，
+以及请求内各阶段（被测业务函数 business、JSON 编码 encode）的累计耗时。
+阶段耗时先累加在线程局部的当前请求上，请求结束时与其余指标一起在一次加锁内写入，
+因此每个请求只加一次锁，多线程下计数不会丢失。
+
+记录由 MetricsMiddleware 在 WSGI 层完成，应用只需在路由匹配后登记路由规则；
+响应体按实际发送的字节计数，流式响应在发送完毕（close）时才结束计时。
+
+指标保存在进程内；多进程部署时每个工作进程各自计数，抓取到的是处理该次抓取的进程的数据。
+"""
+import threading
+import time
+from bisect import bisect_left
+
+# 延迟直方图的桶上界（秒）
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# 请求体/响应体大小直方图的桶上界（字节）
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+BUSINESS_PHASE = 'business'
+ENCODE_PHASE = 'encode'
+
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 应用把匹配到的路由规则写在 WSGI environ 的这个键下，供 MetricsMiddleware 作为路由标签
+ROUTE_ENVIRON_KEY = 'metrics.route'
+UNMATCHED_ROUTE = 'unmatched'
+
+class Histogram:
+    """单个标签组合的直方图：各桶内计数（非累计）、观测值总和与观测次数。调用方负责加锁。"""
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class PhaseTimer:
+    """计时上下文管理器，把 with 块的耗时累加到当前请求的指定阶段上。"""
+    __slots__ = ('registry', 'phase', 'start')
+
+    def __init__(self, registry, phase):
+        self.registry = registry
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.registry.add_phase(self.phase, time.perf_counter() - self.start)
+        return False
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(names, values):
+    return ','.join(f'{name}="{_escape_label(value)}"' for name, value in zip(names, values))
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class RequestMetrics:
+    def __init__(self, latency_buckets=LATENCY_BUCKETS, size_buckets=SIZE_BUCKETS):
+        self.latency_buckets = latency_buckets
+        self.size_buckets = size_buckets
+        self.requests = {}           # (route, method, status) -> 请求数
+        self.latency = {}            # (route, method) -> Histogram
+        self.request_sizes = {}      # (route, method) -> Histogram
+        self.response_sizes = {}     # (route, method) -> Histogram
+        self.phases = {}             # (route, phase) -> 累计秒数
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def begin_request(self):
+        """开始记录当前线程上的请求，返回开始时间。"""
+        self.local.phases = {}
+        return time.perf_counter()
+
+    def add_phase(self, phase, seconds):
+        """把耗时累加到当前请求的阶段上；当前线程没有进行中的请求时忽略。"""
+        phases = getattr(self.local, 'phases', None)
+        if phases is not None:
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def timer(self, phase):
+        return PhaseTimer(self, phase)
+
+    def end_request(self, route, method, status, started_at, request_bytes=None, response_bytes=None):
+        """结束当前请求并写入全部指标；request_bytes / response_bytes 为 None 时不记录对应的大小直方图。"""
+        seconds = time.perf_counter() - started_at
+        phases = getattr(self.local, 'phases', None) or {}
+        self.local.phases = None
+        key = (route, method)
+        with self.lock:
+            status_key = (route, method, status)
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = Histogram(self.latency_buckets)
+            histogram.observe(seconds)
+            if request_bytes is not None:
+                histogram = self.request_sizes.get(key)
+                if histogram is None:
+                    histogram = self.request_sizes[key] = Histogram(self.size_buckets)
+                histogram.observe(request_bytes)
+            if response_bytes is not None:
+                histogram = self.response_sizes.get(key)
+                if histogram is None:
+                    histogram = self.response_sizes[key] = Histogram(self.size_buckets)
+                histogram.observe(response_bytes)
+            for phase, phase_seconds in phases.items():
+                phase_key = (route, phase)
+                self.phases[phase_key] = self.phases.get(phase_key, 0.0) + phase_seconds
+
+    def _snapshot(self):
+        with self.lock:
+            copy_histograms = lambda histograms: {
+                key: (histogram.bounds, list(histogram.counts), histogram.sum, histogram.count)
+                for key, histogram in histograms.items()
+            }
+            return (
+                dict(self.requests), copy_histograms(self.latency), copy_histograms(self.request_sizes),
+                copy_histograms(self.response_sizes), dict(self.phases),
+            )
+
+    def render(self):
+        """返回 Prometheus 文本格式（0.0.4）的全部指标。"""
+        requests, latency, request_sizes, response_sizes, phases = self._snapshot()
+        lines = [
+            '# HELP http_requests_total Number of HTTP requests handled.',
+            '# TYPE http_requests_total counter',
+        ]
+        for key, count in sorted(requests.items()):
+            lines.append(f'http_requests_total{{{_labels(("route", "method", "status"), key)}}} {count}')
+
+        for name, help_text, histograms in (
+            ('http_request_duration_seconds', 'HTTP request latency in seconds.', latency),
+            ('http_request_size_bytes', 'HTTP request body size in bytes.', request_sizes),
+            ('http_response_size_bytes', 'HTTP response body size in bytes.', response_sizes),
+        ):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for key, (bounds, counts, total, count) in sorted(histograms.items()):
+                labels = _labels(('route', 'method'), key)
+                cumulative = 0
+                for bound, bucket_count in zip(bounds, counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{labels},le="{_format_value(bound)}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+                lines.append(f'{name}_sum{{{labels}}} {_format_value(total)}')
+                lines.append(f'{name}_count{{{labels}}} {count}')
+
+        lines.append('# HELP http_request_phase_seconds_total Time spent in each request phase (business, encode).')
+        lines.append('# TYPE http_request_phase_seconds_total counter')
+        for key, total in sorted(phases.items()):
+            lines.append(f'http_request_phase_seconds_total{{{_labels(("route", "phase"), key)}}} {_format_value(total)}')
+        return '\n'.join(lines) + '\n'
+
+# 应用使用的默认注册表；各接口模块通过 business_timer / encode_timer 记录阶段耗时
+request_metrics = RequestMetrics()
+
+def business_timer():
+    """把 with 块计为当前请求的 business 阶段（调用被测模块）。"""
+    return request_metrics.timer(BUSINESS_PHASE)
+
+def encode_timer():
+    """把 with 块计为当前请求的 encode 阶段（序列化响应）。"""
+    return request_metrics.timer(ENCODE_PHASE)
+
+class _CountingBody:
+    """包装 WSGI 响应体：统计发送的字节数，并在服务器关闭响应时结束请求的记录。"""
+    __slots__ = ('body', 'iterator', 'on_close', 'size')
+
+    def __init__(self, body, on_close):
+        self.body = body
+        self.iterator = iter(body)
+        self.on_close = on_close
+        self.size = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = next(self.iterator)
+        self.size += len(chunk)
+        return chunk
+
+    def close(self):
+        try:
+            if hasattr(self.body, 'close'):
+                self.body.close()
+        finally:
+            self.on_close(self.size)
+
+class MetricsMiddleware:
+    """
+    WSGI 中间件，为每个请求写入 RequestMetrics。
+    路由标签取自 environ[ROUTE_ENVIRON_KEY]，由应用在路由匹配后写入匹配到的 URL 规则
+    （如 /api/system-test-runs/<run_id>）；未写入的请求记为 unmatched。
+    """
+    def __init__(self, wsgi_app, registry):
+        self.wsgi_app = wsgi_app
+        self.registry = registry
+
+    def __call__(self, environ, start_response):
+        registry = self.registry
+        started_at = registry.begin_request()
+        status = [500]
+
+        def recording_start_response(status_line, headers, exc_info=None):
+            status[0] = int(status_line[:3])
+            return start_response(status_line, headers, exc_info)
+
+        def finish(response_bytes):
+            content_length = environ.get('CONTENT_LENGTH')
+            registry.end_request(
+                environ.get(ROUTE_ENVIRON_KEY, UNMATCHED_ROUTE),
+                environ['REQUEST_METHOD'],
+                status[0],
+                started_at,
+                int(content_length) if content_length else None,
+                response_bytes,
+            )
+
+        try:
+            body = self.wsgi_app(environ, recording_start_response)
+        except BaseException:
+            finish(None)
+            raise
+        return _CountingBody(body, finish)
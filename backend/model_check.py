@@ -0,0 +1,215 @@
+"""
+业务函数的穷举模型检验。
+
+对每个业务函数枚举其整个有界输入域（含每个维度越界一格的取值），
+与按需求说明独立实现的参考预言（oracle）逐点比对，并把所有不一致的点
+合并成紧凑的多维区间报告出来。枚举按第一个维度切片后分发到进程池执行。
+
+    python model_check.py [triangle calendar commission telecom evaluation] [--workers N]
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import product
+
+from calendar import calculate_next_day
+from commission import calculate_sales_and_commission
+from evaluation import calculate_employee_score
+from telecom_billing import calculate_telecom_fee
+from triangle import triangle_type
+
+CENT = Decimal('0.01')
+
+
+# ====================================================================
+# 参考预言：直接由需求说明推导，不复用被测实现
+# ====================================================================
+
+def triangle_oracle(a, b, c):
+    small, middle, large = sorted((a, b, c))
+    if small <= 0 or small + middle <= large:
+        return '非三角形'
+    distinct = len({a, b, c})
+    if distinct == 1:
+        return '等边三角形'
+    if distinct == 2:
+        return '等腰三角形'
+    return '一般三角形'
+
+def calendar_oracle(year, month, day):
+    if not 1800 <= year <= 2200:
+        return '无效日期'
+    try:
+        next_date = datetime.date(year, month, day) + datetime.timedelta(days=1)
+    except ValueError:
+        return '无效日期'
+    if next_date.year > 2200:
+        return '无效日期'
+    return f"{next_date.year}.{next_date.month}.{next_date.day}"
+
+def commission_oracle(hosts, monitors, peripherals):
+    if not (1 <= hosts <= 70 and 1 <= monitors <= 80 and 0 <= peripherals <= 90):
+        return ('error', 0, 0)
+    sales = hosts * 25 + monitors * 30 + peripherals * 45
+    rate = Decimal('0.10') if sales <= 1000 else Decimal('0.15') if sales <= 1800 else Decimal('0.20')
+    return ('success', sales, float((sales * rate).quantize(CENT, ROUND_HALF_UP)))
+
+def telecom_oracle(call_minutes, late_payments):
+    if call_minutes < 0 or late_payments < 0:
+        return ('error', None)
+    # (通话分钟上限, 允许欠费次数, 折扣率)
+    tiers = [(0, 0, '0'), (60, 1, '0.01'), (120, 2, '0.015'), (180, 3, '0.02'), (300, 3, '0.025')]
+    allowed, rate = 6, Decimal('0.03')
+    for upper, tier_allowed, tier_rate in tiers:
+        if call_minutes <= upper:
+            allowed, rate = tier_allowed, Decimal(tier_rate)
+            break
+    if late_payments > allowed:
+        rate = Decimal(0)
+    raw_fee = call_minutes * Decimal('0.15')
+    total = Decimal(25) + raw_fee - raw_fee * rate
+    return ('success', float(total.quantize(CENT, ROUND_HALF_UP)))
+
+def evaluation_oracle(sales, work_hours, leaves, level):
+    base = min(max(sales // 100, 1), 5)
+    penalty = 2 if leaves >= 15 else 1 if leaves >= 10 else 0
+    score = base + (work_hours >= 20) - penalty + (level == 1)
+    return min(max(score, 1), 5)
+
+
+# ====================================================================
+# 检验规格
+# ====================================================================
+
+Check = namedtuple('Check', ['function', 'oracle', 'project', 'domain'])
+
+CHECKS = {
+    'triangle': Check(
+        function=triangle_type,
+        oracle=triangle_oracle,
+        project=lambda result: result,
+        domain=(range(0, 102), range(0, 102), range(0, 102)),
+    ),
+    'calendar': Check(
+        function=calculate_next_day,
+        oracle=calendar_oracle,
+        project=lambda result: result,
+        domain=(range(1799, 2202), range(0, 14), range(0, 33)),
+    ),
+    'commission': Check(
+        function=calculate_sales_and_commission,
+        oracle=commission_oracle,
+        project=lambda result: (result['status'], result['sales'], result['commission']),
+        domain=(range(0, 72), range(0, 82), range(-1, 92)),
+    ),
+    'telecom': Check(
+        function=calculate_telecom_fee,
+        oracle=telecom_oracle,
+        project=lambda result: (result['status'], result.get('total_fee')),
+        domain=(range(-1, 601), range(-1, 13)),
+    ),
+    'evaluation': Check(
+        function=calculate_employee_score,
+        oracle=evaluation_oracle,
+        project=lambda result: result,
+        domain=(range(0, 601), range(0, 41), range(0, 21), range(0, 6)),
+    ),
+}
+
+
+# ====================================================================
+# 枚举与区间合并
+# ====================================================================
+
+def check_slice(name, first):
+    """
+    在工作进程中检验第一个维度取值为 first 的整个子域。
+    返回 (检验点数, 不一致点列表)，每个不一致点为 (输入, 实际结果, 预言结果)。
+    """
+    check = CHECKS[name]
+    mismatches = []
+    count = 0
+    for rest in product(*check.domain[1:]):
+        args = (first,) + rest
+        actual = check.project(check.function(*args))
+        expected = check.oracle(*args)
+        count += 1
+        if actual != expected:
+            mismatches.append((args, actual, expected))
+    return count, mismatches
+
+def merge_regions(mismatches):
+    """
+    将不一致点合并为多维闭区间。实际结果和预言结果不同的点不会被合并到同一区间。
+    返回 [(区间, 点数, 示例)]，区间为每个维度的 (下界, 上界)。
+    """
+    regions = [
+        ([(value, value) for value in args], 1, (args, actual, expected))
+        for args, actual, expected in mismatches
+    ]
+    if not regions:
+        return []
+    for axis in reversed(range(len(regions[0][0]))):
+        def key(region):
+            bounds, _, (_, actual, expected) = region
+            return (repr(actual), repr(expected), bounds[:axis], bounds[axis + 1:], bounds[axis][0])
+        merged = []
+        for region in sorted(regions, key=key):
+            if merged:
+                last = merged[-1]
+                if key(last)[:4] == key(region)[:4] and last[0][axis][1] + 1 == region[0][axis][0]:
+                    bounds = list(last[0])
+                    bounds[axis] = (last[0][axis][0], region[0][axis][1])
+                    merged[-1] = (bounds, last[1] + region[1], last[2])
+                    continue
+            merged.append(region)
+        regions = merged
+    return sorted(regions, key=lambda region: region[0])
+
+def run_check(name, executor):
+    check = CHECKS[name]
+    start = time.perf_counter()
+    total = 0
+    mismatches = []
+    firsts = list(check.domain[0])
+    for count, found in executor.map(check_slice, [name] * len(firsts), firsts):
+        total += count
+        mismatches.extend(found)
+    return {
+        'name': name,
+        'points': total,
+        'mismatches': len(mismatches),
+        'regions': merge_regions(mismatches),
+        'seconds': time.perf_counter() - start,
+    }
+
+def format_region(bounds):
+    return ' × '.join(f"{low}" if low == high else f"{low}..{high}" for low, high in bounds)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('names', nargs='*', metavar='name', help=f"要检验的函数，默认全部：{', '.join(CHECKS)}")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in CHECKS]
+    if unknown:
+        parser.error(f"未知的检验项: {', '.join(unknown)}")
+
+    failed = False
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for name in args.names or list(CHECKS):
+            result = run_check(name, executor)
+            print(f"[{name}] {result['points']} 点, {result['mismatches']} 处不一致, "
+                  f"{len(result['regions'])} 个区间, 耗时 {result['seconds']:.2f}s")
+            for bounds, count, (example, actual, expected) in result['regions']:
+                print(f"    {format_region(bounds)}  ({count} 点)  例 {example}: 实际 {actual!r}, 预期 {expected!r}")
+            failed = failed or result['mismatches'] > 0
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
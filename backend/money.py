@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+定点金额（整数分）工具。
+
+金额在计算过程中一律以整数分表示，比例以万分之一（基点）表示，
+只在最终展示时才换算回元。整数运算没有二进制浮点误差，
+可以整列向量化计算并直接做相等比较。
+"""
+CENTS_PER_UNIT = 100
+BASIS_POINTS = 10000
+
+def divide_half_up(numerator, denominator):
+    """
+    非负整数（或整数数组）除法，结果按 ROUND_HALF_UP 舍入到整数。
+    与 Decimal 的 quantize(..., ROUND_HALF_UP) 结果一致。
+    """
+    return (numerator * 2 + denominator) // (denominator * 2)
+
+def to_cents(amount):
+    """把最多两位小数的金额（元）换算为整数分。"""
+    return int(round(amount * CENTS_PER_UNIT))
+
+def cents_to_amount(cents):
+    """把整数分（或整数分数组）换算回元，结果是最接近该两位小数的浮点数。"""
+    return cents / CENTS_PER_UNIT
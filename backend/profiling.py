@@ -0,0 +1,154 @@
+"""
+单个请求的性能剖析，结果输出为火焰图工具（flamegraph.pl、speedscope 等）可读的折叠栈文本：
+每行为 "外层帧;...;内层帧 数值"。
+
+两种方式：
+- sample：后台线程每隔 interval 秒读取一次目标线程的调用栈，数值为采样次数，开销小，
+  但短于采样间隔的调用可能采不到；
+- trace：用 sys.setprofile 记录当前线程的每次函数调用与返回（含 C 函数），
+  数值为各栈的自身耗时（微秒），结果精确但会显著拖慢被剖析的代码。
+
+剖析结果按请求 id 保存在进程内，最多保留 max_entries 个，最早的先淘汰。
+"""
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+
+SAMPLE_MODE = 'sample'
+TRACE_MODE = 'trace'
+PROFILE_MODES = (SAMPLE_MODE, TRACE_MODE)
+
+DEFAULT_SAMPLE_INTERVAL = 0.001
+DEFAULT_MAX_PROFILES = 32
+
+# 被剖析的请求在 WSGI environ 的这个键下记录剖析方式，结果缓存据此改为重新执行
+PROFILE_ENVIRON_KEY = 'profiling.mode'
+
+def _code_name(code):
+    # 折叠栈以分号分隔帧，名称中不能出现分号
+    # co_qualname 自 Python 3.11 起提供
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(';', ':')
+
+def _builtin_name(function):
+    module = getattr(function, '__module__', None)
+    name = getattr(function, '__qualname__', None) or getattr(function, '__name__', repr(function))
+    return (f"{module}.{name}" if module else name).replace(';', ':')
+
+def _frame_stack(frame):
+    """从最外层到 frame 的帧名称列表。"""
+    names = []
+    while frame is not None:
+        names.append(_code_name(frame.f_code))
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+class StackSampler:
+    """定时采样指定线程（默认当前线程）的调用栈，stacks 为 {帧名称元组: 采样次数}。"""
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[tuple(_frame_stack(frame))] += 1
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+        return False
+
+class StackTracer:
+    """确定性剖析当前线程，stacks 为 {帧名称元组: 自身耗时（微秒）}。"""
+    def __init__(self):
+        self.stacks = Counter()
+        self.stack = []
+        self.last = 0.0
+
+    def _profile(self, frame, event, arg):
+        now = time.perf_counter()
+        if self.stack:
+            self.stacks[tuple(self.stack)] += (now - self.last) * 1e6
+        if event == 'call':
+            self.stack.append(_code_name(frame.f_code))
+        elif event == 'c_call':
+            self.stack.append(_builtin_name(arg))
+        elif self.stack:
+            # return / c_return / c_exception
+            self.stack.pop()
+        self.last = time.perf_counter()
+
+    def __enter__(self):
+        # 以当前调用栈为根（含 __enter__ 自身，其返回事件会先把它弹出），剖析期间从这些帧返回时逐层弹出
+        self.stack = _frame_stack(sys._getframe())
+        self.last = time.perf_counter()
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.setprofile(None)
+        self.stacks = Counter({stack: round(value) for stack, value in self.stacks.items() if round(value) > 0})
+        return False
+
+def make_profiler(mode, interval=DEFAULT_SAMPLE_INTERVAL):
+    if mode == SAMPLE_MODE:
+        return StackSampler(interval)
+    if mode == TRACE_MODE:
+        return StackTracer()
+    raise ValueError(f"不支持的剖析方式: {mode}，可选: {', '.join(PROFILE_MODES)}")
+
+def collapse_stacks(stacks):
+    """把 {帧名称元组: 数值} 转换为折叠栈文本，按数值从大到小排列。"""
+    return ''.join(
+        f"{';'.join(stack)} {value}\n"
+        for stack, value in sorted(stacks.items(), key=lambda item: (-item[1], item[0]))
+    )
+
+class ProfileStore:
+    def __init__(self, max_entries=DEFAULT_MAX_PROFILES):
+        self.max_entries = max_entries
+        self.profiles = OrderedDict()
+        self.lock = threading.Lock()
+
+    def add(self, route, mode, seconds, stacks):
+        """保存一次剖析结果，返回新分配的请求 id。"""
+        profile_id = uuid.uuid4().hex
+        profile = {
+            'id': profile_id,
+            'route': route,
+            'mode': mode,
+            'created_at': time.time(),
+            'duration': round(seconds, 6),
+            'collapsed': collapse_stacks(stacks),
+        }
+        with self.lock:
+            self.profiles[profile_id] = profile
+            while len(self.profiles) > self.max_entries:
+                self.profiles.popitem(last=False)
+        return profile_id
+
+    def get(self, profile_id):
+        with self.lock:
+            return self.profiles.get(profile_id)
+
+    def list(self):
+        """返回全部剖析结果的摘要（不含折叠栈），最新的在前。"""
+        with self.lock:
+            profiles = list(self.profiles.values())
+        return [
+            {key: value for key, value in profile.items() if key != 'collapsed'}
+            for profile in reversed(profiles)
+        ]
@@ -0,0 +1,74 @@
+"""
+测试运行结果的响应缓存。
+
+/run-*-tests 的结果只取决于用例集内容、被测模块及其依赖的源代码、执行用例的代码
+和生成响应体的代码，因此以这些内容的摘要作为键（同时也作为 ETag），把序列化后的响应体缓存起来；
+按最近最少使用（LRU）淘汰，条目数有上限。
+"""
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+DEFAULT_MAX_ENTRIES = 64
+
+@lru_cache(maxsize=None)
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def source_digest(obj):
+    """返回对象（函数或模块）所在源文件内容的 SHA-256；同一进程内源代码不会变化，结果按文件缓存。"""
+    return _file_digest(inspect.getsourcefile(obj))
+
+def make_etag(*parts):
+    """由若干字符串生成强 ETag 值（不含引号）。"""
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()[:32]
+
+class ResponseCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """返回缓存的值并记为最近使用；不存在时返回 None。同时更新命中/未命中计数。"""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def record_not_modified(self):
+        with self.lock:
+            self.not_modified += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'notModified': self.not_modified,
+                'hitRate': round(self.hits / lookups * 100, 2) if lookups else 0,
+                'size': len(self.entries),
+                'maxEntries': self.max_entries,
+            }
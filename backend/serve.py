@@ -0,0 +1,85 @@
+"""
+生产环境启动脚本。
+
+POSIX 上使用 gunicorn（预派生多进程，每个进程多线程），Windows 上使用 waitress（单进程多线程）：
+
+    python serve.py [--workers 4] [--threads 8] [--host 0.0.0.0] [--port 5000]
+
+- 应用在主进程中创建并预加载查找表与全部用例集，之后再派生工作进程，各进程共享这部分内存；
+- 收到 SIGTERM/SIGINT 后停止接收新连接，等待进行中的请求最多 --graceful-timeout 秒，
+  并取消尚未结束的系统测试运行；
+- gunicorn 工作进程超过 --timeout 秒（默认 180）无响应即被重启，长时间的系统测试应通过
+  /api/system-test-runs 在后台运行，而不是阻塞等待的 /api/run-system-tests；
+- 系统测试运行记录、结果缓存等状态保存在各工作进程内，轮询 /api/system-test-runs/<id>
+  需要落到创建它的进程上，使用系统测试时应以 --workers 1 启动。
+
+需要先安装 gunicorn（POSIX）或 waitress（Windows）。
+"""
+import argparse
+import os
+import sys
+
+DEFAULT_WORKERS = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+DEFAULT_THREADS = 4
+DEFAULT_GRACEFUL_TIMEOUT = 30
+# 高于负载测试的时长上限（forum_views.MAX_LOAD_DURATION = 120 秒）；
+# 系统测试经后台任务执行，不占用请求线程
+DEFAULT_TIMEOUT = 180
+
+def _shutdown_jobs():
+    # 系统测试接口模块在首次使用时才加载；没有加载过就没有需要取消的运行
+    views = sys.modules.get('system_test_views')
+    if views is not None:
+        views.system_test_jobs.shutdown()
+
+def _on_worker_exit(server, worker):
+    _shutdown_jobs()
+
+def serve_gunicorn(app, args):
+    from gunicorn.app.base import BaseApplication
+
+    class Application(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f"{args.host}:{args.port}")
+            self.cfg.set('workers', args.workers)
+            self.cfg.set('threads', args.threads)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('preload_app', True)
+            self.cfg.set('graceful_timeout', args.graceful_timeout)
+            # 负载测试请求可能持续较久，不按默认的 30 秒判定工作进程超时，但仍保留有限的超时以便重启卡死的进程
+            self.cfg.set('timeout', args.timeout)
+            self.cfg.set('worker_exit', _on_worker_exit)
+
+        def load(self):
+            return app
+
+    Application().run()
+
+def serve_waitress(app, args):
+    from waitress import serve
+
+    try:
+        serve(app, host=args.host, port=args.port, threads=args.threads)
+    finally:
+        _shutdown_jobs()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='工作进程数（仅 gunicorn）')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS, help='每个工作进程的线程数')
+    parser.add_argument('--graceful-timeout', type=int, default=DEFAULT_GRACEFUL_TIMEOUT)
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT,
+                        help='工作进程超过该秒数无响应即被重启（仅 gunicorn）')
+    args = parser.parse_args()
+
+    from app import create_app
+    app = create_app(preload=True)
+    if os.name == 'posix':
+        serve_gunicorn(app, args)
+    else:
+        serve_waitress(app, args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+测试用例集注册表。
+
+用例集以 JSON（对象数组）或 CSV（首行为列名）文件的形式放在 backend/suites 下，
+文件名（不含扩展名）即用例集名称，例如 suites/triangle_bva.json 对应 'triangle_bva'。
+每个用例集只在首次使用或文件变化（mtime/大小改变）后解析一次，解析结果按列保存：
+整列都是整数或都是浮点数的列存为 numpy 数组，其余列存为列表；
+缺失的单元格记录在掩码中，逐条产出用例时省略对应的键，与手写的字典字面量保持一致。
+"""
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+SUITES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'suites')
+SUITE_EXTENSIONS = ('.json', '.csv')
+SUITE_NAME_PATTERN = re.compile(r'^\w+$')
+# CSV 中这些列始终按字符串处理，不做数值推断
+CSV_TEXT_COLUMNS = ('id', 'description')
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+Suite = namedtuple('Suite', [
+    'name',
+    'path',
+    'signature',  # (mtime_ns, size)，用于判断文件是否变化
+    'digest',     # 文件内容的 SHA-256，内容不变则摘要不变，可作为结果缓存的键
+    'length',     # 用例数
+    'columns',    # 列名 -> numpy 数组或列表，按文件中首次出现的顺序排列
+    'missing',    # 列名 -> 缺失掩码（bool 数组），只包含存在缺失值的列
+])
+
+_MISSING = object()
+
+def _column_array(values):
+    """把一列值转换为紧凑的存储形式：同类型数值列转为 numpy 数组，其余保持列表。"""
+    present = [value for value in values if value is not _MISSING]
+    if present and all(type(value) is int and INT64_MIN <= value <= INT64_MAX for value in present):
+        dtype = np.int64
+    elif present and all(type(value) is float for value in present):
+        dtype = np.float64
+    else:
+        return [None if value is _MISSING else value for value in values]
+    return np.array([0 if value is _MISSING else value for value in values], dtype=dtype)
+
+def _parse_csv_number(text):
+    """把单元格解析为整数或浮点数，都不能解析时返回 None。"""
+    for parse in (int, float):
+        try:
+            return parse(text)
+        except ValueError:
+            pass
+    return None
+
+def _parse_csv_column(name, texts):
+    """
+    逐个单元格推断 CSV 类型：能解析为数值的单元格转为数值，其余保持字符串，
+    因此数值与 '非法输入' 混合的预期结果列中，数值单元格仍可与函数的返回值直接比较。
+    列中出现浮点数时，同列的整数也转为浮点数，与按整列推断时的结果一致。
+    """
+    values = [_MISSING if text == '' else text for text in texts]
+    if name in CSV_TEXT_COLUMNS:
+        return values
+    numbers = [None if value is _MISSING else _parse_csv_number(value) for value in values]
+    numeric_type = float if any(type(number) is float for number in numbers) else int
+    return [
+        value if number is None else numeric_type(number)
+        for value, number in zip(values, numbers)
+    ]
+
+def _read_json_records(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('cases')
+    if not isinstance(data, list) or not all(isinstance(record, dict) for record in data):
+        raise ValueError(f"用例集文件格式错误，应为对象数组: {path}")
+    names = list(dict.fromkeys(key for record in data for key in record))
+    return len(data), {name: [record.get(name, _MISSING) for record in data] for name in names}
+
+def _read_csv_records(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        names = next(reader, [])
+        rows = list(reader)
+    texts = zip(*rows) if rows else [() for _ in names]
+    return len(rows), {name: _parse_csv_column(name, list(column)) for name, column in zip(names, texts)}
+
+def load_suite(name, path, signature=None):
+    """解析用例集文件，返回 Suite。"""
+    if signature is None:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    reader = _read_csv_records if path.endswith('.csv') else _read_json_records
+    length, raw_columns = reader(path)
+    columns = {}
+    missing = {}
+    for column_name, values in raw_columns.items():
+        columns[column_name] = _column_array(values)
+        mask = np.fromiter((value is _MISSING for value in values), dtype=bool, count=length)
+        if mask.any():
+            missing[column_name] = mask
+    return Suite(
+        name=name, path=path, signature=signature, digest=digest, length=length, columns=columns, missing=missing,
+    )
+
+def iter_cases(suite):
+    """逐条产出用例字典；数值列还原为 Python 标量，缺失的单元格不出现在字典中。"""
+    names = list(suite.columns)
+    columns = [column.tolist() if isinstance(column, np.ndarray) else column for column in suite.columns.values()]
+    if not suite.missing:
+        for row in zip(*columns):
+            yield dict(zip(names, row))
+        return
+    masks = [suite.missing[name].tolist() if name in suite.missing else None for name in names]
+    for index in range(suite.length):
+        yield {
+            name: column[index]
+            for name, column, mask in zip(names, columns, masks)
+            if mask is None or not mask[index]
+        }
+
+class SuiteRegistry:
+    def __init__(self, suites_dir=SUITES_DIR):
+        self.suites_dir = suites_dir
+        self.suites = {}
+        self.lock = threading.Lock()
+
+    def find_path(self, name):
+        """返回用例集文件路径；名称非法或文件不存在时返回 None。"""
+        if not SUITE_NAME_PATTERN.match(name):
+            return None
+        for extension in SUITE_EXTENSIONS:
+            path = os.path.join(self.suites_dir, name + extension)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def names(self):
+        return sorted({
+            os.path.splitext(filename)[0]
+            for filename in os.listdir(self.suites_dir)
+            if filename.endswith(SUITE_EXTENSIONS)
+        })
+
+    def get(self, name):
+        """返回用例集，文件自上次加载后有变化时重新解析；用例集不存在时抛出 KeyError。"""
+        path = self.find_path(name)
+        if path is None:
+            raise KeyError(name)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            suite = self.suites.get(name)
+            if suite is None or suite.path != path or suite.signature != signature:
+                suite = load_suite(name, path, signature)
+                self.suites[name] = suite
+            return suite
+
+    def iter_cases(self, name):
+        return iter_cases(self.get(name))
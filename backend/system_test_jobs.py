@@ -0,0 +1,169 @@
+"""
+系统测试的异步任务管理。
+
+每次运行是一个 SystemTestRun，由有并发上限的后台线程池执行；
+pytest 输出逐行读回，边到达边解析，运行中即可查询进度、已完成的用例和新增日志，
+也可以随时取消。每个运行只保留最近 MAX_LOG_LINES 行日志，
+已结束的运行只保留最近 MAX_FINISHED_RUNS 个。
+"""
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from systemtest_runner import discover_test_files, run_parallel, stop_worker
+
+MAX_CONCURRENT_RUNS = 2
+MAX_FINISHED_RUNS = 20
+MAX_LOG_LINES = 5000
+
+QUEUED = 'queued'
+RUNNING = 'running'
+PASSED = 'passed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+ERROR = 'error'
+FINISHED_STATUSES = (PASSED, FAILED, CANCELLED, ERROR)
+
+class SystemTestRun:
+    def __init__(self, workers):
+        self.id = uuid.uuid4().hex
+        self.workers = workers
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.total_files = len(discover_test_files())
+        self.log_lines = deque(maxlen=MAX_LOG_LINES)
+        self.log_line_count = 0
+        self.cases = []
+        self.error = None
+        self.processes = []
+        self.cancel_requested = False
+        self.done = threading.Event()
+        self.lock = threading.Lock()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATUSES
+
+    def add_line(self, worker_index, line):
+        with self.lock:
+            self.log_lines.append(f"[worker {worker_index}] {line}" if self.workers > 1 else line)
+            self.log_line_count += 1
+
+    def add_case(self, worker_index, record):
+        with self.lock:
+            self.cases.append(record)
+
+    def snapshot(self, log_offset=0):
+        """
+        返回运行状态；日志只包含第 log_offset 行之后的新增部分，便于客户端增量轮询。
+        已被滚动丢弃的早期日志不再返回。
+        """
+        with self.lock:
+            first_kept = self.log_line_count - len(self.log_lines)
+            new_lines = list(self.log_lines)[max(log_offset - first_kept, 0):]
+            return {
+                'id': self.id,
+                'status': self.status,
+                'workers': self.workers,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'total_files': self.total_files,
+                'cases': list(self.cases),
+                'log': ''.join(new_lines),
+                'log_offset': self.log_line_count,
+                'error': self.error,
+            }
+
+class SystemTestJobManager:
+    def __init__(self, max_concurrent_runs=MAX_CONCURRENT_RUNS):
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent_runs, thread_name_prefix='system-test')
+        self.runs = {}
+        self.lock = threading.Lock()
+
+    def submit(self, workers=1):
+        run = SystemTestRun(max(workers, 1))
+        with self.lock:
+            self.runs[run.id] = run
+            self._evict_finished()
+        self.executor.submit(self._execute, run)
+        return run
+
+    def get(self, run_id):
+        with self.lock:
+            return self.runs.get(run_id)
+
+    def cancel(self, run_id):
+        """请求取消运行；排队中的运行不会再启动，执行中的运行会结束其 pytest 进程。"""
+        run = self.get(run_id)
+        if run is None:
+            return None
+        with run.lock:
+            if run.finished:
+                return run
+            run.cancel_requested = True
+            if run.status == QUEUED:
+                run.status = CANCELLED
+                run.finished_at = time.time()
+                run.done.set()
+            processes = list(run.processes)
+        for process in processes:
+            stop_worker(process)
+        return run
+
+    def shutdown(self):
+        """取消所有未结束的运行并停止线程池，用于服务进程退出前的清理。"""
+        with self.lock:
+            run_ids = [run.id for run in self.runs.values() if not run.finished]
+        for run_id in run_ids:
+            self.cancel(run_id)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _execute(self, run):
+        with run.lock:
+            if run.cancel_requested:
+                return
+            run.status = RUNNING
+            run.started_at = time.time()
+
+        def on_start(processes):
+            with run.lock:
+                run.processes = processes
+                cancelled = run.cancel_requested
+            if cancelled:
+                for process in processes:
+                    stop_worker(process)
+
+        try:
+            result = run_parallel(
+                run.workers, on_line=run.add_line, on_case=run.add_case, on_start=on_start, keep_log=False,
+            )
+            with run.lock:
+                if run.cancel_requested:
+                    run.status = CANCELLED
+                elif any(case['result'] in ('FAILED', 'ERROR') for case in run.cases):
+                    run.status = FAILED
+                elif any(worker['returncode'] not in (0, 5) for worker in result['workers']):
+                    # pytest 退出码 5 表示没有收集到用例，其余非零退出码视为执行出错
+                    run.status = ERROR
+                    run.error = 'pytest 异常退出'
+                else:
+                    run.status = PASSED
+        except Exception as e:
+            with run.lock:
+                run.status = ERROR
+                run.error = str(e)
+        finally:
+            with run.lock:
+                run.processes = []
+                run.finished_at = time.time()
+            run.done.set()
+
+    def _evict_finished(self):
+        finished = sorted((run for run in self.runs.values() if run.finished), key=lambda run: run.created_at)
+        for run in finished[:max(len(finished) - MAX_FINISHED_RUNS, 0)]:
+            del self.runs[run.id]
@@ -0,0 +1,43 @@
+"""系统测试与单元测试接口。"""
+from flask import jsonify, request
+
+from system_test_jobs import ERROR, SystemTestJobManager
+
+system_test_jobs = SystemTestJobManager()
+
+def create_system_test_run():
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': '无效的请求体'}), 400
+    try:
+        workers = int(data.get('workers', request.args.get('workers', 1)))
+    except (ValueError, TypeError):
+        return jsonify({'error': 'workers 必须是整数'}), 400
+    run = system_test_jobs.submit(workers)
+    return jsonify(run.snapshot()), 202
+
+def get_system_test_run(run_id):
+    run = system_test_jobs.get(run_id)
+    if run is None:
+        return jsonify({'error': '运行不存在'}), 404
+    # log_offset 为客户端已读取的日志行数，只返回其后新增的日志
+    return jsonify(run.snapshot(request.args.get('log_offset', 0, type=int)))
+
+def cancel_system_test_run(run_id):
+    run = system_test_jobs.cancel(run_id)
+    if run is None:
+        return jsonify({'error': '运行不存在'}), 404
+    return jsonify(run.snapshot())
+
+def run_system_tests():
+    # 兼容旧接口：提交一次运行并等待其结束
+    run = system_test_jobs.submit(request.args.get('workers', 1, type=int))
+    run.done.wait()
+    snapshot = run.snapshot()
+    if snapshot['status'] == ERROR:
+        return jsonify({'error': snapshot['error'], 'log': snapshot['log'], 'cases': snapshot['cases']}), 500
+    return jsonify({'log': snapshot['log'], 'cases': snapshot['cases']})
+
+def run_unit_tests():
+    # TODO: Implement unit testing logic
+    return jsonify({'message': 'Unit tests not implemented yet.'})
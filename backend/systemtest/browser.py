@@ -0,0 +1,13 @@
+# 系统测试共用的浏览器创建函数
+import os
+from selenium import webdriver
+
+# 由并行执行器为每个工作进程设置，为 "1" 时以无头模式启动浏览器
+HEADLESS_ENV = 'SYSTEMTEST_HEADLESS'
+
+def create_driver():
+  options = webdriver.ChromeOptions()
+  if os.environ.get(HEADLESS_ENV) == '1':
+    options.add_argument('--headless=new')
+    options.add_argument('--window-size=1294,766')
+  return webdriver.Chrome(options=options)
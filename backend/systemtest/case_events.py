@@ -0,0 +1,45 @@
+# pytest 插件：每个用例结束后向标准输出写一行结构化的 JSON 事件
+# 由 systemtest_runner 通过 `-p case_events` 加载，供其边运行边解析用例结果与耗时，
+# 格式为 "SYSTEMTEST_EVENT {"file": ..., "case": ..., "result": ..., "duration": ...}"
+import json
+import pytest
+
+EVENT_PREFIX = 'SYSTEMTEST_EVENT '
+
+_config = None
+_phases = {}
+
+def pytest_configure(config):
+  global _config
+  _config = config
+
+def _result(reports):
+  setup = reports.get('setup')
+  call = reports.get('call')
+  teardown = reports.get('teardown')
+  if setup is not None and setup.failed:
+    return 'ERROR'
+  if setup is not None and setup.skipped:
+    return 'SKIPPED'
+  if call is not None and not call.passed:
+    return call.outcome.upper()
+  if teardown is not None and teardown.failed:
+    return 'ERROR'
+  return 'PASSED'
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_logreport(report):
+  reports = _phases.setdefault(report.nodeid, {})
+  reports[report.when] = report
+  if report.when != 'teardown':
+    return
+  del _phases[report.nodeid]
+  file, _, case = report.nodeid.partition('::')
+  event = {
+    'file': file,
+    'case': case,
+    'result': _result(reports),
+    'duration': round(sum(phase.duration for phase in reports.values()), 3),
+  }
+  reporter = _config.pluginmanager.get_plugin('terminalreporter')
+  reporter.write_line(EVENT_PREFIX + json.dumps(event, ensure_ascii=False))
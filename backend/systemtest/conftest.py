@@ -0,0 +1,33 @@
+import pytest
+from session_pool import SessionPool
+from waits import summarize_waits
+
+@pytest.fixture(scope='session')
+def session_pool():
+  pool = SessionPool()
+  yield pool
+  pool.close()
+
+@pytest.fixture
+def browser(session_pool):
+  """未登录的浏览器会话，测试结束后放回会话池"""
+  driver = session_pool.acquire_clean()
+  yield driver
+  session_pool.release(driver)
+
+@pytest.fixture
+def logged_in_browser(session_pool):
+  """已登录 kiwitest1 的浏览器会话，停留在首页，测试结束后放回会话池"""
+  driver = session_pool.acquire_logged_in()
+  yield driver
+  session_pool.release(driver)
+
+def pytest_terminal_summary(terminalreporter):
+  summary = summarize_waits()
+  if not summary:
+    return
+  terminalreporter.section('wait timings')
+  for label, count, total, longest, timeouts in summary:
+    terminalreporter.write_line(
+      f"{total:8.3f}s total {longest:7.3f}s max {count:3d}x {timeouts:2d} timeout  {label}"
+    )
@@ -0,0 +1,90 @@
+# 系统测试的浏览器会话池
+# 同一 pytest 进程内复用已启动的浏览器；登录态只通过表单登录采集一次，
+# 之后借出会话时直接恢复 cookie 和 localStorage，省去冷启动浏览器和重复登录的开销
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+from browser import create_driver
+from waits import wait_clickable, wait_present
+
+BASE_URL = "https://bbs.nansin.top/"
+USERNAME = "kiwitest1"
+PASSWORD = "kiwi4567"
+AVATAR = (By.XPATH, f"//img[@alt='{USERNAME}']")
+
+def login(driver, username=USERNAME, password=PASSWORD):
+  """通过登录表单登录，并等待头像出现"""
+  driver.get(BASE_URL)
+  login_btn = wait_clickable(driver, (By.CSS_SELECTOR, ".ant-btn:nth-child(1)"))
+  login_btn.click()
+  ActionChains(driver).move_to_element(login_btn).perform()
+  driver.find_element(By.ID, "normal_login_name").send_keys(username)
+  driver.find_element(By.ID, "normal_login_password").send_keys(password)
+  driver.find_element(By.CSS_SELECTOR, ".login-form-button").click()
+  wait_present(driver, AVATAR, timeout=30)
+
+def capture_state(driver):
+  return {
+    'cookies': driver.get_cookies(),
+    'local_storage': driver.execute_script("return Object.assign({}, window.localStorage);"),
+  }
+
+def clear_state(driver):
+  driver.get(BASE_URL)
+  driver.delete_all_cookies()
+  driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+def restore_state(driver, state):
+  clear_state(driver)
+  for cookie in state['cookies']:
+    driver.add_cookie(cookie)
+  driver.execute_script(
+    "for (const [key, value] of Object.entries(arguments[0])) { window.localStorage.setItem(key, value); }",
+    state['local_storage'],
+  )
+  driver.get(BASE_URL)
+
+class SessionPool():
+  def __init__(self, factory=create_driver):
+    self.factory = factory
+    self.idle = []
+    self.drivers = []
+    self.state = None
+
+  def acquire(self):
+    if self.idle:
+      return self.idle.pop()
+    driver = self.factory()
+    self.drivers.append(driver)
+    return driver
+
+  def release(self, driver):
+    self.idle.append(driver)
+
+  def acquire_clean(self):
+    """借出一个未登录的会话"""
+    driver = self.acquire()
+    clear_state(driver)
+    driver.get(BASE_URL)
+    return driver
+
+  def acquire_logged_in(self):
+    """借出一个已登录的会话；首次调用或恢复的登录态失效时走一次表单登录并重新采集"""
+    driver = self.acquire()
+    if self.state is not None:
+      restore_state(driver, self.state)
+      try:
+        wait_present(driver, AVATAR)
+        return driver
+      except TimeoutException:
+        self.state = None
+    clear_state(driver)
+    login(driver)
+    self.state = capture_state(driver)
+    return driver
+
+  def close(self):
+    for driver in self.drivers:
+      driver.quit()
+    self.drivers = []
+    self.idle = []
@@ -10,51 +10,20 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 from selenium.webdriver.support import expected_conditions as EC
+from waits import click_when_ready
 
 class Test004():
-  def setup_method(self, method):
-    self.driver = webdriver.Chrome()
+  @pytest.fixture(autouse=True)
+  def setup_driver(self, logged_in_browser):
+    self.driver = logged_in_browser
     self.vars = {}
   
-  def teardown_method(self, method):
-    self.driver.quit()
-  
   def test_004(self):
-    self.driver.get("https://bbs.nansin.top/")
     self.driver.set_window_size(1294, 766)
-    login_btn = WebDriverWait(self.driver, 10).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, ".ant-btn:nth-child(1)"))
-    )
-    login_btn.click()
-
-    # 悬停操作
-    actions = ActionChains(self.driver)
-    actions.move_to_element(login_btn).perform()
-
-    # 输入用户名和密码
-    self.driver.find_element(By.ID, "normal_login_name").send_keys("kiwitest1")
-    self.driver.find_element(By.ID, "normal_login_password").send_keys("kiwi4567")
-
-    # 点击登录按钮
-    self.driver.find_element(By.CSS_SELECTOR, ".login-form-button").click()
-
-    # 等待头像加载（注意：等待时间应为秒）
-    WebDriverWait(self.driver, 30).until(
-        EC.presence_of_element_located((By.XPATH, "//img[@alt='kiwitest1']"))
-    )
-
-    WebDriverWait(self.driver, 30000).until(expected_conditions.presence_of_element_located((By.XPATH, "//img[@alt=\'kiwitest1\']")))
-
-    WebDriverWait(self.driver, 30000).until(expected_conditions.presence_of_element_located((By.XPATH, "//img[@alt=\'kiwitest1\']")))
     self.driver.find_element(By.CSS_SELECTOR, ".avatar > img").click()
-    time.sleep(2)
-    self.driver.find_element(By.CSS_SELECTOR, ".profile").click()
-    time.sleep(1)
-    WebDriverWait(self.driver, 30000).until(expected_conditions.presence_of_element_located((By.CSS_SELECTOR, ".follow-btn")))
-    self.driver.find_element(By.CSS_SELECTOR, ".follow-btn").click()
-    WebDriverWait(self.driver, 10).until(
-    EC.element_to_be_clickable((By.CSS_SELECTOR, ".ant-row:nth-child(4) .ant-input"))
-).click()
+    click_when_ready(self.driver, (By.CSS_SELECTOR, ".profile"))
+    click_when_ready(self.driver, (By.CSS_SELECTOR, ".follow-btn"))
+    click_when_ready(self.driver, (By.CSS_SELECTOR, ".ant-row:nth-child(4) .ant-input"))
     self.driver.find_element(By.CSS_SELECTOR, ".ant-row:nth-child(4) .ant-input").send_keys("测试工程师")
     self.driver.find_element(By.CSS_SELECTOR, ".ant-row:nth-child(5) .ant-input").click()
     self.driver.find_element(By.CSS_SELECTOR, ".ant-row:nth-child(5) .ant-input").send_keys("南生测试公司")
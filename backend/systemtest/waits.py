@@ -0,0 +1,59 @@
+# 系统测试共用的显式等待工具
+# 用有上限的 DOM 条件等待代替固定的 time.sleep，并记录每次等待的耗时，
+# 便于去掉空等时间，也能在测试日志中看出目标站点的响应变慢
+import time
+from collections import namedtuple
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.1
+
+WaitRecord = namedtuple('WaitRecord', ['label', 'seconds', 'ok'])
+
+# 当前进程内所有等待的记录，由 conftest.py 在测试结束时汇总输出
+WAIT_RECORDS = []
+
+def wait_for(driver, condition, timeout=DEFAULT_TIMEOUT, label=None):
+  """轮询 condition 直到返回真值或超时，返回 condition 的结果；超时抛出 TimeoutException"""
+  label = label or getattr(condition, '__name__', repr(condition))
+  start = time.perf_counter()
+  try:
+    result = WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(condition)
+  except TimeoutException:
+    WAIT_RECORDS.append(WaitRecord(label, time.perf_counter() - start, False))
+    raise
+  WAIT_RECORDS.append(WaitRecord(label, time.perf_counter() - start, True))
+  return result
+
+def _label(locator):
+  return f"{locator[0]}={locator[1]}"
+
+def wait_present(driver, locator, timeout=DEFAULT_TIMEOUT):
+  return wait_for(driver, EC.presence_of_element_located(locator), timeout, 'present ' + _label(locator))
+
+def wait_all_present(driver, locator, timeout=DEFAULT_TIMEOUT):
+  return wait_for(driver, EC.presence_of_all_elements_located(locator), timeout, 'present ' + _label(locator))
+
+def wait_visible(driver, locator, timeout=DEFAULT_TIMEOUT):
+  return wait_for(driver, EC.visibility_of_element_located(locator), timeout, 'visible ' + _label(locator))
+
+def wait_invisible(driver, locator, timeout=DEFAULT_TIMEOUT):
+  return wait_for(driver, EC.invisibility_of_element_located(locator), timeout, 'invisible ' + _label(locator))
+
+def wait_clickable(driver, locator, timeout=DEFAULT_TIMEOUT):
+  return wait_for(driver, EC.element_to_be_clickable(locator), timeout, 'clickable ' + _label(locator))
+
+def click_when_ready(driver, locator, timeout=DEFAULT_TIMEOUT):
+  element = wait_clickable(driver, locator, timeout)
+  element.click()
+  return element
+
+def summarize_waits(records=None):
+  """按标签汇总等待记录，返回 [(标签, 次数, 总耗时, 最大耗时, 超时次数)]，按总耗时降序"""
+  totals = {}
+  for record in WAIT_RECORDS if records is None else records:
+    count, total, longest, timeouts = totals.get(record.label, (0, 0.0, 0.0, 0))
+    totals[record.label] = (count + 1, total + record.seconds, max(longest, record.seconds), timeouts + (not record.ok))
+  return sorted(((label,) + values for label, values in totals.items()), key=lambda item: item[2], reverse=True)
@@ -0,0 +1,174 @@
+"""
+系统测试（backend/systemtest）的并行执行器。
+
+把 test_*.py 文件分成 N 片，每片由一个独立的 pytest 进程执行，
+每个进程使用自己的无头浏览器。所有文件共用同一个测试账号（kiwitest1），
+修改同一份账号状态的文件（见 SHARED_STATE_GROUPS）必须分在同一片内按文件名顺序执行，
+否则结果取决于进程调度；新增会修改账号状态的测试文件时，需要把它加入对应的分组。各进程的输出逐行读回（可通过回调实时转发），
+最后合并成与 /api/run-system-tests 相同的 {'log', 'cases'} 结构。
+
+pytest 进程加载 systemtest/case_events.py 插件，每个用例结束时输出一行
+结构化事件，iter_case_records 据此边运行边产出带耗时的用例记录，
+无需等运行结束再整体读取日志。
+"""
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+
+SYSTEMTEST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'systemtest')
+
+def discover_test_files(systest_dir=SYSTEMTEST_DIR):
+    return sorted(name for name in os.listdir(systest_dir) if name.startswith('test_') and name.endswith('.py'))
+
+# 修改同一份账号状态的测试文件：组内文件总在同一个进程中按文件名顺序执行。
+# 资料修改的两个用例互相覆盖；test_007 删除的是 test_005 写入的文章。
+# 未列出的文件只登录或只读，可以与其他文件并行。
+SHARED_STATE_GROUPS = (
+    ('test_003_modify_userinfo_fail.py', 'test_004_modify_userinfo.py'),
+    ('test_005_write_articles.py', 'test_006_write_articles_fail.py', 'test_007_delete_articles.py'),
+)
+
+def shard_files(files, workers, groups=SHARED_STATE_GROUPS):
+    """
+    将测试文件分配到最多 workers 个分片，丢弃空分片。
+    groups 中同组的文件作为一个整体分配；各单元按首个文件名的顺序依次放入当前文件最少的分片，
+    每个分片内的文件按文件名排序。
+    """
+    remaining = sorted(files)
+    units = []
+    for group in groups:
+        members = [name for name in remaining if name in group]
+        if members:
+            units.append(members)
+            remaining = [name for name in remaining if name not in group]
+    units.extend([name] for name in remaining)
+    units.sort(key=lambda unit: unit[0])
+
+    shards = [[] for _ in range(max(workers, 1))]
+    for unit in units:
+        min(shards, key=len).extend(unit)
+    return [sorted(shard) for shard in shards if shard]
+
+# 与 systemtest/case_events.py 中的 EVENT_PREFIX 保持一致
+EVENT_PREFIX = 'SYSTEMTEST_EVENT '
+
+def parse_event_line(line):
+    """解析 case_events 插件输出的事件行，返回 {'file', 'case', 'result', 'duration'}，其他行返回 None。"""
+    if not line.startswith(EVENT_PREFIX):
+        return None
+    try:
+        event = json.loads(line[len(EVENT_PREFIX):])
+    except ValueError:
+        return None
+    return {key: event.get(key) for key in ('file', 'case', 'result', 'duration')}
+
+def iter_case_records(lines):
+    """从逐行读取的 pytest 输出中依次产出用例记录，只保留当前一行，内存占用与日志大小无关。"""
+    for line in lines:
+        record = parse_event_line(line)
+        if record:
+            yield record
+
+def start_worker(files, systest_dir=SYSTEMTEST_DIR):
+    """启动一个执行指定测试文件的 pytest 进程，浏览器以无头模式运行。"""
+    env = dict(os.environ, SYSTEMTEST_HEADLESS='1', PYTHONUNBUFFERED='1')
+    # 新建进程组，取消时可以连同浏览器驱动等子进程一起结束
+    kwargs = {'start_new_session': True} if os.name == 'posix' else {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    return subprocess.Popen(
+        # 关闭缓存插件，避免多个进程同时写 .pytest_cache
+        [sys.executable, '-m', 'pytest', '--tb=short', '-v', '-p', 'no:cacheprovider', '-p', 'case_events', *files],
+        cwd=systest_dir,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        **kwargs,
+    )
+
+def stop_worker(process):
+    """结束 pytest 进程及其子进程（浏览器驱动）。"""
+    if process.poll() is not None:
+        return
+    if os.name == 'posix':
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    else:
+        process.terminate()
+
+def run_parallel(workers, on_line=None, on_case=None, on_start=None, keep_log=True, systest_dir=SYSTEMTEST_DIR):
+    """
+    并行执行系统测试。
+
+    Args:
+        workers (int): 工作进程数。
+        on_line (callable): 可选回调 on_line(worker_index, line)，每读到一行输出即调用一次。
+        on_case (callable): 可选回调 on_case(worker_index, record)，每完成一个用例即调用一次。
+        on_start (callable): 可选回调 on_start(processes)，所有 pytest 进程启动后调用一次，
+            调用方可借此保存进程句柄，用 stop_worker 取消执行。
+        keep_log (bool): 是否在内存中保留完整日志；为 False 时返回的 log 为空，
+            日志只经由 on_line 转发，适合日志很大或由调用方自行保存的场景。
+
+    Returns:
+        dict: {'log': 按工作进程分段的完整日志, 'cases': 按文件名排序的用例结果, 'workers': 每个进程的文件与退出码}
+    """
+    shards = shard_files(discover_test_files(systest_dir), workers)
+    processes = [start_worker(files, systest_dir) for files in shards]
+    if on_start:
+        on_start(processes)
+    logs = [[] for _ in processes]
+    cases = []
+    lock = threading.Lock()
+
+    def lines(index, process):
+        for line in process.stdout:
+            if keep_log:
+                logs[index].append(line)
+            if on_line:
+                with lock:
+                    on_line(index, line)
+            yield line
+
+    def pump(index, process):
+        for record in iter_case_records(lines(index, process)):
+            with lock:
+                cases.append(record)
+                if on_case:
+                    on_case(index, record)
+        process.wait()
+
+    threads = [threading.Thread(target=pump, args=item, daemon=True) for item in enumerate(processes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    log = ''.join(
+        f"===== worker {index}: {' '.join(files)} =====\n" + ''.join(worker_log)
+        for index, (files, worker_log) in enumerate(zip(shards, logs))
+    ) if keep_log else ''
+    return {
+        'log': log,
+        'cases': sorted(cases, key=lambda case: (case['file'], case['case'])),
+        'workers': [
+            {'files': files, 'returncode': process.returncode}
+            for files, process in zip(shards, processes)
+        ],
+    }
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='并行执行 backend/systemtest 下的系统测试')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    result = run_parallel(args.workers, on_line=lambda index, line: print(f"[worker {index}] {line}", end=''))
+    failed = [case for case in result['cases'] if case['result'] in ('FAILED', 'ERROR')]
+    print(f"\n{len(result['cases'])} 个用例, {len(failed)} 个失败")
+    sys.exit(1 if failed else 0)
@@ -1,8 +1,23 @@
 # -*- coding: utf-8 -*-
+import numpy as np
+
+from money import BASIS_POINTS, cents_to_amount, divide_half_up
 
 # 定义计费系统中的常量
 BASE_RENT = 25.0
-RATE_PER_MINUTE = 0.15
+
+# 折扣档位：通话分钟落在 (TIER_BREAKPOINTS[i-1], TIER_BREAKPOINTS[i]] 时属于第 i 档，
+# 0 分钟为第 0 档（无折扣），超过最后一个断点为最高档
+TIER_BREAKPOINTS = np.array([0, 60, 120, 180, 300])
+TIER_ALLOWED_LATE_PAYMENTS = np.array([0, 1, 2, 3, 3, 6])
+
+# 定点计算用的常量：金额以分为单位，折扣率以基点（万分之一）为单位
+BASE_RENT_CENTS = 2500
+RATE_PER_MINUTE_CENTS = 15
+TIER_DISCOUNT_BASIS_POINTS = np.array([0, 100, 150, 200, 250, 300])
+# 定点批量计算在 int64 中进行，分钟数超过该值时中间结果（divide_half_up 的两倍分子）会溢出，这些行视为非法
+INT64_MAX = np.iinfo(np.int64).max
+MAX_BATCH_CALL_MINUTES = (INT64_MAX - BASIS_POINTS) // (2 * RATE_PER_MINUTE_CENTS * BASIS_POINTS)
 
 def calculate_telecom_fee(call_minutes, late_payments):
     """
@@ -21,50 +36,150 @@ def calculate_telecom_fee(call_minutes, late_payments):
     if call_minutes < 0 or late_payments < 0:
         return {'status': 'error', 'message': '非法输入：通话分钟和缴费次数不能为负数。'}
 
-    # 2. 根据通话时长确定折扣率和允许的欠费次数
-    discount_rate = 0.0
+    # 2. 根据通话时长确定折扣率（基点，万分之一）和允许的欠费次数
+    discount = 0
     allowed_late_payments = 0
 
     if 0 < call_minutes <= 60:
         allowed_late_payments = 1
-        discount_rate = 0.01
+        discount = 100
     elif 60 < call_minutes <= 120:
         allowed_late_payments = 2
-        discount_rate = 0.015
+        discount = 150
     elif 120 < call_minutes <= 180:
         allowed_late_payments = 3
-        discount_rate = 0.02
+        discount = 200
     elif 180 < call_minutes <= 300:
         allowed_late_payments = 3
-        discount_rate = 0.025
+        discount = 250
     elif call_minutes > 300:
         allowed_late_payments = 6
-        discount_rate = 0.03
-    # 如果 call_minutes 为 0, discount_rate 保持 0.0, 逻辑正确
+        discount = 300
+    # 如果 call_minutes 为 0, discount 保持 0, 逻辑正确
 
     # 3. 检查实际欠费次数是否超过允许值，若超过则取消折扣
-    final_discount_rate = discount_rate
     if late_payments > allowed_late_payments:
-        final_discount_rate = 0.0
+        discount = 0
 
-    # 4. 计算各项费用
-    raw_call_fee = call_minutes * RATE_PER_MINUTE
-    discount_amount = raw_call_fee * final_discount_rate
-    final_call_fee = raw_call_fee - discount_amount
-    total_fee = BASE_RENT + final_call_fee
+    # 4. 以整数分计算各项费用，折后话费按 ROUND_HALF_UP 精确舍入到分
+    #    （浮点计算在恰好半分的金额上舍入方向不确定，例如 10 分钟应为 26.49 元而非 26.48 元）
+    raw_call_fee = call_minutes * RATE_PER_MINUTE_CENTS
+    final_call_fee = divide_half_up(raw_call_fee * (BASIS_POINTS - discount), BASIS_POINTS)
+    total_fee = BASE_RENT_CENTS + final_call_fee
 
     return {
         'status': 'success',
         'call_minutes': call_minutes,
         'late_payments': late_payments,
         'base_rent': BASE_RENT,
-        'raw_call_fee': round(raw_call_fee, 2),
-        'applied_discount_rate': final_discount_rate,
-        'final_call_fee': round(final_call_fee, 2),
-        'total_fee': round(total_fee, 2),
+        'raw_call_fee': cents_to_amount(raw_call_fee),
+        'applied_discount_rate': discount / BASIS_POINTS,
+        'final_call_fee': cents_to_amount(final_call_fee),
+        'total_fee': cents_to_amount(total_fee),
         'message': '计算成功'
     }
 
+def _as_count_column(values, high=None):
+    """
+    把分钟数或欠费次数数组转换为 int64 数组，返回 (数组, 合法掩码)。
+    与 calculate_telecom_fee 的 isinstance(.., int) 校验一致：bool 按整数处理，浮点数组整体非法，
+    object 数组（如超出 int64 的 Python 整数）逐个判断；负数及超过 high 的位置非法，对应值为 0。
+    high 为 None 时不设上限，超出 int64 的值按 INT64_MAX 处理（欠费次数超过 6 次后结果都相同）。
+    """
+    limit = INT64_MAX if high is None else high
+    if values.dtype.kind == 'u':
+        values = np.minimum(values.astype(np.uint64), INT64_MAX)
+    if values.dtype.kind in 'biu':
+        valid = (values >= 0) & (values <= limit)
+        return np.where(valid, values, 0).astype(np.int64), valid
+    if values.dtype.kind == 'O':
+        flat = values.ravel().tolist()
+        valid = [isinstance(value, int) and 0 <= value and (high is None or value <= high) for value in flat]
+        counts = [min(value, INT64_MAX) if ok else 0 for value, ok in zip(flat, valid)]
+        return (
+            np.array(counts, dtype=np.int64).reshape(values.shape),
+            np.array(valid, dtype=bool).reshape(values.shape),
+        )
+    return np.zeros(values.shape, dtype=np.int64), np.zeros(values.shape, dtype=bool)
+
+def calculate_telecom_fee_batch(call_minutes, late_payments):
+    """
+    批量计算电信费用（calculate_telecom_fee 的向量化版本），
+    金额由 calculate_telecom_fee_cents_batch 的整数分结果换算回元。
+
+    Args:
+        call_minutes (array-like of int): 每个用户当月通话总分钟数。
+        late_payments (array-like of int): 每个用户累计未按时缴费次数。
+
+    Returns:
+        dict: 列式结果，每个键对应一个与输入等长的数组：
+              'valid' 为输入是否合法（bool 按整数处理，浮点数组整体视为非法，
+              object 数组逐个判断，负数为非法），
+              'raw_call_fee'、'applied_discount_rate'、'final_call_fee'、'total_fee'
+              与 calculate_telecom_fee 的同名字段逐元素一致，非法输入处为 NaN。
+    """
+    result = calculate_telecom_fee_cents_batch(call_minutes, late_payments)
+    valid = result['valid']
+
+    def column(values):
+        return np.where(valid, values, np.nan)
+
+    return {
+        'valid': valid,
+        'call_minutes': result['call_minutes'],
+        'late_payments': result['late_payments'],
+        'raw_call_fee': column(cents_to_amount(result['raw_call_fee_cents'])),
+        'applied_discount_rate': column(result['applied_discount_basis_points'] / BASIS_POINTS),
+        'final_call_fee': column(cents_to_amount(result['final_call_fee_cents'])),
+        'total_fee': column(cents_to_amount(result['total_fee_cents'])),
+    }
+
+def calculate_telecom_fee_cents_batch(call_minutes, late_payments):
+    """
+    以整数分为单位批量计算电信费用（定点模式）。
+
+    全程只做整数运算，折后话费按 ROUND_HALF_UP 精确舍入到分，
+    结果与按十进制精确计算一致，没有浮点误差，也不需要逐行使用 Decimal，
+    与 calculate_telecom_fee 换算为分后逐元素相等。
+
+    Args:
+        call_minutes (array-like of int): 每个用户当月通话总分钟数。
+        late_payments (array-like of int): 每个用户累计未按时缴费次数。
+
+    Returns:
+        dict: 列式结果，'valid' 含义同 calculate_telecom_fee_batch，
+              另外分钟数超过 MAX_BATCH_CALL_MINUTES 的行也视为非法（int64 无法精确计算）；
+              'raw_call_fee_cents'、'final_call_fee_cents'、'total_fee_cents' 为 int64 分，
+              'applied_discount_basis_points' 为折扣率基点；非法输入处均为 0。
+    """
+    call_minutes = np.asarray(call_minutes)
+    late_payments = np.asarray(late_payments)
+    call_minutes, late_payments = np.broadcast_arrays(call_minutes, late_payments)
+
+    minutes, minutes_ok = _as_count_column(call_minutes, MAX_BATCH_CALL_MINUTES)
+    lates, lates_ok = _as_count_column(late_payments)
+    valid = minutes_ok & lates_ok
+    minutes = np.where(valid, minutes, 0)
+    lates = np.where(valid, lates, 0)
+
+    tier = np.searchsorted(TIER_BREAKPOINTS, minutes, side='left')
+    discount = np.where(
+        valid & (lates <= TIER_ALLOWED_LATE_PAYMENTS[tier]), TIER_DISCOUNT_BASIS_POINTS[tier], 0
+    )
+
+    raw_call_fee = minutes * RATE_PER_MINUTE_CENTS
+    final_call_fee = divide_half_up(raw_call_fee * (BASIS_POINTS - discount), BASIS_POINTS)
+
+    return {
+        'valid': valid,
+        'call_minutes': call_minutes,
+        'late_payments': late_payments,
+        'raw_call_fee_cents': raw_call_fee,
+        'applied_discount_basis_points': discount,
+        'final_call_fee_cents': final_call_fee,
+        'total_fee_cents': np.where(valid, BASE_RENT_CENTS + final_call_fee, 0),
+    }
+
 # --- 用于直接运行文件时的测试用例 ---
 if __name__ == '__main__':
     print("--- 电信收费计算模块测试 ---")
@@ -72,7 +187,7 @@ if __name__ == '__main__':
     # 示例1: 享受折扣
     # 50分钟通话, 1次欠费. 属于第一档(允许1次), 享受1.0%折扣
     print(f"输入 (分钟:50, 欠费:1) -> {calculate_telecom_fee(50, 1)}")
-    # 预期: raw_call_fee=7.5, final_call_fee=7.42, total_fee=32.42
+    # 预期: raw_call_fee=7.5, final_call_fee=7.43, total_fee=32.43（7.425 按 ROUND_HALF_UP 舍入）
 
     # 示例2: 因欠费过多而失去折扣
     # 50分钟通话, 2次欠费. 属于第一档(允许1次), 失去折扣
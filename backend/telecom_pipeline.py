@@ -0,0 +1,129 @@
+"""
+电信话单文件批量计费流水线。
+
+从 CSV 文件中按固定行数分块读取用户用量记录（call_minutes, late_payments 两列必填，
+其余列原样透传到账单中），每块调用 calculate_telecom_fee_cents_batch 以整数分向量化计费，
+账单逐块追加写出，金额与 calculate_telecom_fee 逐行一致。任意时刻内存中只保留一个块，文件大小不受内存限制。
+
+    python telecom_pipeline.py usage.csv invoices.csv [--chunk-rows 100000]
+"""
+import argparse
+import csv
+import time
+from itertools import islice
+
+import numpy as np
+
+from money import BASIS_POINTS, CENTS_PER_UNIT
+from telecom_billing import INT64_MAX, MAX_BATCH_CALL_MINUTES, calculate_telecom_fee_cents_batch
+
+DEFAULT_CHUNK_ROWS = 100_000
+INPUT_COLUMNS = ('call_minutes', 'late_payments')
+OUTPUT_COLUMNS = ('status', 'raw_call_fee', 'applied_discount_rate', 'final_call_fee', 'total_fee')
+
+def _parse_int(value, high=INT64_MAX):
+    """解析整数单元格；无法解析或超出 [-INT64_MAX, high] 时返回 None（该行记为非法，而不是让整块转换失败）。"""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if -INT64_MAX <= number <= high else None
+
+def _format_cents(cents):
+    return f"{cents // CENTS_PER_UNIT}.{cents % CENTS_PER_UNIT:02d}"
+
+def read_usage_chunks(reader, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    从 csv.DictReader 中按块读取用量记录。
+    每块产出 (原始行列表, call_minutes 数组, late_payments 数组, 可解析掩码)。
+    """
+    while True:
+        rows = list(islice(reader, chunk_rows))
+        if not rows:
+            return
+        minutes = [_parse_int(row.get('call_minutes'), MAX_BATCH_CALL_MINUTES) for row in rows]
+        lates = [_parse_int(row.get('late_payments')) for row in rows]
+        parsed = np.array([m is not None and l is not None for m, l in zip(minutes, lates)], dtype=bool)
+        yield (
+            rows,
+            np.array([m if m is not None else -1 for m in minutes], dtype=np.int64),
+            np.array([l if l is not None else -1 for l in lates], dtype=np.int64),
+            parsed,
+        )
+
+def bill_chunk(rows, call_minutes, late_payments, parsed):
+    """对一个块计费，返回与 rows 一一对应的账单行（原始列 + OUTPUT_COLUMNS）。"""
+    result = calculate_telecom_fee_cents_batch(call_minutes, late_payments)
+    valid = (result['valid'] & parsed).tolist()
+    columns = zip(
+        valid,
+        result['raw_call_fee_cents'].tolist(),
+        (result['applied_discount_basis_points'] / BASIS_POINTS).tolist(),
+        result['final_call_fee_cents'].tolist(),
+        result['total_fee_cents'].tolist(),
+    )
+    invoices = []
+    for row, (ok, raw_fee, rate, final_fee, total_fee) in zip(rows, columns):
+        invoice = dict(row)
+        if ok:
+            invoice.update(
+                status='success',
+                raw_call_fee=_format_cents(raw_fee),
+                applied_discount_rate=rate,
+                final_call_fee=_format_cents(final_fee),
+                total_fee=_format_cents(total_fee),
+            )
+        else:
+            invoice.update(status='error', raw_call_fee='', applied_discount_rate='', final_call_fee='', total_fee='')
+        invoices.append(invoice)
+    return invoices
+
+def bill_usage_file(input_path, output_path, chunk_rows=DEFAULT_CHUNK_ROWS, on_chunk=None):
+    """
+    对整个用量文件计费并写出账单文件。
+
+    Args:
+        on_chunk (callable): 可选回调 on_chunk(stats)，每写完一块调用一次，stats 为截至当前的统计。
+
+    Returns:
+        dict: {'rows', 'error_rows', 'chunks', 'seconds', 'rows_per_second'}
+    """
+    start = time.perf_counter()
+    stats = {'rows': 0, 'error_rows': 0, 'chunks': 0}
+    with open(input_path, newline='', encoding='utf-8') as source, \
+         open(output_path, 'w', newline='', encoding='utf-8') as target:
+        reader = csv.DictReader(source)
+        missing = [column for column in INPUT_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"输入文件缺少列: {', '.join(missing)}")
+        fieldnames = list(reader.fieldnames) + [column for column in OUTPUT_COLUMNS if column not in reader.fieldnames]
+        writer = csv.DictWriter(target, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        for chunk in read_usage_chunks(reader, chunk_rows):
+            invoices = bill_chunk(*chunk)
+            writer.writerows(invoices)
+            stats['rows'] += len(invoices)
+            stats['error_rows'] += sum(invoice['status'] == 'error' for invoice in invoices)
+            stats['chunks'] += 1
+            if on_chunk:
+                on_chunk(dict(stats, seconds=time.perf_counter() - start))
+    stats['seconds'] = time.perf_counter() - start
+    stats['rows_per_second'] = stats['rows'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help='用量 CSV 文件，需包含 call_minutes 和 late_payments 列')
+    parser.add_argument('output', help='账单 CSV 输出路径')
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    def progress(stats):
+        print(f"已处理 {stats['rows']} 行 ({stats['rows'] / stats['seconds']:.0f} 行/秒)", end='\r', flush=True)
+
+    stats = bill_usage_file(args.input, args.output, args.chunk_rows, on_chunk=progress)
+    print(f"\n共 {stats['rows']} 行, 非法 {stats['error_rows']} 行, {stats['chunks']} 块, "
+          f"耗时 {stats['seconds']:.2f}s, {stats['rows_per_second']:.0f} 行/秒")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""电信收费接口。"""
+from flask import jsonify, request
+
+from metrics import business_timer
+import money
+from money import to_cents
+from telecom_billing import calculate_telecom_fee
+from view_helpers import bulk_response, cached_runner_response, runner_response
+
+TELECOM_TEST_TYPES = ('bva', 'equivalence', 'decision')
+
+def run_telecom_tests():
+    test_type = request.args.get('type', 'bva')
+    if test_type not in TELECOM_TEST_TYPES:
+        return runner_response([], run_telecom_case)
+    # Amounts are computed and compared with the money helpers, so their source is part of the ETag
+    return cached_runner_response(
+        f'telecom_{test_type}', calculate_telecom_fee, run_telecom_case, dependencies=(money,),
+    )
+
+def run_telecom_case(case):
+    call_minutes, late_payments = case['call_minutes'], case['late_payments']
+    
+    # Adjust expected value for error cases for direct comparison
+    expected = case['expected']
+    
+    response = calculate_telecom_fee(call_minutes, late_payments)
+    
+    actual_result = None
+    if response['status'] == 'success':
+        actual_result = response['total_fee']
+    elif '非' in response.get('message', ''): # Catches "非法输入"
+        actual_result = '非法输入'
+
+    # calculate_telecom_fee computes in integer cents, so amounts compare exactly in cents
+    passed = False
+    if isinstance(expected, (int, float)) and actual_result is not None and isinstance(actual_result, (int, float)):
+        if to_cents(actual_result) == to_cents(expected):
+            passed = True
+    elif actual_result == expected:
+        passed = True
+        
+    row = {
+        "id": case['id'],
+        "call_minutes": call_minutes,
+        "late_payments": late_payments,
+        "description": case.get('description', ''),
+        "expected": expected,
+        "output_fee": actual_result if actual_result is not None else response.get('message'),
+        "passed": passed
+    }
+    return row, passed
+
+def parse_telecom_input(data):
+    """Returns ((call_minutes, late_payments), None) for a valid custom input, or (None, error message)."""
+    if not data or not isinstance(data, dict):
+        return None, '无效的请求体'
+
+    try:
+        call_minutes = data.get('call_minutes')
+        late_payments = data.get('late_payments')
+        
+        # Ensure values are integers before passing to the calculation function
+        if call_minutes is None or late_payments is None:
+             return None, '请提供通话分钟和欠费次数'
+        
+        call_minutes = int(call_minutes)
+        late_payments = int(late_payments)
+
+    except (ValueError, TypeError, OverflowError):
+        return None, '输入必须是有效的整数'
+    return (call_minutes, late_payments), None
+
+def compute_telecom_output(call_minutes, late_payments):
+    try:
+        response = calculate_telecom_fee(call_minutes, late_payments)
+    except OverflowError:
+        # 金额超出浮点数范围，按单条输入的计算错误返回，不影响批量请求中的其他输入
+        response = {'status': 'error', 'message': '计算结果超出范围'}
+    
+    if response['status'] == 'success':
+        return {
+            'call_minutes': call_minutes,
+            'late_payments': late_payments,
+            'output_fee': response['total_fee'],
+            'message': response.get('message', '计算成功')
+        }
+    else:
+        return {
+            'call_minutes': call_minutes,
+            'late_payments': late_payments,
+            'output_fee': response.get('message', '计算出错'),
+            'error': True
+        }
+
+def run_telecom_custom():
+    inputs, error = parse_telecom_input(request.get_json())
+    if error:
+        return jsonify({'error': error}), 400
+    with business_timer():
+        output = compute_telecom_output(*inputs)
+    return jsonify(output)
+
+def run_telecom_custom_bulk():
+    return bulk_response(
+        parse_telecom_input,
+        lambda inputs: [compute_telecom_output(*args) for args in inputs],
+    )
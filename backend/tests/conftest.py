@@ -0,0 +1,54 @@
+"""
+离线测试用的夹具：在后台线程中启动论坛桩服务器（端口 0，自动选择空闲端口），
+以及使用独立结果缓存的 Flask 测试客户端。
+"""
+import socket
+
+import pytest
+
+import view_helpers
+from forum_stub_server import start_stub_server
+from response_cache import ResponseCache
+
+# 慢速桩服务器每个请求的固定延迟（秒），用于检查分位数
+SLOW_STUB_DELAY = 0.02
+
+def _serve(delay):
+    server, base_url = start_stub_server(port=0, delay=delay)
+    try:
+        yield base_url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+@pytest.fixture
+def forum_stub():
+    """立即响应的桩服务器，返回其 base_url。"""
+    yield from _serve(0.0)
+
+@pytest.fixture
+def slow_forum_stub():
+    """每个请求延迟 SLOW_STUB_DELAY 秒的桩服务器，返回其 base_url。"""
+    yield from _serve(SLOW_STUB_DELAY)
+
+@pytest.fixture
+def refused_base_url():
+    """一个没有服务在监听的本地地址，连接会被拒绝。"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+@pytest.fixture
+def runner_cache(monkeypatch):
+    """替换为空的结果缓存，各测试的命中计数互不影响。"""
+    cache = ResponseCache(max_entries=4)
+    monkeypatch.setattr(view_helpers, 'runner_cache', cache)
+    return cache
+
+@pytest.fixture
+def client(runner_cache):
+    """未开启性能剖析的应用的测试客户端。"""
+    from app import create_app
+
+    return create_app(profiling=False).test_client()
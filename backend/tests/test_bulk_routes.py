@@ -0,0 +1,127 @@
+"""/run-*-custom-bulk 接口：JSON 数组、{"items": [...]} 与 NDJSON 三种请求体，结果与单条接口一致。"""
+import json
+
+import pytest
+
+import view_helpers
+
+HUGE = 10 ** 330
+
+BULK_CASES = {
+    'triangle': [
+        {'a': 3, 'b': 4, 'c': 5},
+        {'a': 2, 'b': 2, 'c': 2},
+        {'a': True, 'b': True, 'c': True},
+        {'a': 1e400, 'b': 1, 'c': 1},
+        {'a': HUGE, 'b': 1, 'c': 1},
+        {'a': 'x', 'b': 1, 'c': 1},
+        {'a': 127, 'b': 127, 'c': 127},
+    ],
+    'calendar': [
+        {'year': 2000, 'month': 2, 'day': 29},
+        {'year': 2200, 'month': 12, 'day': 31},
+        {'year': 2000, 'month': True, 'day': 31},
+        {'year': HUGE, 'month': 1, 'day': 1},
+        {'year': 1e400, 'month': 1, 'day': 1},
+        {'year': '2000', 'month': '1', 'day': '1'},
+        {'year': 'x', 'month': 1, 'day': 1},
+    ],
+    'telecom': [
+        {'call_minutes': 10, 'late_payments': 0},
+        {'call_minutes': 50, 'late_payments': 2},
+        {'call_minutes': True, 'late_payments': False},
+        {'call_minutes': HUGE, 'late_payments': 0},
+        {'call_minutes': 1e400, 'late_payments': 0},
+        {'call_minutes': -1, 'late_payments': 0},
+        {'call_minutes': 10},
+    ],
+    'commission': [
+        {'hosts': 10, 'monitors': 10, 'peripherals': 10},
+        {'hosts': 70, 'monitors': 80, 'peripherals': 90},
+        {'hosts': True, 'monitors': True, 'peripherals': False},
+        {'hosts': HUGE, 'monitors': 1, 'peripherals': 1},
+        {'hosts': 1e400, 'monitors': 1, 'peripherals': 1},
+        {'hosts': 0, 'monitors': 1, 'peripherals': 1},
+        {'hosts': 'x', 'monitors': 1, 'peripherals': 1},
+    ],
+    'evaluation': [
+        {'sales': 500, 'work_hours': 20, 'leaves': 0, 'level': 1},
+        {'sales': 199.5, 'work_hours': 19.5, 'leaves': 15, 'level': 2},
+        {'sales': True, 'work_hours': True, 'leaves': False, 'level': True},
+        {'sales': HUGE, 'work_hours': 1e400, 'leaves': -HUGE, 'level': 1},
+        {'sales': '500', 'work_hours': 20, 'leaves': 0, 'level': 1},
+    ],
+}
+
+def post_json(client, route, payload):
+    return client.post(route, data=json.dumps(payload), content_type='application/json')
+
+def single_outputs(client, module, items):
+    return [post_json(client, f'/run-{module}-custom', item).get_json() for item in items]
+
+def expected_summary(outputs):
+    errors = sum('error' in output or output.get('status') == 'error' for output in outputs)
+    return {'totalCount': len(outputs), 'errorCount': errors}
+
+@pytest.mark.parametrize('module', sorted(BULK_CASES))
+def test_json_array_matches_single_route(client, module):
+    items = BULK_CASES[module]
+    expected = single_outputs(client, module, items)
+
+    response = post_json(client, f'/run-{module}-custom-bulk', items)
+    assert response.status_code == 200
+    assert response.get_json() == {'results': expected, 'summary': expected_summary(expected)}
+
+@pytest.mark.parametrize('module', sorted(BULK_CASES))
+def test_items_object_matches_json_array(client, module):
+    items = BULK_CASES[module]
+    as_array = post_json(client, f'/run-{module}-custom-bulk', items).get_json()
+    assert post_json(client, f'/run-{module}-custom-bulk', {'items': items}).get_json() == as_array
+
+@pytest.mark.parametrize('module', sorted(BULK_CASES))
+def test_ndjson_streams_one_line_per_item(client, monkeypatch, module):
+    # 小块大小让多块处理的顺序与汇总同样被覆盖
+    monkeypatch.setattr(view_helpers, 'BULK_CHUNK_SIZE', 2)
+    items = BULK_CASES[module]
+    expected = single_outputs(client, module, items)
+    body = '\n'.join(json.dumps(item) for item in items) + '\n\n'
+
+    response = client.post(f'/run-{module}-custom-bulk', data=body, content_type=view_helpers.NDJSON_MIMETYPE)
+    assert response.mimetype == view_helpers.NDJSON_MIMETYPE
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines == expected + [{'summary': expected_summary(expected)}]
+
+def test_ndjson_malformed_line_is_an_item_error(client):
+    body = '{"a": 3, "b": 4, "c": 5}\nnot json\n{"a": 1, "b": 1, "c": 1}\n'
+    response = client.post('/run-triangle-custom-bulk', data=body, content_type=view_helpers.NDJSON_MIMETYPE)
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert [line.get('output_type') for line in lines[:3]] == ['一般三角形', None, '等边三角形']
+    assert 'error' in lines[1]
+    assert lines[3] == {'summary': {'totalCount': 3, 'errorCount': 1}}
+
+def test_ndjson_empty_body(client):
+    response = client.post('/run-calendar-custom-bulk', data='', content_type=view_helpers.NDJSON_MIMETYPE)
+    assert response.get_data(as_text=True) == '{"summary": {"totalCount": 0, "errorCount": 0}}\n'
+
+@pytest.mark.parametrize('payload', [{'a': 1}, 'x', 3, None, {'items': 'x'}])
+def test_non_array_body_is_rejected(client, payload):
+    response = post_json(client, '/run-telecom-custom-bulk', payload)
+    assert response.status_code == 400
+    assert response.get_json() == {'error': '请求体必须是输入数组'}
+
+def test_empty_array(client):
+    response = post_json(client, '/run-evaluation-custom-bulk', [])
+    assert response.get_json() == {'results': [], 'summary': {'totalCount': 0, 'errorCount': 0}}
+
+@pytest.mark.parametrize('route, payload', [
+    ('/run-triangle-custom', {'a': HUGE, 'b': 1, 'c': 1}),
+    ('/run-calendar-custom', {'year': 1e400, 'month': 1, 'day': 1}),
+    ('/run-telecom-custom', {'call_minutes': 1e400, 'late_payments': 0}),
+    ('/run-commission-custom', {'hosts': 1e400, 'monitors': 1, 'peripherals': 1}),
+])
+def test_out_of_range_numbers_are_input_errors(client, route, payload):
+    # 超出浮点范围的数字与无法转换的输入一样返回 400，而不是 500
+    response = post_json(client, route, payload)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
@@ -0,0 +1,66 @@
+"""日序表日期引擎与 calculate_next_day 的结果一致性。"""
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from calendar import INVALID_DATE, add_days, calculate_next_day, days_between, format_dates, next_day_batch
+
+YEARS = [1799, 1800, 1900, 2000, 2023, 2024, 2199, 2200, 2201]
+MONTHS = [0, 1, 2, 4, 12, 13]
+DAYS = [0, 1, 28, 29, 30, 31, 32]
+
+def assert_matches_scalar(years, months, days):
+    years, months, days = np.asarray(years), np.asarray(months), np.asarray(days)
+    expected = [calculate_next_day(*date) for date in zip(years.tolist(), months.tolist(), days.tolist())]
+    assert format_dates(*next_day_batch(years, months, days)) == expected
+
+def date_grid(years, months, days, year_dtype, field_dtype):
+    grid = list(itertools.product(years, months, days))
+    return (
+        np.array([year for year, _, _ in grid], dtype=year_dtype),
+        np.array([month for _, month, _ in grid], dtype=field_dtype),
+        np.array([day for _, _, day in grid], dtype=field_dtype),
+    )
+
+@pytest.mark.parametrize('year_dtype, field_dtype, extremes', [
+    (np.int16, np.int8, [-128, -1, 127]),
+    (np.uint16, np.uint8, [255]),
+    (np.int64, np.int64, [-(2 ** 63), 2 ** 63 - 1]),
+    (np.uint64, np.uint64, [2 ** 63, 2 ** 64 - 1]),
+])
+def test_integer_dtypes(year_dtype, field_dtype, extremes):
+    limits = np.iinfo(year_dtype)
+    years = YEARS + [limits.min, limits.max]
+    assert_matches_scalar(*date_grid(years, MONTHS + extremes, DAYS + extremes, year_dtype, field_dtype))
+
+def test_python_ints_beyond_int64():
+    huge = 2 ** 70
+    assert_matches_scalar(
+        np.array([huge, -huge, 2000, 2000, 2200], dtype=object),
+        np.array([1, 1, huge, 2, 12], dtype=object),
+        np.array([1, 1, 1, -huge, 31], dtype=object),
+    )
+
+def test_floats_are_invalid():
+    years, months, days = date_grid([2000.0, math.nan, math.inf], [1.0, math.nan], [1.0, math.nan], float, float)
+    assert_matches_scalar(years, months, days)
+    assert set(format_dates(*next_day_batch(years, months, days))) == {INVALID_DATE}
+
+def test_bools_count_as_integers():
+    # 标量版本把 bool 当作整数校验，但会把 True 原样格式化为 "True"；批量版本输出数值
+    years = np.array([2000, 2000, 2000])
+    months = np.array([True, 2, False])
+    days = np.array([1, True, 1])
+    assert format_dates(*next_day_batch(years, months, days)) == ['2000.1.2', '2000.2.2', INVALID_DATE]
+    assert calculate_next_day(2000, 1, 1) == '2000.1.2'
+    assert calculate_next_day(2000, 2, True) == '2000.2.2'
+    assert calculate_next_day(2000, False, 1) == INVALID_DATE
+
+def test_add_days_and_days_between():
+    assert add_days(2000, 2, 28, 1) == calculate_next_day(2000, 2, 28)
+    assert add_days(1800, 1, 1, -1) == INVALID_DATE
+    assert add_days(2200, 12, 31, 1) == INVALID_DATE
+    assert days_between((2000, 1, 1), (2001, 1, 1)) == 366
+    assert days_between((2000, 1, 1), (2000, 2, 30)) is None
@@ -0,0 +1,109 @@
+"""佣金定点批量计算、查找表与标量版本的结果一致性。"""
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from commission import (
+    MAX_HOSTS_PER_MONTH, MAX_MONITORS_PER_MONTH, MAX_PERIPHERALS_PER_MONTH, calculate_sales_and_commission,
+    calculate_sales_and_commission_cents_batch, find_combos_by_commission, find_combos_by_sales,
+    lookup_sales_and_commission,
+)
+from money import to_cents
+
+HOSTS = [-1, 0, 1, 2, 39, 40, 69, 70, 71]
+MONITORS = [-1, 0, 1, 2, 33, 34, 79, 80, 81]
+PERIPHERALS = [-1, 0, 1, 10, 11, 89, 90, 91]
+
+def assert_matches_scalar(hosts, monitors, peripherals):
+    hosts, monitors, peripherals = np.asarray(hosts), np.asarray(monitors), np.asarray(peripherals)
+    result = calculate_sales_and_commission_cents_batch(hosts, monitors, peripherals)
+    for index, values in enumerate(zip(hosts.tolist(), monitors.tolist(), peripherals.tolist())):
+        expected = calculate_sales_and_commission(*values)
+        assert result['valid'][index] == (expected['status'] == 'success'), values
+        assert result['sales_cents'][index] == expected['sales'] * 100
+        assert result['commission_cents'][index] == to_cents(expected['commission'])
+
+def quantity_grid(dtype, extremes=()):
+    grid = np.array(list(itertools.product(HOSTS + list(extremes), MONITORS, PERIPHERALS + list(extremes))))
+    return grid[:, 0].astype(dtype), grid[:, 1].astype(dtype), grid[:, 2].astype(dtype)
+
+@pytest.mark.parametrize('dtype, extremes', [
+    (np.int8, [-128, 127]),
+    (np.int16, [-32768, 32767]),
+    (np.int64, [np.iinfo(np.int64).min, np.iinfo(np.int64).max]),
+])
+def test_signed_dtypes(dtype, extremes):
+    assert_matches_scalar(*quantity_grid(dtype, extremes))
+
+def test_unsigned_dtypes():
+    hosts, monitors, peripherals = np.meshgrid(
+        np.array([0, 1, 70, 71, 255], dtype=np.uint8),
+        np.array([0, 1, 80, 2 ** 64 - 1], dtype=np.uint64),
+        np.array([0, 90, 91, 255], dtype=np.uint8),
+    )
+    assert_matches_scalar(hosts.ravel(), monitors.ravel(), peripherals.ravel())
+
+def test_bools_count_as_integers():
+    hosts, monitors, peripherals = np.meshgrid([False, True], [False, True], [False, True])
+    assert_matches_scalar(hosts.ravel(), monitors.ravel(), peripherals.ravel())
+
+def test_python_ints_beyond_int64():
+    huge = 2 ** 70
+    assert_matches_scalar(
+        np.array([1, huge, 1, 70, -huge], dtype=object),
+        np.array([1, 1, 1, 80, 1], dtype=object),
+        np.array([0, 0, huge, 90, 0], dtype=object),
+    )
+
+def test_float_arrays_are_invalid():
+    assert_matches_scalar(np.array([1.0, math.nan]), np.array([1.0, 1.0]), np.array([0.0, math.inf]))
+
+def test_commission_tiers_are_exact():
+    # 1000 元与 1800 元为分档边界，边界本身属于较低一档
+    result = calculate_sales_and_commission_cents_batch([10, 10, 18, 18], [10, 10, 18, 18], [10, 11, 18, 19])
+    assert result['sales_cents'].tolist() == [100000, 104500, 180000, 184500]
+    assert result['commission_cents'].tolist() == [10000, 15675, 27000, 36900]
+
+def legal_domain():
+    return [grid.ravel() for grid in np.meshgrid(
+        np.arange(1, MAX_HOSTS_PER_MONTH + 1),
+        np.arange(1, MAX_MONITORS_PER_MONTH + 1),
+        np.arange(0, MAX_PERIPHERALS_PER_MONTH + 1),
+        indexing='ij',
+    )]
+
+def test_lookup_matches_scalar_over_legal_domain():
+    for values in zip(*(column.tolist() for column in legal_domain())):
+        assert lookup_sales_and_commission(*values) == calculate_sales_and_commission(*values)
+
+@pytest.mark.parametrize('values', [
+    (True, True, True),
+    (True, True, False),
+    (False, 1, 0),
+    (2 ** 70, 1, 0),
+    (1, 1, -2 ** 70),
+    (71, 1, 0),
+    (1, 81, 0),
+    (1, 1, 91),
+    (1.0, 1, 0),
+    (math.nan, 1, 0),
+    (np.int8(5), 5, 5),
+])
+def test_lookup_matches_scalar_on_edge_inputs(values):
+    assert lookup_sales_and_commission(*values) == calculate_sales_and_commission(*values)
+
+def matching_combos(cents, low, high):
+    hosts, monitors, peripherals = legal_domain()
+    mask = (cents >= low) & (cents <= high)
+    return sorted(zip(hosts[mask].tolist(), monitors[mask].tolist(), peripherals[mask].tolist()))
+
+def test_inverse_queries_match_brute_force():
+    result = calculate_sales_and_commission_cents_batch(*legal_domain())
+    sales, commission = result['sales_cents'], result['commission_cents']
+
+    assert sorted(map(tuple, find_combos_by_sales(1000).tolist())) == matching_combos(sales, 100000, 100000)
+    assert sorted(map(tuple, find_combos_by_sales(1795, 1805).tolist())) == matching_combos(sales, 179500, 180500)
+    assert sorted(map(tuple, find_combos_by_commission(156.75, 160).tolist())) == matching_combos(commission, 15675, 16000)
+    assert find_combos_by_sales(1001).size == 0
@@ -0,0 +1,71 @@
+"""calculate_employee_score_batch 与逐个调用 calculate_employee_score 的结果一致性。"""
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from evaluation import calculate_employee_score, calculate_employee_score_batch
+
+SALES = [-1, 0, 199, 200, 299, 300, 399, 400, 499, 500, 10_000]
+HOURS = [-1, 0, 19, 20, 21]
+LEAVES = [-1, 0, 9, 10, 14, 15, 16]
+LEVELS = [0, 1, 2]
+
+def assert_matches_scalar(sales, work_hours, leaves, level):
+    columns = [np.asarray(column) for column in (sales, work_hours, leaves, level)]
+    expected = [calculate_employee_score(*row) for row in zip(*(column.tolist() for column in columns))]
+    assert calculate_employee_score_batch(*columns).tolist() == expected
+
+def score_grid(sales_dtype, field_dtype, sales=SALES, extremes=()):
+    grid = list(itertools.product(sales, HOURS + list(extremes), LEAVES + list(extremes), LEVELS + list(extremes)))
+    sales_column, hours, leaves, level = zip(*grid)
+    return (
+        np.array(sales_column, dtype=sales_dtype),
+        np.array(hours, dtype=field_dtype),
+        np.array(leaves, dtype=field_dtype),
+        np.array(level, dtype=field_dtype),
+    )
+
+@pytest.mark.parametrize('sales_dtype, field_dtype, extremes', [
+    (np.int16, np.int8, [-128, 127]),
+    (np.int64, np.int64, [np.iinfo(np.int64).min, np.iinfo(np.int64).max]),
+    (np.float32, np.float32, [-3e38, 3e38]),
+    (np.float64, np.float64, [-math.inf, math.inf]),
+])
+def test_numeric_dtypes(sales_dtype, field_dtype, extremes):
+    assert_matches_scalar(*score_grid(sales_dtype, field_dtype, extremes=extremes))
+
+def test_int8_sales():
+    assert_matches_scalar(*score_grid(np.int8, np.int8, sales=[-128, -1, 0, 127]))
+
+@pytest.mark.parametrize('sales_dtype, field_dtype, extreme', [
+    (np.uint16, np.uint8, 255),
+    (np.uint64, np.uint64, 2 ** 64 - 1),
+])
+def test_unsigned_dtypes(sales_dtype, field_dtype, extreme):
+    grid = list(itertools.product([0, 199, 200, 500, extreme], [0, 20, extreme], [0, 10, 15, extreme], [0, 1, extreme]))
+    sales, hours, leaves, level = zip(*grid)
+    assert_matches_scalar(
+        np.array(sales, dtype=sales_dtype),
+        np.array(hours, dtype=field_dtype),
+        np.array(leaves, dtype=field_dtype),
+        np.array(level, dtype=field_dtype),
+    )
+
+def test_bools():
+    sales, hours, leaves, level = zip(*itertools.product([False, True], repeat=4))
+    assert_matches_scalar(sales, hours, leaves, level)
+
+def test_python_ints_beyond_int64():
+    huge = 2 ** 70
+    assert_matches_scalar(
+        np.array([huge, -huge, 300, 300, 300], dtype=object),
+        np.array([20, 20, huge, -huge, 20], dtype=object),
+        np.array([0, 0, huge, -huge, 0], dtype=object),
+        np.array([1, 1, 1, 1, huge], dtype=object),
+    )
+
+def test_nan():
+    sales, hours, leaves, level = score_grid(np.float64, np.float64, sales=SALES + [math.nan], extremes=[math.nan])
+    assert_matches_scalar(sales, hours, leaves, level)
@@ -0,0 +1,131 @@
+"""forum_api_tester 对本地桩服务器的离线测试。"""
+import asyncio
+import http.client
+import json
+
+import pytest
+
+from forum_api_tester import (
+    CURL_COULDNT_CONNECT, CURL_OK, FORUM_ENDPOINTS, ConnectionPool, latency_percentiles, run_forum_tests,
+    run_load_test, summarize_windows,
+)
+from tests.conftest import SLOW_STUB_DELAY
+
+def test_run_forum_tests_response_shape(forum_stub):
+    report = run_forum_tests(base_url=forum_stub, repeat=3, concurrency=4)
+
+    info = report['test_info']
+    assert info['base_url'] == forum_stub
+    assert info['total_tests'] == len(FORUM_ENDPOINTS)
+    assert info['passed_tests'] == len(FORUM_ENDPOINTS)
+    assert info['failed_tests'] == 0
+    assert info['success_rate'] == '100%'
+    assert info['total_requests'] == 3 * len(FORUM_ENDPOINTS)
+    assert set(info['response_time_percentiles']) == {'p50', 'p95', 'p99'}
+
+    assert set(report['test_results']) == set(FORUM_ENDPOINTS)
+    for name, entry in report['test_results'].items():
+        result = entry['result']
+        assert entry['input_data'] == FORUM_ENDPOINTS[name]['input_data']
+        assert result['status'] == 'passed'
+        assert result['http_code'] == '200'
+        assert result['curl_exit_code'] == CURL_OK
+        assert result['requests'] == 3
+        assert result['failed_requests'] == 0
+        assert result['api_info']['path'] == FORUM_ENDPOINTS[name]['path']
+        assert 'code' in json.loads(result['response_body'])
+
+def test_unknown_endpoint_fails(forum_stub):
+    endpoints = {'Missing': {'method': 'GET', 'path': '/api/missing', 'description': '不存在的接口', 'input_data': {}}}
+    report = run_forum_tests(base_url=forum_stub, endpoints=endpoints)
+
+    result = report['test_results']['Missing']['result']
+    assert result['status'] == 'failed'
+    assert result['http_code'] == '404'
+    assert report['test_info']['success_rate'] == '0%'
+
+def test_percentiles_follow_stub_delay(slow_forum_stub):
+    report = run_forum_tests(base_url=slow_forum_stub, repeat=4, concurrency=5)
+
+    for entry in report['test_results'].values():
+        percentiles = {key: float(value) for key, value in entry['result']['response_time_percentiles'].items()}
+        assert SLOW_STUB_DELAY <= percentiles['p50'] <= percentiles['p95'] <= percentiles['p99'] < 1
+
+def test_latency_percentiles():
+    assert latency_percentiles([]) == {'p50': None, 'p95': None, 'p99': None}
+    assert latency_percentiles([float(value) for value in range(1, 101)]) == {'p50': 50.5, 'p95': 95.05, 'p99': 99.01}
+
+def test_connection_refused(refused_base_url):
+    report = run_forum_tests(base_url=refused_base_url, timeout=2)
+
+    info = report['test_info']
+    assert info['passed_tests'] == 0
+    assert info['response_time_percentiles'] is None
+    for entry in report['test_results'].values():
+        result = entry['result']
+        assert result['status'] == 'failed'
+        assert result['http_code'] == '000'
+        assert result['curl_exit_code'] == CURL_COULDNT_CONNECT
+        assert result['response_time_percentiles'] is None
+
+def test_load_test_against_stub(forum_stub):
+    report = run_load_test(base_url=forum_stub, duration=1, concurrency=2, window=0.5)
+
+    info = report['load_info']
+    assert info['mode'] == 'concurrency'
+    assert info['requests'] > 0
+    assert info['errors'] == 0
+    assert info['latency']['p50'] <= info['latency']['p95'] <= info['latency']['p99']
+    windows = report['windows']
+    assert windows['time'] == [0.0, 0.5]
+    assert sum(windows['requests']) == info['requests']
+    assert set(report['endpoints']) == set(FORUM_ENDPOINTS)
+
+def test_load_test_connection_refused(refused_base_url):
+    report = run_load_test(base_url=refused_base_url, duration=0.2, rate=20, window=0.1, timeout=2)
+
+    info = report['load_info']
+    assert info['mode'] == 'rate'
+    assert info['requests'] > 0
+    assert info['errors'] == info['requests']
+    assert info['error_rate'] == 1
+    assert info['latency'] == {'p50': None, 'p95': None, 'p99': None}
+
+def test_late_samples_join_last_window():
+    samples = [{'finished_at': offset, 'response_time': 0.01, 'failed': False} for offset in (0.1, 0.6, 0.9, 1.0001)]
+    windows = summarize_windows(samples, 0.0, 0.5, 1.0, 1.0002)
+
+    assert windows['time'] == [0.0, 0.5]
+    assert windows['requests'] == [1, 3]
+    assert windows['throughput'] == [2.0, round(3 / 0.5002, 3)]
+
+class DroppedConnection:
+    """每次请求都被服务端断开的连接，记录是否已关闭。"""
+    created = []
+
+    def __init__(self, *args, **kwargs):
+        self.closed = False
+        DroppedConnection.created.append(self)
+
+    def request(self, *args, **kwargs):
+        raise http.client.RemoteDisconnected('closed by server')
+
+    def close(self):
+        self.closed = True
+
+def test_failed_retry_closes_new_connection():
+    async def request_once():
+        pool = ConnectionPool('http://127.0.0.1:9', size=1)
+        pool.connection_class = DroppedConnection
+        pool.idle.append(DroppedConnection())
+        try:
+            await pool.request('GET', '/')
+        finally:
+            pool.close()
+
+    DroppedConnection.created = []
+    with pytest.raises(http.client.RemoteDisconnected):
+        asyncio.run(request_once())
+    # 复用的空闲连接与重试时新建的连接都已关闭
+    assert len(DroppedConnection.created) == 2
+    assert all(connection.closed for connection in DroppedConnection.created)
@@ -0,0 +1,107 @@
+"""请求级指标与 /metrics 的 Prometheus 文本输出。"""
+import threading
+
+import pytest
+
+import app as app_module
+import metrics
+from metrics import BUSINESS_PHASE, ENCODE_PHASE, RequestMetrics
+
+@pytest.fixture
+def registry(monkeypatch):
+    """替换为空的指标注册表，应用与各阶段计时都写入它。"""
+    registry = RequestMetrics()
+    monkeypatch.setattr(metrics, 'request_metrics', registry)
+    monkeypatch.setattr(app_module, 'request_metrics', registry)
+    return registry
+
+@pytest.fixture
+def metrics_client(registry, runner_cache):
+    return app_module.create_app(metrics=True, profiling=False).test_client()
+
+def fetch(client, route, **kwargs):
+    # 指标在响应关闭时写入
+    response = client.open(route, **kwargs)
+    body = response.get_data()
+    response.close()
+    return response, body
+
+def sample(text, name, **labels):
+    label_text = ','.join(f'{key}="{value}"' for key, value in labels.items())
+    prefix = f'{name}{{{label_text}}} '
+    values = [line[len(prefix):] for line in text.splitlines() if line.startswith(prefix)]
+    assert len(values) == 1, prefix
+    return float(values[0])
+
+def test_histogram_buckets_are_cumulative():
+    registry = RequestMetrics(latency_buckets=(1, 2), size_buckets=(10,))
+    for size in (5, 10, 11):
+        registry.end_request('/r', 'POST', 200, registry.begin_request(), request_bytes=size, response_bytes=None)
+    text = registry.render()
+
+    assert sample(text, 'http_request_size_bytes_bucket', route='/r', method='POST', le='10') == 2
+    assert sample(text, 'http_request_size_bytes_bucket', route='/r', method='POST', le='+Inf') == 3
+    assert sample(text, 'http_request_size_bytes_sum', route='/r', method='POST') == 26
+    assert 'http_response_size_bytes_count' not in text
+
+def test_labels_are_escaped():
+    registry = RequestMetrics()
+    registry.end_request('/a"b\\c', 'GET', 200, registry.begin_request())
+    assert 'route="/a\\"b\\\\c"' in registry.render()
+
+def test_phases_are_attributed_to_the_current_request():
+    registry = RequestMetrics()
+    started_at = registry.begin_request()
+    registry.add_phase(BUSINESS_PHASE, 0.25)
+    registry.add_phase(BUSINESS_PHASE, 0.5)
+    registry.end_request('/r', 'GET', 200, started_at)
+    # 请求结束后的阶段耗时不再计入
+    registry.add_phase(ENCODE_PHASE, 1.0)
+
+    text = registry.render()
+    assert sample(text, 'http_request_phase_seconds_total', route='/r', phase=BUSINESS_PHASE) == 0.75
+    assert f'phase="{ENCODE_PHASE}"' not in text
+
+def test_concurrent_requests_are_all_counted():
+    registry = RequestMetrics()
+
+    def worker():
+        for _ in range(200):
+            started_at = registry.begin_request()
+            registry.add_phase(BUSINESS_PHASE, 0.001)
+            registry.end_request('/r', 'GET', 200, started_at)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    text = registry.render()
+    assert sample(text, 'http_requests_total', route='/r', method='GET', status='200') == 1600
+    assert sample(text, 'http_request_phase_seconds_total', route='/r', phase=BUSINESS_PHASE) == pytest.approx(1.6)
+
+def test_metrics_endpoint_reports_routes(metrics_client):
+    fetch(metrics_client, '/run-triangle-tests?type=bva')
+    fetch(metrics_client, '/run-triangle-tests?type=equivalence')
+    fetch(metrics_client, '/run-triangle-custom', method='POST', json={'a': 'x'})
+    fetch(metrics_client, '/no-such-route')
+
+    response, text = fetch(metrics_client, '/metrics')
+    text = text.decode()
+    assert response.content_type == metrics.PROMETHEUS_MIMETYPE
+    assert sample(text, 'http_requests_total', route='/run-triangle-tests', method='GET', status='200') == 2
+    assert sample(text, 'http_requests_total', route='/run-triangle-custom', method='POST', status='400') == 1
+    assert sample(text, 'http_requests_total', route='unmatched', method='GET', status='404') == 1
+    assert sample(text, 'http_request_duration_seconds_count', route='/run-triangle-tests', method='GET') == 2
+    assert sample(text, 'http_response_size_bytes_count', route='/run-triangle-tests', method='GET') == 2
+    assert sample(text, 'http_request_size_bytes_count', route='/run-triangle-custom', method='POST') == 1
+    assert sample(text, 'http_request_phase_seconds_total', route='/run-triangle-tests', phase=BUSINESS_PHASE) > 0
+    assert sample(text, 'http_request_phase_seconds_total', route='/run-triangle-tests', phase=ENCODE_PHASE) > 0
+
+def test_streamed_response_size_is_counted_on_close(metrics_client, registry):
+    _, body = fetch(metrics_client, '/run-calendar-tests?type=bva&stream=1')
+
+    text = registry.render()
+    assert sample(text, 'http_response_size_bytes_sum', route='/run-calendar-tests', method='GET') == len(body)
+    assert sample(text, 'http_request_phase_seconds_total', route='/run-calendar-tests', phase=BUSINESS_PHASE) > 0
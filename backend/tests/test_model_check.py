@@ -0,0 +1,45 @@
+"""穷举模型检验：参考预言与业务函数逐点一致，不一致点按区间合并。"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model_check import CHECKS, Check, check_slice, format_region, merge_regions, run_check
+
+def sample_firsts(domain):
+    values = list(domain)
+    return sorted({values[0], values[1], values[len(values) // 2], values[-2], values[-1]})
+
+@pytest.mark.parametrize('name', sorted(CHECKS))
+def test_functions_match_oracles_on_sampled_slices(name):
+    for first in sample_firsts(CHECKS[name].domain[0]):
+        count, mismatches = check_slice(name, first)
+        assert count > 0
+        assert mismatches == []
+
+def test_merge_regions_joins_adjacent_points():
+    points = [((a, b), 'x', 'y') for a in (1, 2, 3) for b in (5, 6)]
+    assert merge_regions(points) == [([(1, 3), (5, 6)], 6, ((1, 5), 'x', 'y'))]
+
+def test_merge_regions_keeps_gaps_and_different_results_apart():
+    points = [((1,), 'x', 'y'), ((2,), 'x', 'y'), ((4,), 'x', 'y'), ((3,), 'z', 'y')]
+    assert [(bounds, count) for bounds, count, _ in merge_regions(points)] == [
+        ([(1, 2)], 2), ([(3, 3)], 1), ([(4, 4)], 1),
+    ]
+    assert merge_regions([]) == []
+
+def test_run_check_reports_planted_mismatch(monkeypatch):
+    def planted(a, b):
+        return '非三角形' if a == 3 and b >= 2 else '一般三角形'
+
+    monkeypatch.setitem(CHECKS, 'planted', Check(
+        function=planted,
+        oracle=lambda a, b: '一般三角形',
+        project=lambda result: result,
+        domain=(range(0, 5), range(0, 4)),
+    ))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = run_check('planted', executor)
+
+    assert (result['points'], result['mismatches']) == (20, 2)
+    assert [(bounds, count) for bounds, count, _ in result['regions']] == [([(3, 3), (2, 3)], 2)]
+    assert format_region(result['regions'][0][0]) == '3 × 2..3'
@@ -0,0 +1,34 @@
+"""定点金额工具：ROUND_HALF_UP 整数除法与元/分换算。"""
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+
+from money import BASIS_POINTS, CENTS_PER_UNIT, cents_to_amount, divide_half_up, to_cents
+
+@pytest.mark.parametrize('denominator', [2, 3, 7, CENTS_PER_UNIT, BASIS_POINTS])
+def test_divide_half_up_matches_decimal(denominator):
+    for numerator in range(0, 5 * denominator + 1):
+        expected = int((Decimal(numerator) / denominator).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+        assert divide_half_up(numerator, denominator) == expected
+
+def test_divide_half_up_on_arrays():
+    numerators = np.array([0, 4999, 5000, 5001, 14999, 15000], dtype=np.int64)
+    assert divide_half_up(numerators, BASIS_POINTS).tolist() == [0, 0, 1, 1, 1, 2]
+
+def test_divide_half_up_on_python_ints_beyond_int64():
+    huge = 10 ** 30
+    assert divide_half_up(huge * BASIS_POINTS + BASIS_POINTS // 2, BASIS_POINTS) == huge + 1
+
+def test_to_cents_absorbs_binary_error():
+    assert 0.29 * CENTS_PER_UNIT != 29
+    assert to_cents(0.29) == 29
+    assert to_cents(26.49) == 2649
+    assert to_cents(25) == 2500
+    assert to_cents(0.1 + 0.2) == 30
+
+def test_cents_round_trip():
+    for cents in range(0, 100_000, 7):
+        assert to_cents(cents_to_amount(cents)) == cents
+    assert cents_to_amount(2649) == 26.49
+    assert cents_to_amount(np.array([1, 2649])).tolist() == [0.01, 26.49]
@@ -0,0 +1,86 @@
+"""按请求开启的性能剖析：管理员令牌校验、剖析方式与结果查询。"""
+import pytest
+
+import app as app_module
+from profiling import TRACE_MODE, ProfileStore, collapse_stacks
+
+ADMIN_TOKEN = 'test-admin-token'
+ADMIN = {'X-Admin-Token': ADMIN_TOKEN}
+ROUTE = '/run-triangle-tests?type=bva'
+
+@pytest.fixture
+def profile_store(monkeypatch):
+    store = ProfileStore(max_entries=2)
+    monkeypatch.setattr(app_module, 'profile_store', store)
+    return store
+
+@pytest.fixture
+def profiling_client(monkeypatch, profile_store, runner_cache):
+    """开启性能剖析、管理员令牌为 ADMIN_TOKEN 的应用的测试客户端。"""
+    monkeypatch.setattr(app_module, 'PROFILE_ADMIN_TOKEN', ADMIN_TOKEN)
+    return app_module.create_app(metrics=False, profiling=True).test_client()
+
+def test_unflagged_requests_are_not_profiled(profiling_client, profile_store):
+    response = profiling_client.get(ROUTE, headers=ADMIN)
+    assert response.status_code == 200
+    assert 'X-Profile-Id' not in response.headers
+    assert profile_store.list() == []
+
+@pytest.mark.parametrize('headers', [{}, {'X-Admin-Token': 'wrong'}, {'X-Admin-Token': ''}])
+def test_non_admin_requests_are_rejected(profiling_client, profile_store, headers):
+    response = profiling_client.get(ROUTE, headers={'X-Profile': '1', **headers})
+    assert response.status_code == 403
+    assert profile_store.list() == []
+
+def test_gate_is_closed_without_a_configured_token(monkeypatch, profiling_client):
+    monkeypatch.setattr(app_module, 'PROFILE_ADMIN_TOKEN', None)
+    response = profiling_client.get(ROUTE + '&profile=1', headers={'X-Admin-Token': ''})
+    assert response.status_code == 403
+
+def test_unknown_mode_is_rejected(profiling_client):
+    response = profiling_client.get(ROUTE, headers={'X-Profile': 'cprofile', **ADMIN})
+    assert response.status_code == 400
+
+@pytest.mark.parametrize('flag, mode', [('1', 'sample'), ('sample', 'sample'), ('trace', TRACE_MODE)])
+def test_admin_request_is_profiled(profiling_client, profile_store, runner_cache, flag, mode):
+    plain = profiling_client.get(ROUTE).get_json()
+    response = profiling_client.get(ROUTE + f'&profile={flag}', headers=ADMIN)
+
+    assert response.status_code == 200
+    assert response.get_json() == plain
+    profile_id = response.headers['X-Profile-Id']
+    [summary] = profile_store.list()
+    assert (summary['id'], summary['route'], summary['mode']) == (profile_id, '/run-triangle-tests', mode)
+    # 剖析请求绕过结果缓存，只有未剖析的那次请求写入缓存
+    assert runner_cache.stats()['misses'] == 1
+
+def test_trace_profile_is_served_as_collapsed_stacks(profiling_client):
+    profile_id = profiling_client.get(ROUTE, headers={'X-Profile': TRACE_MODE, **ADMIN}).headers['X-Profile-Id']
+
+    response = profiling_client.get(f'/api/profiles/{profile_id}', headers=ADMIN)
+    assert response.mimetype == 'text/plain'
+    stacks = response.get_data(as_text=True)
+    assert 'triangle_type' in stacks
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in stacks.splitlines())
+
+def test_profile_queries_require_admin(profiling_client):
+    profile_id = profiling_client.get(ROUTE, headers={'X-Profile': TRACE_MODE, **ADMIN}).headers['X-Profile-Id']
+
+    assert profiling_client.get('/api/profiles').status_code == 403
+    assert profiling_client.get(f'/api/profiles/{profile_id}').status_code == 403
+    assert profiling_client.get('/api/profiles/missing', headers=ADMIN).status_code == 404
+    assert [profile['id'] for profile in profiling_client.get('/api/profiles', headers=ADMIN).get_json()] == [profile_id]
+
+def test_operational_routes_are_never_profiled(profiling_client, profile_store):
+    response = profiling_client.get('/metrics?profile=1', headers=ADMIN)
+    assert response.status_code == 200
+    assert 'X-Profile-Id' not in response.headers
+    assert profile_store.list() == []
+
+def test_store_keeps_the_newest_profiles(profile_store):
+    ids = [profile_store.add('/r', TRACE_MODE, 0.1, {('a', 'b'): 1}) for _ in range(3)]
+    assert [profile['id'] for profile in profile_store.list()] == ids[:0:-1]
+    assert profile_store.get(ids[0]) is None
+
+def test_collapse_stacks_orders_by_weight():
+    assert collapse_stacks({('main', 'b'): 1, ('main', 'a'): 3}) == 'main;a 3\nmain;b 1\n'
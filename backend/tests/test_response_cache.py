@@ -0,0 +1,86 @@
+"""结果缓存与 /run-*-tests 的 ETag、304 响应。"""
+import pytest
+
+import view_helpers
+from response_cache import ResponseCache, make_etag
+
+RUNNER_ROUTE = '/run-triangle-tests?type=bva'
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    assert cache.get('a') == b'1'
+    cache.put('c', b'3')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1'
+    assert cache.get('c') == b'3'
+    assert cache.stats()['size'] == 2
+
+def test_counters():
+    cache = ResponseCache(max_entries=2)
+    assert cache.get('missing') is None
+    cache.put('key', b'body')
+    cache.get('key')
+    cache.get('key')
+    cache.record_not_modified()
+
+    assert cache.stats() == {
+        'hits': 2, 'misses': 1, 'notModified': 1, 'hitRate': 66.67, 'size': 1, 'maxEntries': 2,
+    }
+    cache.clear()
+    assert cache.stats()['size'] == 0
+    assert cache.stats()['hits'] == 2
+
+def test_make_etag_separates_parts():
+    assert make_etag('ab', 'c') != make_etag('a', 'bc')
+
+def test_cached_run_and_not_modified(client, runner_cache):
+    first = client.get(RUNNER_ROUTE)
+    etag = first.headers['ETag']
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == 'no-cache'
+
+    second = client.get(RUNNER_ROUTE)
+    assert second.status_code == 200
+    assert second.get_data() == first.get_data()
+    assert second.headers['ETag'] == etag
+
+    revalidated = client.get(RUNNER_ROUTE, headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b''
+
+    stats = client.get('/api/runner-cache').get_json()
+    assert (stats['misses'], stats['hits'], stats['notModified']) == (1, 1, 1)
+
+def test_layouts_are_cached_separately(client):
+    rows = client.get(RUNNER_ROUTE)
+    columns = client.get(RUNNER_ROUTE + '&layout=columns')
+    assert rows.headers['ETag'] != columns.headers['ETag']
+
+def test_stream_bypasses_cache(client, runner_cache):
+    response = client.get(RUNNER_ROUTE + '&stream=1')
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+    assert runner_cache.stats()['misses'] == 0
+
+@pytest.mark.parametrize('builder', [view_helpers.runner_response, view_helpers.to_columns, view_helpers.iter_cases])
+def test_etag_covers_response_builders(client, monkeypatch, builder):
+    etag = client.get(RUNNER_ROUTE).headers['ETag']
+    digest = view_helpers.source_digest
+
+    # 模拟生成响应体的模块被修改：旧 ETag 不应再得到 304
+    monkeypatch.setattr(view_helpers, 'source_digest', lambda obj: 'edited' if obj is builder else digest(obj))
+    response = client.get(RUNNER_ROUTE, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+def test_etag_covers_telecom_money_helpers(client, monkeypatch):
+    import money
+
+    route = '/run-telecom-tests?type=bva'
+    etag = client.get(route).headers['ETag']
+    digest = view_helpers.source_digest
+    monkeypatch.setattr(view_helpers, 'source_digest', lambda obj: 'edited' if obj is money else digest(obj))
+    assert client.get(route, headers={'If-None-Match': etag}).status_code == 200
@@ -0,0 +1,36 @@
+"""/run-*-tests 的 ?stream=1 NDJSON 输出与一次性 JSON 输出一致。"""
+import json
+
+import pytest
+
+from view_helpers import NDJSON_MIMETYPE
+
+RUNNER_ROUTES = [
+    '/run-triangle-tests?type=bva',
+    '/run-triangle-tests?type=equivalence',
+    '/run-calendar-tests?type=bva',
+    '/run-calendar-tests?type=equivalence',
+    '/run-telecom-tests?type=bva',
+    '/run-telecom-tests?type=equivalence',
+    '/run-telecom-tests?type=decision',
+    '/run-commission-tests',
+    '/run-evaluation-tests',
+]
+
+def stream_route(route):
+    return route + ('&' if '?' in route else '?') + 'stream=1'
+
+@pytest.mark.parametrize('route', RUNNER_ROUTES)
+def test_stream_matches_json(client, route):
+    document = client.get(route).get_json()
+
+    response = client.get(stream_route(route))
+    assert response.status_code == 200
+    assert response.mimetype == NDJSON_MIMETYPE
+    assert 'ETag' not in response.headers
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines == document['results'] + [{'summary': document['summary']}]
+
+def test_stream_rejects_unknown_layout(client):
+    response = client.get(stream_route('/run-triangle-tests?layout=table'))
+    assert response.status_code == 400
@@ -0,0 +1,61 @@
+"""用例集文件的解析与逐条产出。"""
+import json
+
+import numpy as np
+
+from suite_registry import SuiteRegistry, iter_cases, load_suite
+from telecom_views import run_telecom_case
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+def test_csv_column_types(tmp_path):
+    path = write(tmp_path / 'cases.csv', 'id,a,rate,label\n1,3,0.5,x\n2,4,1,y\n')
+    suite = load_suite('cases', path)
+
+    assert suite.columns['id'] == ['1', '2']
+    assert suite.columns['a'].dtype == np.int64
+    assert suite.columns['rate'].dtype == np.float64
+    assert suite.columns['label'] == ['x', 'y']
+    assert list(iter_cases(suite)) == [
+        {'id': '1', 'a': 3, 'rate': 0.5, 'label': 'x'},
+        {'id': '2', 'a': 4, 'rate': 1.0, 'label': 'y'},
+    ]
+
+def test_csv_mixed_expected_column(tmp_path):
+    path = write(
+        tmp_path / 'telecom_mixed.csv',
+        'id,call_minutes,late_payments,expected\n1,10,0,26.49\n2,-1,0,非法输入\n3,0,0,25\n4,350,6,\n',
+    )
+    cases = list(iter_cases(load_suite('telecom_mixed', path)))
+
+    assert [case.get('expected') for case in cases] == [26.49, '非法输入', 25.0, None]
+    assert 'expected' not in cases[3]
+    assert type(cases[0]['call_minutes']) is int
+    # 数值预期与函数返回值可直接比较，混合列中的数值用例同样可以通过
+    assert [run_telecom_case(case)[1] for case in cases[:3]] == [True, True, True]
+
+def test_csv_integer_column_with_text(tmp_path):
+    path = write(tmp_path / 'cases.csv', 'id,expected\n1,7\n2,error\n')
+    assert [case['expected'] for case in iter_cases(load_suite('cases', path))] == [7, 'error']
+
+def test_json_missing_keys(tmp_path):
+    path = write(tmp_path / 'cases.json', json.dumps([{'id': 1, 'a': 2}, {'id': 2}]))
+    suite = load_suite('cases', path)
+
+    assert list(iter_cases(suite)) == [{'id': 1, 'a': 2}, {'id': 2}]
+    assert suite.missing['a'].tolist() == [False, True]
+
+def test_registry_reloads_changed_files(tmp_path):
+    path = tmp_path / 'cases.csv'
+    write(path, 'id,a\n1,1\n')
+    registry = SuiteRegistry(str(tmp_path))
+    first = registry.get('cases')
+    assert registry.get('cases') is first
+
+    write(path, 'id,a\n1,1\n2,22\n')
+    second = registry.get('cases')
+    assert second.length == 2
+    assert second.digest != first.digest
+    assert registry.names() == ['cases']
@@ -0,0 +1,37 @@
+"""系统测试分片：共享账号状态的文件必须分在同一片内。"""
+import pytest
+
+from systemtest_runner import SHARED_STATE_GROUPS, discover_test_files, shard_files
+
+def shard_of(shards, name):
+    return next(index for index, shard in enumerate(shards) if name in shard)
+
+@pytest.mark.parametrize('workers', [1, 2, 3, 4, 8])
+def test_shared_state_groups_stay_together(workers):
+    files = discover_test_files()
+    shards = shard_files(files, workers)
+
+    assert sorted(name for shard in shards for name in shard) == sorted(files)
+    assert len(shards) <= workers
+    for group in SHARED_STATE_GROUPS:
+        indexes = {shard_of(shards, name) for name in group}
+        assert len(indexes) == 1
+        shard = shards[indexes.pop()]
+        # 组内按文件名顺序执行，例如先写文章再删文章
+        assert [name for name in shard if name in group] == sorted(group)
+
+def test_group_files_exist():
+    files = set(discover_test_files())
+    for group in SHARED_STATE_GROUPS:
+        assert set(group) <= files
+
+def test_shards_are_balanced():
+    files = [f'test_{index:03d}.py' for index in range(9)]
+    shards = shard_files(files, 3, groups=[('test_000.py', 'test_001.py', 'test_002.py')])
+
+    assert shards[0] == ['test_000.py', 'test_001.py', 'test_002.py']
+    assert sorted(len(shard) for shard in shards) == [3, 3, 3]
+
+def test_more_workers_than_units():
+    assert shard_files(['test_a.py', 'test_b.py'], 5, groups=[('test_a.py', 'test_b.py')]) == [['test_a.py', 'test_b.py']]
+    assert shard_files([], 3) == []
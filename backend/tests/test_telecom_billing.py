@@ -0,0 +1,68 @@
+"""calculate_telecom_fee_batch / calculate_telecom_fee_cents_batch 与标量版本的结果一致性。"""
+import math
+
+import numpy as np
+import pytest
+
+from money import to_cents
+from telecom_billing import (
+    INT64_MAX, MAX_BATCH_CALL_MINUTES, calculate_telecom_fee, calculate_telecom_fee_batch,
+    calculate_telecom_fee_cents_batch,
+)
+
+FEE_FIELDS = ('raw_call_fee', 'applied_discount_rate', 'final_call_fee', 'total_fee')
+
+def assert_matches_scalar(call_minutes, late_payments):
+    call_minutes, late_payments = np.asarray(call_minutes), np.asarray(late_payments)
+    batch = calculate_telecom_fee_batch(call_minutes, late_payments)
+    cents = calculate_telecom_fee_cents_batch(call_minutes, late_payments)
+    for index, (minutes, lates) in enumerate(zip(call_minutes.tolist(), late_payments.tolist())):
+        expected = calculate_telecom_fee(minutes, lates)
+        # 分钟数超过 MAX_BATCH_CALL_MINUTES 时 int64 无法精确计算，批量版本标记为非法
+        computable = expected['status'] == 'success' and minutes <= MAX_BATCH_CALL_MINUTES
+        assert batch['valid'][index] == computable, (minutes, lates)
+        if computable:
+            assert [batch[field][index] for field in FEE_FIELDS] == [expected[field] for field in FEE_FIELDS]
+            assert cents['total_fee_cents'][index] == to_cents(expected['total_fee'])
+        else:
+            assert all(math.isnan(batch[field][index]) for field in FEE_FIELDS)
+            assert cents['total_fee_cents'][index] == 0
+
+def test_every_tier_boundary():
+    minutes, lates = np.meshgrid(np.arange(-1, 402), np.arange(-1, 8))
+    assert_matches_scalar(minutes.ravel(), lates.ravel())
+
+@pytest.mark.parametrize('dtype', [np.int8, np.uint8, np.int16, np.uint64])
+def test_narrow_and_unsigned_dtypes(dtype):
+    limits = np.iinfo(dtype)
+    values = [value for value in (limits.min, -1, 0, 1, 60, 61, 120, limits.max) if limits.min <= value <= limits.max]
+    minutes, lates = np.meshgrid(np.array(values, dtype=dtype), np.array(values, dtype=dtype))
+    assert_matches_scalar(minutes.ravel(), lates.ravel())
+
+def test_bools_count_as_integers():
+    assert_matches_scalar(np.array([True, False, True]), np.array([False, True, True]))
+    assert calculate_telecom_fee_batch(np.array([True]), np.array([False]))['valid'].all()
+
+def test_python_ints_beyond_int64():
+    huge = 2 ** 70
+    assert_matches_scalar(
+        np.array([10, 10, MAX_BATCH_CALL_MINUTES, 350, -huge], dtype=object),
+        np.array([0, huge, 0, INT64_MAX + 1, 0], dtype=object),
+    )
+
+def test_minutes_beyond_int64_range_are_flagged():
+    # int64 无法精确计算的分钟数只标记为非法，其余行照常计费
+    result = calculate_telecom_fee_cents_batch(
+        np.array([10, MAX_BATCH_CALL_MINUTES + 1, 2 ** 70], dtype=object), np.array([0, 0, 0]),
+    )
+    assert result['valid'].tolist() == [True, False, False]
+    assert result['total_fee_cents'].tolist() == [2649, 0, 0]
+
+def test_float_arrays_are_invalid():
+    assert_matches_scalar(np.array([10.0, math.nan, math.inf]), np.array([0.0, 0.0, math.nan]))
+    assert not calculate_telecom_fee_batch([10.0], [0])['valid'].any()
+
+def test_half_cent_rounds_up():
+    assert calculate_telecom_fee(10, 0)['total_fee'] == 26.49
+    assert calculate_telecom_fee(50, 1)['final_call_fee'] == 7.43
+    assert calculate_telecom_fee_cents_batch([10, 50], [0, 1])['final_call_fee_cents'].tolist() == [149, 743]
@@ -0,0 +1,45 @@
+"""triangle_type_batch 与逐个调用 triangle_type 的结果一致性。"""
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from triangle import decode_triangle_types, triangle_type, triangle_type_batch
+
+def assert_matches_scalar(a, b, c):
+    a, b, c = np.asarray(a), np.asarray(b), np.asarray(c)
+    expected = [triangle_type(*sides) for sides in zip(a.tolist(), b.tolist(), c.tolist())]
+    assert decode_triangle_types(triangle_type_batch(a, b, c)) == expected
+
+def side_grid(values, dtype):
+    grid = np.array(list(itertools.product(values, repeat=3)), dtype=dtype)
+    return grid[:, 0], grid[:, 1], grid[:, 2]
+
+@pytest.mark.parametrize('dtype, values', [
+    (np.int8, [-128, -1, 0, 1, 2, 64, 100, 127]),
+    (np.int16, [-32768, -1, 0, 1, 16384, 32767]),
+    (np.uint8, [0, 1, 2, 128, 200, 255]),
+    (np.uint64, [0, 1, 2 ** 63, 2 ** 64 - 1]),
+    (bool, [False, True]),
+])
+def test_integer_dtypes(dtype, values):
+    assert_matches_scalar(*side_grid(values, dtype))
+
+def test_int64_limits():
+    limit = np.iinfo(np.int64).max
+    assert_matches_scalar(*side_grid([1, limit // 2, limit // 2 + 1, limit - 1, limit], np.int64))
+
+def test_python_ints_beyond_int64():
+    huge = 2 ** 70
+    assert_matches_scalar(
+        [huge, huge, huge, 3, -huge, huge],
+        [huge, huge, 1, 4, 1, huge + 1],
+        [huge, 1, 1, 5, 1, 2 * huge + 1],
+    )
+
+def test_nan_and_inf():
+    assert_matches_scalar(*side_grid([math.nan, -math.inf, -1.0, 0.0, 1.0, 2.5, math.inf], np.float64))
+
+def test_float32_is_widened():
+    assert_matches_scalar(*side_grid([0.1, 0.2, 0.3, 3e38, 3.4e38], np.float32))
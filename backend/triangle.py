@@ -1,3 +1,21 @@
+import numpy as np
+
+# triangle_type_batch 返回的结果编码
+NOT_TRIANGLE = 0
+SCALENE = 1
+ISOSCELES = 2
+EQUILATERAL = 3
+
+TRIANGLE_TYPE_NAMES = {
+    NOT_TRIANGLE: '非三角形',
+    SCALENE: '一般三角形',
+    ISOSCELES: '等腰三角形',
+    EQUILATERAL: '等边三角形',
+}
+
+# 两条边相加不超过 int64 上限的最大边长
+MAX_INT64_SIDE = np.iinfo(np.int64).max // 2
+
 def is_triangle(a, b, c):
     """
     判断三边是否能构成三角形
@@ -29,6 +47,52 @@ def triangle_type(a, b, c):
     # 其他情况为一般三角形
     return '一般三角形'
 
+def _as_sides(values):
+    """
+    把边长转换为足够宽的数组，保证两边相加不溢出：整数（含 bool）扩展为 int64，
+    可能超过 MAX_INT64_SIDE 的整数改用 Python 整数（object 数组）精确计算，浮点数扩展为 float64。
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'biu':
+        if values.size and (values.max() > MAX_INT64_SIDE or values.min() < -MAX_INT64_SIDE):
+            return values.astype(object)
+        return values.astype(np.int64)
+    if values.dtype.kind == 'f':
+        return values.astype(np.float64)
+    return values
+
+def triangle_type_batch(a, b, c):
+    """
+    批量判断三角形类型（triangle_type 的向量化版本）
+    a、b、c 为等长的数组（或可广播的标量），返回 int8 编码数组，
+    编码含义见 TRIANGLE_TYPE_NAMES，可用 decode_triangle_types 还原为字符串
+    """
+    a = _as_sides(a)
+    b = _as_sides(b)
+    c = _as_sides(c)
+
+    # 与标量版本相同的判断顺序：正数 -> 三角不等式 -> 等边 -> 等腰
+    valid = (a > 0) & (b > 0) & (c > 0)
+    # inf + (-inf) 得到 NaN，比较结果为 False，与标量版本一致，无需警告
+    with np.errstate(invalid='ignore'):
+        valid &= (a + b > c) & (b + c > a) & (a + c > b)
+
+    ab = a == b
+    bc = b == c
+    ac = a == c
+
+    codes = np.full(np.broadcast(a, b, c).shape, SCALENE, dtype=np.int8)
+    codes[ab | bc | ac] = ISOSCELES
+    codes[ab & bc] = EQUILATERAL
+    codes[~valid] = NOT_TRIANGLE
+    return codes
+
+def decode_triangle_types(codes):
+    """
+    将 triangle_type_batch 的编码数组转换为字符串列表
+    """
+    return [TRIANGLE_TYPE_NAMES[code] for code in np.asarray(codes).tolist()]
+
 def main():
     # 测试用例
     test_cases = [
@@ -0,0 +1,53 @@
+"""三角形判定接口。"""
+from flask import jsonify, request
+
+from metrics import business_timer
+from triangle import decode_triangle_types, triangle_type, triangle_type_batch
+from view_helpers import bulk_response, cached_runner_response
+
+def run_triangle_tests():
+    test_type = request.args.get('type', 'bva')
+    suite = 'triangle_bva' if test_type == 'bva' else 'triangle_equivalence'
+    return cached_runner_response(suite, triangle_type, run_triangle_case)
+
+def run_triangle_case(case):
+    a, b, c = case['a'], case['b'], case['c']
+    actual_result = triangle_type(a, b, c)
+    row = {
+        "id": case['id'], "a": a, "b": b, "c": c,
+        "description": case['description'], "expected": case['expected'],
+        "output_type": actual_result
+    }
+    return row, actual_result == case['expected']
+
+def parse_triangle_input(data):
+    """Returns ((a, b, c), None) for a valid custom input, or (None, error message)."""
+    if not data or not isinstance(data, dict):
+        return None, '无效的请求体'
+    try:
+        a = float(data.get('a', 0))
+        b = float(data.get('b', 0))
+        c = float(data.get('c', 0))
+    except (ValueError, TypeError, OverflowError):
+        return None, '输入必须是数字'
+    return (a, b, c), None
+
+def compute_triangle_outputs(inputs):
+    a, b, c = zip(*inputs)
+    output_types = decode_triangle_types(triangle_type_batch(a, b, c))
+    return [
+        {'a': a, 'b': b, 'c': c, 'output_type': output_type}
+        for (a, b, c), output_type in zip(inputs, output_types)
+    ]
+
+def run_triangle_custom():
+    inputs, error = parse_triangle_input(request.get_json())
+    if error:
+        return jsonify({'error': error}), 400
+    a, b, c = inputs
+    with business_timer():
+        result = triangle_type(a, b, c)
+    return jsonify({ 'a': a, 'b': b, 'c': c, 'output_type': result })
+
+def run_triangle_custom_bulk():
+    return bulk_response(parse_triangle_input, compute_triangle_outputs)
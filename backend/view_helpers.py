@@ -0,0 +1,190 @@
+"""
+各接口模块共用的辅助函数：批量输入（JSON 数组或 NDJSON）的处理，以及用例集的执行、结果缓存与编码。
+"""
+import json
+import os
+from itertools import islice
+
+from flask import Response, jsonify, request, stream_with_context
+
+from json_encoding import COLUMNS_LAYOUT, JSON_BACKEND, LAYOUTS, ROWS_LAYOUT, dumps, to_columns
+from metrics import business_timer, encode_timer
+from profiling import PROFILE_ENVIRON_KEY
+from response_cache import DEFAULT_MAX_ENTRIES, ResponseCache, make_etag, source_digest
+from suite_registry import SuiteRegistry, iter_cases
+
+# ====================================================================
+# Bulk Input Helpers
+# ====================================================================
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+BULK_CHUNK_SIZE = 1000
+
+def _iter_ndjson_items(stream):
+    """Yields one decoded item per non-empty NDJSON line; malformed lines yield None."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+def _is_error_output(output):
+    return 'error' in output or output.get('status') == 'error'
+
+def run_bulk(items, parse_input, compute):
+    """
+    Validates every item with parse_input, then computes all valid inputs in a
+    single compute call. Returns one output per item, in order; invalid items
+    get {'error': message} in their slot.
+    """
+    outputs = [None] * len(items)
+    valid_indexes = []
+    valid_inputs = []
+    for index, item in enumerate(items):
+        inputs, error = parse_input(item)
+        if error:
+            outputs[index] = {'error': error}
+        else:
+            valid_indexes.append(index)
+            valid_inputs.append(inputs)
+    if valid_inputs:
+        with business_timer():
+            computed = compute(valid_inputs)
+        for index, output in zip(valid_indexes, computed):
+            outputs[index] = output
+    return outputs
+
+def bulk_response(parse_input, compute):
+    """
+    Handles a bulk request body. A JSON array (or {"items": [...]}) returns a
+    single JSON document; an NDJSON body is processed in chunks of
+    BULK_CHUNK_SIZE and streamed back as NDJSON, ending with a summary line.
+    """
+    if request.mimetype == NDJSON_MIMETYPE:
+        def generate():
+            total_count = error_count = 0
+            items = _iter_ndjson_items(request.stream)
+            while True:
+                chunk = list(islice(items, BULK_CHUNK_SIZE))
+                if not chunk:
+                    break
+                for output in run_bulk(chunk, parse_input, compute):
+                    total_count += 1
+                    error_count += _is_error_output(output)
+                    with encode_timer():
+                        line = json.dumps(output, ensure_ascii=False) + '\n'
+                    yield line
+            summary = {'totalCount': total_count, 'errorCount': error_count}
+            yield json.dumps({'summary': summary}) + '\n'
+        return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+    items = request.get_json(silent=True)
+    if isinstance(items, dict):
+        items = items.get('items')
+    if not isinstance(items, list):
+        return jsonify({'error': '请求体必须是输入数组'}), 400
+    results = run_bulk(items, parse_input, compute)
+    summary = {
+        'totalCount': len(results),
+        'errorCount': sum(_is_error_output(output) for output in results),
+    }
+    return jsonify({'results': results, 'summary': summary})
+
+# ====================================================================
+# Test Runner Helpers
+# ====================================================================
+
+# Test suites are loaded from backend/suites and reloaded when the files change
+suite_registry = SuiteRegistry()
+# Serialized runner results, bounded by RUNNER_CACHE_SIZE entries (least recently used are evicted)
+runner_cache = ResponseCache(int(os.environ.get('RUNNER_CACHE_SIZE', DEFAULT_MAX_ENTRIES)))
+
+def make_summary(pass_count, total_count, with_pass_rate=True):
+    summary = { "passCount": pass_count, "totalCount": total_count }
+    if with_pass_rate:
+        summary["passRate"] = round((pass_count / total_count) * 100 if total_count > 0 else 0, 2)
+    return summary
+
+def runner_response(cases, run_case, with_pass_rate=True):
+    """
+    Runs every case through run_case, which returns (result_row, passed).
+    With ?stream=1 each row is written as an NDJSON line as soon as it is
+    computed, followed by a summary line, so memory does not grow with the
+    suite size; otherwise the rows are collected into one JSON document.
+    With ?layout=columns the collected results are sent column-wise
+    ({"id": [...], "expected": [...], ...}) instead of as a list of rows.
+    """
+    layout = request.args.get('layout', ROWS_LAYOUT)
+    if layout not in LAYOUTS:
+        return jsonify({'error': f"layout 必须是 {' 或 '.join(LAYOUTS)}"}), 400
+
+    if request.args.get('stream') == '1':
+        def generate():
+            pass_count = total_count = 0
+            for case in cases:
+                with business_timer():
+                    row, passed = run_case(case)
+                pass_count += passed
+                total_count += 1
+                with encode_timer():
+                    line = dumps(row) + b'\n'
+                yield line
+            summary = make_summary(pass_count, total_count, with_pass_rate)
+            yield dumps({'summary': summary}) + b'\n'
+        return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+    results = []
+    pass_count = 0
+    with business_timer():
+        for case in cases:
+            row, passed = run_case(case)
+            pass_count += passed
+            results.append(row)
+    with encode_timer():
+        body = dumps({
+            "results": to_columns(results) if layout == COLUMNS_LAYOUT else results,
+            "summary": make_summary(pass_count, len(results), with_pass_rate)
+        })
+    return Response(body, mimetype='application/json')
+
+def cached_runner_response(suite_name, tested_function, run_case, with_pass_rate=True, dependencies=()):
+    """
+    runner_response for a registered suite, with the JSON body cached and tagged.
+    The ETag is derived from the suite file content, the source of both the
+    module under test and run_case, the source of any helper modules listed in
+    dependencies (e.g. money for amounts compared in cents), the source of the
+    modules that build the body (this one, json_encoding and suite_registry)
+    and the response encoding, so an unchanged run is answered with 304 (on
+    If-None-Match) or from the cache without executing any case. Streaming
+    (?stream=1) and profiled requests bypass the cache.
+    """
+    suite = suite_registry.get(suite_name)
+    layout = request.args.get('layout', ROWS_LAYOUT)
+    if request.args.get('stream') == '1' or layout not in LAYOUTS or PROFILE_ENVIRON_KEY in request.environ:
+        return runner_response(iter_cases(suite), run_case, with_pass_rate)
+
+    etag = make_etag(
+        suite.digest, source_digest(tested_function), source_digest(run_case),
+        *(source_digest(dependency) for dependency in dependencies),
+        source_digest(runner_response), source_digest(to_columns), source_digest(iter_cases),
+        run_case.__name__, str(with_pass_rate), JSON_BACKEND, layout,
+    )
+    if request.if_none_match.contains(etag):
+        runner_cache.record_not_modified()
+        response = Response(status=304)
+    else:
+        body = runner_cache.get(etag)
+        if body is None:
+            body = runner_response(iter_cases(suite), run_case, with_pass_rate).get_data()
+            runner_cache.put(etag, body)
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    # Let browsers keep the body but revalidate it on every dashboard refresh
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def get_runner_cache_stats():
+    return jsonify(runner_cache.stats())